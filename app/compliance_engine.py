@@ -3,6 +3,7 @@ Compliance checking engine that evaluates regulations based on airport variables
 """
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
+import hashlib
 import json
 from datetime import datetime, date, timedelta
 from app.models import (
@@ -11,6 +12,26 @@ from app.models import (
 )
 
 
+# Campos do aeroporto que mudam a aplicabilidade das normas ou os itens de ação gerados
+APPLICABILITY_FIELDS = (
+    "usage_class", "size", "annual_passengers", "avsec_classification", "number_of_runways",
+    "max_aircraft_weight", "airport_type", "has_international_operations", "has_cargo_operations",
+    "has_maintenance_facility",
+)
+
+# Marca nas notas dos registros retirados por reconcile_airports (permite restaurar depois)
+RETIRED_NOTE = "Norma deixou de se aplicar após alteração do aeroporto"
+
+# Perfis (porte, classe de uso) usados em template_fingerprint
+TEMPLATE_PROFILES = (
+    (AirportSize.SMALL, "PRIVADO"),
+    (AirportSize.SMALL, "I"),
+    (AirportSize.MEDIUM, "II"),
+    (AirportSize.LARGE, "III"),
+    (AirportSize.INTERNATIONAL, "IV"),
+)
+
+
 class ComplianceEngine:
     """Engine for checking airport compliance with ANAC regulations."""
     
@@ -300,6 +321,93 @@ class ComplianceEngine:
             "anac_scores": compliance_scores
         }
     
+    def reconcile_airports(
+        self,
+        airport_ids: List[int],
+        regulation_ids: Optional[List[int]] = None,
+        regenerate_action_items: bool = False,
+        reason: str = "",
+    ) -> dict:
+        """
+        Recalcula a aplicabilidade só para os aeroportos informados (ex.: alterados pela
+        sincronização ANAC), em lote, e ajusta os registros de conformidade:
+          - norma passou a se aplicar: cria o registro (pending_review, com itens de ação)
+          - norma deixou de se aplicar: marca not_applicable, guardando o status anterior em retired_status
+          - norma voltou a se aplicar a um registro retirado por aqui: volta ao status guardado
+        Um not_applicable definido manualmente (retired_status vazio) nunca é revertido.
+        Só aeroportos que já têm registros (acompanhados no sistema) são considerados.
+        regenerate_action_items regera os itens de ação de registros pendentes sem itens concluídos.
+        """
+        summary = {"airports": 0, "created": 0, "retired": 0, "restored": 0, "action_items_regenerated": 0}
+        if not airport_ids:
+            return summary
+        records_query = self.db.query(ComplianceRecord).filter(ComplianceRecord.airport_id.in_(airport_ids))
+        regulations_query = self.db.query(Regulation)
+        if regulation_ids is not None:
+            records_query = records_query.filter(ComplianceRecord.regulation_id.in_(regulation_ids))
+            regulations_query = regulations_query.filter(Regulation.id.in_(regulation_ids))
+        records: Dict[int, Dict[int, ComplianceRecord]] = {}
+        for record in records_query:
+            records.setdefault(record.airport_id, {})[record.regulation_id] = record
+        tracked = set(records)
+        if regulation_ids is not None:
+            # Registros filtrados pelas normas: aeroportos acompanhados vêm de qualquer registro
+            tracked = {
+                airport_id for (airport_id,) in
+                self.db.query(ComplianceRecord.airport_id).filter(ComplianceRecord.airport_id.in_(airport_ids)).distinct()
+            }
+        if not tracked:
+            return summary
+        regulations = regulations_query.all()
+        airports = self.db.query(Airport).filter(Airport.id.in_(list(tracked))).all()
+        today = date.today().isoformat()
+        suffix = f" ({reason})" if reason else ""
+        note = f"[{today}] {RETIRED_NOTE}{suffix}"
+
+        new_records = []
+        for airport in airports:
+            existing = records.get(airport.id, {})
+            summary["airports"] += 1
+            for regulation in regulations:
+                record = existing.get(regulation.id)
+                applies = self.regulation_applies_to_airport(regulation, airport)
+                if applies and record is None:
+                    action_items = self._generate_action_items(regulation, airport)
+                    new_records.append({
+                        "airport_id": airport.id,
+                        "regulation_id": regulation.id,
+                        "status": ComplianceStatus.PENDING_REVIEW,
+                        "action_items": json.dumps(action_items) if action_items else None,
+                    })
+                elif not applies and record is not None and record.status != ComplianceStatus.NOT_APPLICABLE:
+                    previous = record.status.value if hasattr(record.status, "value") else str(record.status)
+                    record.notes = "\n".join(filter(None, [record.notes, f"{note}; status anterior: {previous}"]))
+                    record.status = ComplianceStatus.NOT_APPLICABLE
+                    record.retired_status = previous
+                    summary["retired"] += 1
+                elif applies and record is not None:
+                    if record.status == ComplianceStatus.NOT_APPLICABLE and record.retired_status:
+                        record.status = ComplianceStatus(record.retired_status)
+                        record.notes = "\n".join(filter(None, [
+                            record.notes,
+                            f"[{today}] Norma voltou a se aplicar{suffix}; status restaurado: {record.retired_status}",
+                        ]))
+                        record.retired_status = None
+                        summary["restored"] += 1
+                    if (
+                        regenerate_action_items
+                        and record.status in (ComplianceStatus.PENDING_REVIEW, ComplianceStatus.NON_COMPLIANT)
+                        and not record.completed_action_items
+                    ):
+                        action_items = self._generate_action_items(regulation, airport)
+                        record.action_items = json.dumps(action_items) if action_items else None
+                        summary["action_items_regenerated"] += 1
+        if new_records:
+            self.db.bulk_insert_mappings(ComplianceRecord, new_records)
+            summary["created"] = len(new_records)
+        self.db.commit()
+        return summary
+
     def _calculate_anac_scores(self, records: List[ComplianceRecord], regulations: List[Regulation]) -> dict:
         """
         Calculate ANAC compliance scores based on D/C/B/A classification system.
@@ -466,6 +574,19 @@ class ComplianceEngine:
         
         return recommendations
     
+    def template_fingerprint(self, regulation: Regulation) -> str:
+        """
+        Hash dos itens de ação que _generate_action_items produz para a norma em perfis
+        representativos (uma classe de uso por porte). Muda quando o texto da norma ou os
+        modelos de itens de ação no código mudam.
+        """
+        generated = [
+            self._generate_action_items(regulation, Airport(size=size, usage_class=usage_class))
+            for size, usage_class in TEMPLATE_PROFILES
+        ]
+        payload = json.dumps(generated, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def _generate_action_items(self, regulation: Regulation, airport: Airport) -> List[str]:
         """
         Generate actionable items based on regulation requirements and airport characteristics.
@@ -1033,6 +1154,8 @@ class ComplianceEngine:
         
         if status is not None:
             record.status = status
+            # Status definido pelo usuário prevalece sobre a retirada automática
+            record.retired_status = None
         if notes is not None:
             record.notes = notes
         if custom_fields is not None:
@@ -4,8 +4,8 @@ FastAPI application for airport compliance management.
 from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response, JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, RedirectResponse, Response, JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 from typing import List, Optional
 from datetime import datetime
 import uvicorn
@@ -21,6 +21,7 @@ from app import schemas
 from app.compliance_engine import ComplianceEngine
 from app.models import Airport, ANACAirport, Regulation, ComplianceRecord, DocumentAttachment, AirportSize, AirportType, SafetyCategory, RequirementClassification, EvaluationType, ComplianceStatus
 from app.services.anac_sync import ANACSyncService
+from app.services.startup import startup_state
 
 app = FastAPI(
     title="ANAC Airport Compliance System",
@@ -147,21 +148,85 @@ async def auth_middleware(request: Request, call_next):
     )
 
 
+@app.middleware("http")
+async def readiness_gate(request: Request, call_next):
+    """Rotas /api/ esperam o fim do startup em background (seed, backfills) antes de responder."""
+    path = request.url.path
+    if startup_state.ready or not path.startswith("/api/") or path.startswith("/api/health") or path == "/api/login":
+        return await call_next(request)
+    if not await startup_state.wait():
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Aplicação inicializando. Tente novamente em instantes."},
+            headers={"Retry-After": "5"},
+        )
+    return await call_next(request)
+
+
 # Mount static files
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+# Colunas adicionadas por _run_schema_migration: tabela → [(coluna, tipo SQL)]
+SCHEMA_MIGRATIONS = {
+    "airports": [
+        ("category", "VARCHAR(10)"),
+        ("reference_code", "VARCHAR(10)"),
+        ("data_sincronizacao_anac", "TIMESTAMP"),
+        ("origem_dados", "VARCHAR(20) DEFAULT 'manual'"),
+        ("versao_dados_anac", "VARCHAR(50)"),
+        ("codigo_iata", "VARCHAR(3)"),
+        ("latitude", "DOUBLE PRECISION"),
+        ("longitude", "DOUBLE PRECISION"),
+        ("cidade", "VARCHAR(100)"),
+        ("estado", "VARCHAR(2)"),
+        ("status_operacional", "VARCHAR(50)"),
+        ("usage_class", "VARCHAR(20)"),
+        ("avsec_classification", "VARCHAR(10)"),
+        ("aircraft_size_category", "VARCHAR(5)"),
+        ("fire_category", "INTEGER"),
+    ],
+    "regulations": [
+        ("requirement_classification", "VARCHAR(5)"),
+        ("evaluation_type", "VARCHAR(10)"),
+        ("weight", "INTEGER"),
+        ("anac_reference", "VARCHAR(200)"),
+        ("expected_performance", "TEXT"),
+        ("content_hash", "VARCHAR(64)"),
+        ("template_hash", "VARCHAR(64)"),
+    ],
+    "compliance_records": [
+        ("docs_score", "INTEGER"),
+        ("tops_score", "INTEGER"),
+        ("weighted_score", "INTEGER"),
+        ("is_essential_compliant", "BOOLEAN"),
+        ("action_items", "TEXT"),
+        ("completed_action_items", "TEXT"),
+        ("action_item_due_dates", "TEXT"),
+        ("custom_fields", "TEXT"),
+        ("retired_status", "VARCHAR(30)"),
+    ],
+    "document_attachments": [
+        ("sha256", "VARCHAR(64)"),
+    ],
+}
+
+# Colunas de enriquecimento de anac_airports (_run_anac_enrichment_migration)
+ANAC_ENRICHMENT_COLUMNS = [
+    ("usage_class", "VARCHAR(20)"), ("avsec_classification", "VARCHAR(10)"),
+    ("aircraft_size_category", "VARCHAR(5)"), ("number_of_runways", "INTEGER DEFAULT 1"),
+]
+
+
 def _run_anac_enrichment_migration():
     """Adiciona colunas de enriquecimento em anac_airports se não existirem."""
     try:
         from sqlalchemy import text
         from app.database import engine
-        cols = [("usage_class", "VARCHAR(20)"), ("avsec_classification", "VARCHAR(10)"),
-                ("aircraft_size_category", "VARCHAR(5)"), ("number_of_runways", "INTEGER DEFAULT 1")]
         with engine.connect() as conn:
-            for col_name, col_type in cols:
+            for col_name, col_type in ANAC_ENRICHMENT_COLUMNS:
                 try:
                     conn.execute(text(f"ALTER TABLE anac_airports ADD COLUMN {col_name} {col_type}"))
                     conn.commit()
@@ -225,48 +290,10 @@ def _run_schema_migration():
     from sqlalchemy import text, inspect
     from app.database import engine
 
-    # Mapeia: tabela → [(coluna, tipo SQL)]
-    migrations = {
-        "airports": [
-            ("category", "VARCHAR(10)"),
-            ("reference_code", "VARCHAR(10)"),
-            ("data_sincronizacao_anac", "TIMESTAMP"),
-            ("origem_dados", "VARCHAR(20) DEFAULT 'manual'"),
-            ("versao_dados_anac", "VARCHAR(50)"),
-            ("codigo_iata", "VARCHAR(3)"),
-            ("latitude", "DOUBLE PRECISION"),
-            ("longitude", "DOUBLE PRECISION"),
-            ("cidade", "VARCHAR(100)"),
-            ("estado", "VARCHAR(2)"),
-            ("status_operacional", "VARCHAR(50)"),
-            ("usage_class", "VARCHAR(20)"),
-            ("avsec_classification", "VARCHAR(10)"),
-            ("aircraft_size_category", "VARCHAR(5)"),
-            ("fire_category", "INTEGER"),
-        ],
-        "regulations": [
-            ("requirement_classification", "VARCHAR(5)"),
-            ("evaluation_type", "VARCHAR(10)"),
-            ("weight", "INTEGER"),
-            ("anac_reference", "VARCHAR(200)"),
-            ("expected_performance", "TEXT"),
-        ],
-        "compliance_records": [
-            ("docs_score", "INTEGER"),
-            ("tops_score", "INTEGER"),
-            ("weighted_score", "INTEGER"),
-            ("is_essential_compliant", "BOOLEAN"),
-            ("action_items", "TEXT"),
-            ("completed_action_items", "TEXT"),
-            ("action_item_due_dates", "TEXT"),
-            ("custom_fields", "TEXT"),
-        ],
-    }
-
     try:
         insp = inspect(engine)
         with engine.connect() as conn:
-            for table, columns in migrations.items():
+            for table, columns in SCHEMA_MIGRATIONS.items():
                 if not insp.has_table(table):
                     continue
                 existing = {c["name"] for c in insp.get_columns(table)}
@@ -322,42 +349,128 @@ def _backfill_usage_class():
 
 def _populate_anac_airports_background():
     """Popula anac_airports com ~6800 aeródromos da ANAC (ou bootstrap se offline)."""
+    from app.services.leader import lease
     try:
-        from app.seed_data import seed_anac_airports_full
-        count = seed_anac_airports_full()
-        print(f"✓ anac_airports pré-populado: {count} aeródromos (lookup disponível offline)")
+        # Um worker só: os demais seguem servindo (sem N downloads e N escritores concorrentes)
+        with lease("anac_populate") as leader:
+            if not leader:
+                print("anac_airports: carga completa já em andamento em outro worker")
+                return
+            from app.seed_data import seed_anac_airports_full
+            count = seed_anac_airports_full()
+            print(f"✓ anac_airports pré-populado: {count} aeródromos (lookup disponível offline)")
     except Exception as e:
         print(f"⚠ Erro ao pré-popular anac_airports: {e}")
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup."""
-    import asyncio
+def _migrate_schema():
+    """Tabelas novas, valores de enum e colunas adicionadas depois da criação das tabelas."""
     init_db()
     _run_enum_migration()
     _run_schema_migration()
     _run_anac_enrichment_migration()
-    _backfill_usage_class()
-    # Seed/atualizar regulações automaticamente no startup
-    from app.seed_data import seed_regulations
-    seed_regulations(update_existing=True)
-    # Pré-popular anac_airports se vazio: lookup funciona mesmo com eAIS offline
-    if not os.getenv("SKIP_ANAC_STARTUP_SYNC"):
-        from app.database import SessionLocal
-        from app.seed_data import seed_anac_airports_bootstrap
-        db = SessionLocal()
-        try:
-            count = db.query(ANACAirport).count()
-        except Exception:
-            count = 0
-        finally:
-            db.close()
-        if count < 50:
-            # Bootstrap imediato (27 principais) para lookup funcionar já no primeiro acesso
-            seed_anac_airports_bootstrap()
-            # Sincronização completa em background (~6800 aeródromos da ANAC)
-            asyncio.create_task(asyncio.to_thread(_populate_anac_airports_background))
+
+
+def _schema_version() -> str:
+    from app.models import Base
+    from app.services.startup import schema_fingerprint
+    enums = {e.__name__: [v.value for v in e] for e in (SafetyCategory, RequirementClassification, EvaluationType, ComplianceStatus)}
+    return schema_fingerprint(Base.metadata, SCHEMA_MIGRATIONS, ANAC_ENRICHMENT_COLUMNS, enums)
+
+
+def _run_startup_steps(engine, steps):
+    """
+    Roda as etapas [(chave, hash, fn)] sob o lease "startup": o primeiro worker aplica, os
+    demais esperam e, relendo schema_meta, pulam. Sem etapa pendente, nem pega o lease.
+    """
+    from app.services.leader import lease
+    if all(startup_state.is_current(key, value) for key, value, _ in steps):
+        for key, value, fn in steps:
+            startup_state.run_step(engine, key, value, fn)
+        return
+    with lease("startup", blocking=True, engine=engine):
+        startup_state.load_meta(engine)
+        for key, value, fn in steps:
+            startup_state.run_step(engine, key, value, fn)
+
+
+def _anac_airports_count() -> int:
+    from app.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return db.query(ANACAirport).count()
+    except Exception:
+        return 0
+    finally:
+        db.close()
+
+
+def _warm_regulation_search():
+    """Monta o índice de busca do catálogo de normas neste worker (a primeira busca não espera)."""
+    from app.database import SessionLocal
+    from app.services.regulation_search import search_index
+    db = SessionLocal()
+    try:
+        search_index.refresh(db)
+    except Exception as e:
+        print(f"⚠ índice de busca de normas: {e}")
+    finally:
+        db.close()
+
+
+def _finish_startup(schema_version: str):
+    """Etapas não críticas do startup (em background); libera o portão de prontidão ao final."""
+    from app.database import engine
+    from app.seed_data import regulation_catalog, seed_regulations, seed_anac_airports_bootstrap
+    from app.services.airport_search import AIRPORT_SEARCH_PG_TRGM, ensure_pg_trgm
+    from app.services.document_search import DOCUMENT_SEARCH_PG_CONFIG, ensure_search_index
+    from app.services.leader import lease
+    from app.services.regulation_catalog import catalog_fingerprint
+    from app.services.startup import fingerprint
+    populate = False
+    try:
+        _run_startup_steps(engine, [
+            # Backfill só é necessário depois de migrações (coluna usage_class nova)
+            ("usage_class_backfill", schema_version, _backfill_usage_class),
+            ("pg_trgm", fingerprint(schema_version, AIRPORT_SEARCH_PG_TRGM), lambda: ensure_pg_trgm(engine)),
+            ("document_search", fingerprint(schema_version, DOCUMENT_SEARCH_PG_CONFIG), lambda: ensure_search_index(engine)),
+            # Seed/atualização das regulações só quando o catálogo (ou os templates) mudou
+            ("regulation_catalog", catalog_fingerprint(regulation_catalog()), lambda: seed_regulations(update_existing=True)),
+        ])
+        _warm_regulation_search()
+        # Pré-popular anac_airports se vazio: lookup funciona mesmo com eAIS offline
+        if not os.getenv("SKIP_ANAC_STARTUP_SYNC") and _anac_airports_count() < 50:
+            with lease("startup", blocking=True, engine=engine):
+                if _anac_airports_count() < 50:
+                    # Bootstrap imediato (27 principais) para lookup funcionar já no primeiro acesso
+                    seed_anac_airports_bootstrap()
+            populate = True
+    except Exception as e:
+        print(f"⚠ Erro no startup: {e}")
+    finally:
+        startup_state.mark_ready()
+        print(f"✓ Startup concluído em {startup_state.ready_after}s: {startup_state.snapshot()['steps']}")
+    if populate:
+        # Sincronização completa (~6800 aeródromos da ANAC), fora do portão de prontidão
+        _populate_anac_airports_background()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    Initialize database on startup. Etapas cujo hash gravado em schema_meta não mudou são
+    puladas; só o schema roda antes de servir, o resto em background atrás do portão de
+    prontidão (app/services/startup.py). Com vários workers, só um aplica cada etapa
+    (app/services/leader.py).
+    """
+    import asyncio
+    from app.database import engine
+    schema_version = _schema_version()
+    startup_state.load_meta(engine)
+    _run_startup_steps(engine, [("schema", schema_version, _migrate_schema)])
+    asyncio.create_task(asyncio.to_thread(_finish_startup, schema_version))
+    from app.services.uploads_gc import start_periodic_gc
+    start_periodic_gc(UPLOADS_DIR, storage=_storage())
 
 
 @app.post("/api/login")
@@ -487,6 +600,85 @@ async def list_airports(skip: int = 0, limit: int = 100, db: Session = Depends(g
     return airports
 
 
+# ANAC / anac_airports search for cadastro autocomplete
+# Declarada antes de /api/airports/{airport_id}: senão "search" cai na rota do id (422)
+@app.get("/api/airports/search")
+async def search_anac_airports(
+    q: str = "",
+    limit: int = 20,
+    db: Session = Depends(get_db)
+):
+    """
+    Busca aeródromos na base ANAC por código ICAO/IATA, nome ou cidade (sem acento).
+    Usado para autocomplete no cadastro (ex: ?q=SBG retorna SBGR, SBGL...; ?q=sao retorna São Paulo).
+    """
+    from app.services.airport_search import search_airports
+    return search_airports(db, q, limit=max(1, min(limit, 50)))
+
+
+# Proximidade / regiões (índice espacial em memória sobre anac_airports)
+@app.get("/api/airports/nearby")
+async def nearby_airports(
+    lat: float,
+    lon: float,
+    radius_km: float = 100,
+    k: int = 10,
+    db: Session = Depends(get_db)
+):
+    """
+    Aeródromos ANAC mais próximos do ponto (até k, dentro de radius_km), do mais perto ao mais longe.
+    airport_id vem preenchido quando o aeródromo já está cadastrado.
+    """
+    from app.services.airport_geo import geo_index
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Coordenadas inválidas")
+    if radius_km <= 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="radius_km deve ser positivo")
+    geo_index.ensure_fresh(db)
+    results = geo_index.nearby(lat, lon, k=max(1, min(k, 100)), radius_km=min(radius_km, 5000))
+    registered = dict(
+        db.query(Airport.code, Airport.id).filter(Airport.code.in_([r["code"] for r in results]))
+    ) if results else {}
+    for r in results:
+        r["airport_id"] = registered.get(r["code"])
+    return results
+
+
+@app.get("/api/airports/regions")
+async def airports_by_region(db: Session = Depends(get_db)):
+    """
+    Aeroportos cadastrados agrupados por região (Norte, Nordeste, Centro-Oeste, Sudeste, Sul),
+    com a contagem de requisitos por status de conformidade de cada região.
+    """
+    from sqlalchemy import func
+    from app.services.airport_geo import geo_index, group_by_region
+    airports = db.query(Airport).order_by(Airport.code).all()
+    if any(not a.estado and a.latitude is not None for a in airports):
+        geo_index.ensure_fresh(db)
+    status_counts = {}
+    for airport_id, record_status, count in (
+        db.query(ComplianceRecord.airport_id, ComplianceRecord.status, func.count(ComplianceRecord.id))
+        .group_by(ComplianceRecord.airport_id, ComplianceRecord.status)
+    ):
+        status_counts.setdefault(airport_id, {})[record_status.value] = count
+    response = []
+    for region, members in sorted(group_by_region(airports).items()):
+        compliance = {}
+        for a in members:
+            for key, count in status_counts.get(a.id, {}).items():
+                compliance[key] = compliance.get(key, 0) + count
+        response.append({
+            "region": region,
+            "count": len(members),
+            "airports": [
+                {"id": a.id, "code": a.code, "name": a.name, "cidade": a.cidade, "estado": a.estado}
+                for a in members
+            ],
+            "compliance": compliance,
+        })
+    return response
+
+
 @app.get("/api/airports/{airport_id}", response_model=schemas.AirportResponse)
 async def get_airport(airport_id: int, db: Session = Depends(get_db)):
     """Get a specific airport by ID."""
@@ -571,6 +763,51 @@ async def update_airport(
     return airport
 
 
+@app.get("/api/airports/{airport_id}/documents", response_model=schemas.AirportDocumentsResponse)
+def list_airport_documents(airport_id: int, summary: bool = False, db: Session = Depends(get_db)):
+    """
+    Todos os anexos do aeroporto agrupados por registro de conformidade, numa consulta (a
+    página de conformidade não faz uma requisição por registro). summary=true retorna só a
+    contagem e o último upload de cada registro.
+    """
+    from app.services.document_listing import airport_documents, document_summary
+
+    if not db.query(Airport.id).filter(Airport.id == airport_id).first():
+        raise HTTPException(status_code=404, detail="Airport not found")
+    if summary:
+        records = document_summary(db, airport_id)
+    else:
+        records = airport_documents(db, airport_id)
+        for group in records:
+            group["documents"] = [_document_response(doc) for doc in group["documents"]]
+    return {
+        "airport_id": airport_id,
+        "document_count": sum(group["document_count"] for group in records),
+        "records": records,
+    }
+
+
+@app.get("/api/airports/{airport_id}/evidence.zip")
+def airport_evidence_zip(airport_id: int, db: Session = Depends(get_db)):
+    """
+    Pacote de evidências do aeroporto: todos os anexos agrupados por norma
+    (<código>/<arquivo>) e manifest.json com códigos e status. ZIP gerado em streaming.
+    """
+    from app.services.evidence_bundle import collect_evidence, stream_zip
+
+    airport = db.query(Airport).filter(Airport.id == airport_id).first()
+    if not airport:
+        raise HTTPException(status_code=404, detail="Airport not found")
+    manifest = collect_evidence(db, airport)
+    storage = _storage()
+    filename = f"evidencias_{airport.code}_{datetime.utcnow():%Y%m%d}.zip"
+    return StreamingResponse(
+        stream_zip(manifest, open_file=lambda path, mode: storage.open(path)),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @app.delete("/api/airports/{airport_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_airport(airport_id: int, db: Session = Depends(get_db)):
     """Delete an airport profile."""
@@ -586,35 +823,6 @@ async def delete_airport(airport_id: int, db: Session = Depends(get_db)):
     return None
 
 
-# ANAC / anac_airports search for cadastro autocomplete
-@app.get("/api/airports/search")
-async def search_anac_airports(
-    q: str = "",
-    limit: int = 20,
-    db: Session = Depends(get_db)
-):
-    """
-    Busca aeródromos na base ANAC por código ICAO ou nome.
-    Usado para autocomplete no cadastro (ex: ?q=SBG retorna SBGR, SBSP, etc).
-    """
-    from app.models import ANACAirport
-    q = (q or "").strip().upper()[:10]
-    if len(q) < 2:
-        return []
-    rows = (
-        db.query(ANACAirport)
-        .filter(
-            (ANACAirport.code.ilike(f"%{q}%")) | (ANACAirport.name.ilike(f"%{q}%"))
-        )
-        .limit(limit)
-        .all()
-    )
-    return [
-        {"code": r.code, "name": r.name, "city": r.city, "state": r.state}
-        for r in rows
-    ]
-
-
 # ANAC Synchronization endpoints
 def _infer_fire_and_weight_from_anac(usage_class: str, reference_code: str) -> tuple:
     """
@@ -696,10 +904,12 @@ async def lookup_airport_debug(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Código ICAO deve ter exatamente 4 letras"
             )
-        from app.services.eais_fetch import fetch_eais_airport, fetch_eais_raw_html, HTML_PREVIEW_LENGTH
+        from app.services.eais_fetch import HTML_PREVIEW_LENGTH
+        from app.services.eais_cache import eais_cache
 
-        extracted = fetch_eais_airport(icao_code)
-        raw_html = fetch_eais_raw_html(icao_code)
+        # Consulta ao vivo (atualiza o cache); o HTML vem da mesma requisição
+        extracted = eais_cache.get(icao_code, force_refresh=True)
+        raw_html = eais_cache.get_raw_html(icao_code)
 
         expected_fields = [
             "name", "city", "state", "latitude", "longitude",
@@ -738,12 +948,14 @@ async def lookup_airport_debug(
 @app.get("/api/airports/lookup/{icao_code}")
 async def lookup_airport_from_eais(
     icao_code: str,
+    refresh: bool = False,
     db: Session = Depends(get_db)
 ):
     """
     Busca dados de um aeroporto exclusivamente no eAIS (AISWEB/DECEA).
     Extrai nome, coordenadas, RCD, CAT CIVIL, pistas e parâmetros de segurança.
     Não usa ANAC — dados vêm do eAIS para garantir precisão na verificação de conformidade.
+    Resultados ficam em cache (TTL + revalidação em background); refresh=true força nova consulta.
     """
     try:
         icao_code = icao_code.upper().strip()
@@ -754,8 +966,8 @@ async def lookup_airport_from_eais(
             )
         
         # 1. Buscar no eAIS (única fonte oficial)
-        from app.services.eais_fetch import fetch_eais_airport
-        airport_data = fetch_eais_airport(icao_code)
+        from app.services.eais_cache import eais_cache
+        airport_data = eais_cache.get(icao_code, force_refresh=refresh)
         source = "eais"
         
         if not airport_data or not airport_data.get("name"):
@@ -790,10 +1002,13 @@ async def lookup_airport_from_eais(
                 _infer_missing_lookup_fields(result, local_airport)
                 return result
 
-            # 3. Fallback: ANAC (tabela anac_airports ou cache)
+            # 3. Fallback: ANAC (tabela anac_airports > snapshot local > download ao vivo)
             sync_service = ANACSyncService(db=db)
             anac_row = sync_service.get_from_anac_airports_table(icao_code)
             if not anac_row:
+                anac_row = sync_service.get_from_snapshot(icao_code)
+            if not anac_row and not sync_service.has_snapshot():
+                # Sem snapshot (primeira execução): baixa a lista; com snapshot, código ausente = fora da lista ANAC
                 anac_data, _ = sync_service.get_anac_data(use_cache_if_live_fails=True)
                 if anac_data:
                     anac_row = next((a for a in anac_data if (a.get("code") or "").upper() == icao_code), None)
@@ -867,6 +1082,45 @@ async def lookup_airport_from_eais(
         )
 
 
+@app.post("/api/airports/enrich/eais", status_code=status.HTTP_202_ACCEPTED)
+async def enrich_airports_from_eais(
+    request: schemas.EAISEnrichRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Inicia um job de enriquecimento em lote com dados do eAIS (CAT CIVIL, RCD, peso máximo,
+    pistas, coordenadas, cidade/UF). Consultas em paralelo com limite de taxa ao AISWEB.
+    Acompanhe o progresso em GET /api/airports/enrich/eais/{job_id}.
+    """
+    from app.services.eais_enrich import start_job
+
+    if request.all_registered:
+        codes = [c for (c,) in db.query(Airport.code).all()]
+    else:
+        codes = request.codes or []
+    if not codes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Informe 'codes' ou 'all_registered': true"
+        )
+    job = start_job(codes, refresh=request.refresh)
+    return job.to_dict()
+
+
+@app.get("/api/airports/enrich/eais/{job_id}")
+async def get_eais_enrich_job(job_id: str, db: Session = Depends(get_db)):
+    """Status e resultado de um job de enriquecimento eAIS (gravado no banco: vale em qualquer worker)."""
+    from app.services.eais_enrich import get_job
+
+    job = get_job(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} não encontrado"
+        )
+    return job
+
+
 @app.post("/api/airports/sync/anac/refresh-cache")
 async def refresh_anac_cache(db: Session = Depends(get_db)):
     """
@@ -890,6 +1144,7 @@ async def refresh_anac_cache(db: Session = Depends(get_db)):
 @app.post("/api/airports/sync/anac")
 async def sync_airports_with_anac(
     dry_run: bool = False,
+    stream: bool = False,
     db: Session = Depends(get_db)
 ):
     """
@@ -897,6 +1152,8 @@ async def sync_airports_with_anac(
     
     Args:
         dry_run: If True, only show what would be changed without actually updating
+        stream: True = resposta NDJSON, um registro de alteração por linha à medida que a
+            sincronização avança e o resumo (sem "changes") na última linha
         
     Returns:
         Sync results with statistics and changes
@@ -913,6 +1170,22 @@ async def sync_airports_with_anac(
                 detail="Não foi possível obter dados da ANAC. Tente novamente ou use o endpoint /api/airports/sync/anac/refresh-cache para atualizar o cache."
             )
         
+        if stream:
+            def _ndjson():
+                results = sync_service.new_sync_results()
+                for change in sync_service.iter_sync_airports(anac_data, dry_run=dry_run, results=results):
+                    yield json.dumps(change, ensure_ascii=False) + "\n"
+                results.pop("changes")
+                yield json.dumps({
+                    "success": True,
+                    "dry_run": dry_run,
+                    "total_anac_airports": len(anac_data),
+                    "results": results,
+                    "timestamp": datetime.utcnow().isoformat()
+                }, ensure_ascii=False) + "\n"
+
+            return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
         # Perform synchronization
         results = sync_service.sync_airports(anac_data, dry_run=dry_run)
         
@@ -933,6 +1206,65 @@ async def sync_airports_with_anac(
         )
 
 
+@app.get("/api/airports/sync/anac/versions")
+async def list_anac_dataset_versions(limit: int = 20, db: Session = Depends(get_db)):
+    """Versões do dataset da ANAC já aplicadas na sincronização (mais recente primeiro)."""
+    from app.models import ANACDatasetVersion
+    versions = (
+        db.query(ANACDatasetVersion)
+        .order_by(ANACDatasetVersion.id.desc())
+        .limit(max(1, min(limit, 100)))
+        .all()
+    )
+    return [
+        {
+            "version": v.version,
+            "content_hash": v.content_hash,
+            "record_count": v.record_count,
+            "changed_count": v.changed_count,
+            "created_at": v.created_at.isoformat() if v.created_at else None,
+        }
+        for v in versions
+    ]
+
+
+@app.get("/api/health/upstreams")
+async def upstream_health():
+    """
+    Estado dos circuit breakers das fontes externas (AISWEB, ANAC).
+    open = host considerado fora do ar; as consultas usam cache/dados locais sem esperar timeout.
+    """
+    from app.services.upstream_health import health_snapshot
+
+    hosts = health_snapshot()
+    return {
+        "healthy": all(h["state"] != "open" for h in hosts.values()),
+        "hosts": hosts,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+@app.get("/api/health/ready")
+async def readiness():
+    """
+    Prontidão: 200 quando as etapas de startup terminaram, 503 enquanto rodam.
+    Cada etapa aparece como skipped (hash inalterado), done ou error, com a duração.
+    """
+    snapshot = startup_state.snapshot()
+    return JSONResponse(status_code=200 if snapshot["ready"] else 503, content=snapshot)
+
+
+@app.get("/api/health/leases")
+async def worker_leases():
+    """
+    Leases das tarefas singleton (startup, carga de anac_airports): último worker dono
+    (hostname:pid), se o lock está preso agora e se o dono é o worker que respondeu.
+    """
+    from app.services.leader import WORKER_ID, leases
+
+    return {"worker": WORKER_ID, "leases": leases()}
+
+
 # Regulation endpoints
 @app.post("/api/regulations", response_model=schemas.RegulationResponse, status_code=status.HTTP_201_CREATED)
 async def create_regulation(regulation: schemas.RegulationCreate, db: Session = Depends(get_db)):
@@ -948,6 +1280,8 @@ async def create_regulation(regulation: schemas.RegulationCreate, db: Session =
     db.add(db_regulation)
     db.commit()
     db.refresh(db_regulation)
+    from app.services.regulation_search import search_index
+    search_index.invalidate()
     return db_regulation
 
 
@@ -966,6 +1300,34 @@ async def list_regulations(
     return regulations
 
 
+@app.get("/api/regulations/search")
+async def search_regulations(
+    q: str,
+    safety_category: Optional[str] = None,
+    classification: Optional[str] = None,
+    airport_id: Optional[int] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+):
+    """
+    Busca no catálogo de normas (código, título, referência ANAC, descrição, requisitos e
+    desempenho esperado), sem acento, com ranking e trechos destacados entre «». Filtros:
+    categoria de segurança, classificação (A-D) e normas aplicáveis a um aeroporto.
+    Ver app/services/regulation_search.py.
+    """
+    from app.services.regulation_search import search_regulations as search
+
+    airport = None
+    if airport_id is not None:
+        airport = db.query(Airport).filter(Airport.id == airport_id).first()
+        if not airport:
+            raise HTTPException(status_code=404, detail="Airport not found")
+    return search(
+        db, q, limit=max(1, min(limit, 100)), airport=airport,
+        safety_category=safety_category, classification=classification,
+    )
+
+
 @app.get("/api/regulations/{regulation_id}", response_model=schemas.RegulationResponse)
 async def get_regulation(regulation_id: int, db: Session = Depends(get_db)):
     """Get a specific regulation by ID."""
@@ -998,6 +1360,8 @@ async def check_compliance(
         )
     
     # Convert compliance records to response format
+    from app.services.document_listing import document_counts
+    counts = document_counts(db, result["airport_id"])
     records_response = []
     for record in result["compliance_records"]:
         # Get regulation - try multiple approaches to ensure we get it
@@ -1206,7 +1570,8 @@ async def check_compliance(
             "custom_fields": custom_fields,
             "last_verified": record.last_verified,
             "verified_by": record.verified_by,
-            "regulation": regulation_response
+            "regulation": regulation_response,
+            "document_count": counts.get(record.id, 0),
         }
         try:
             records_response.append(schemas.ComplianceRecordResponse(**record_dict))
@@ -1274,20 +1639,6 @@ async def refresh_all_compliance(db: Session = Depends(get_db)):
     # Preencher usage_class em aeroportos que não têm (backfill antes de recalcular)
     await backfill_usage_class(db=db)
 
-    # Forçar regeneração de action_items para regulações SME/COE/PCM/SIMULADOS
-    # (limpa action_items antigos para que check_compliance gere os novos baseados no CEF)
-    srea_codes = ["RBAC-153-15", "RBAC-153-16", "RBAC-153-17", "RBAC-154-43"]
-    srea_regs = db.query(Regulation).filter(Regulation.code.in_(srea_codes)).all()
-    srea_reg_ids = [r.id for r in srea_regs]
-    if srea_reg_ids:
-        srea_records = db.query(ComplianceRecord).filter(
-            ComplianceRecord.regulation_id.in_(srea_reg_ids)
-        ).all()
-        for rec in srea_records:
-            rec.action_items = None
-            rec.completed_action_items = None
-        db.commit()
-
     airports = db.query(Airport).all()
     engine = ComplianceEngine(db)
     updated = 0
@@ -1304,9 +1655,12 @@ async def refresh_all_compliance(db: Session = Depends(get_db)):
 @app.get("/api/compliance/airport/{airport_id}", response_model=List[schemas.ComplianceRecordResponse])
 async def get_airport_compliance(airport_id: int, db: Session = Depends(get_db)):
     """Get all compliance records for an airport."""
+    from app.services.document_listing import document_counts
+
     records = db.query(ComplianceRecord).filter(
         ComplianceRecord.airport_id == airport_id
     ).all()
+    counts = document_counts(db, airport_id)
     
     records_response = []
     for record in records:
@@ -1417,7 +1771,8 @@ async def get_airport_compliance(airport_id: int, db: Session = Depends(get_db))
             "custom_fields": custom_fields,
             "last_verified": record.last_verified,
             "verified_by": record.verified_by,
-            "regulation": schemas.RegulationResponse(**regulation_dict) if regulation_dict else None
+            "regulation": schemas.RegulationResponse(**regulation_dict) if regulation_dict else None,
+            "document_count": counts.get(record.id, 0),
         }
         records_response.append(schemas.ComplianceRecordResponse(**record_dict))
     
@@ -1811,10 +2166,42 @@ async def update_compliance_record(
 # Document Attachments Endpoints
 # ============================================
 
-# Create uploads directory if it doesn't exist
+from app.services.blob_store import add_reference, is_blob_path
+from app.services.storage import get_storage
+from app.services.uploads import ALLOWED_EXTENSIONS, UploadTooLarge, file_extension, stage_upload
+
+# Create uploads directory if it doesn't exist (temporários e anexos no disco)
 UPLOADS_DIR = Path("uploads")
 UPLOADS_DIR.mkdir(exist_ok=True)
 
+
+def _storage():
+    """Armazenamento dos anexos (STORAGE_BACKEND: disco local ou S3; app/services/storage.py)."""
+    return get_storage(UPLOADS_DIR)
+
+
+def _preview_url(document) -> Optional[str]:
+    from app.services.thumbnails import supports
+    return f"/api/documents/{document.id}/preview" if supports(document) else None
+
+
+def _document_response(doc) -> schemas.DocumentAttachmentResponse:
+    return schemas.DocumentAttachmentResponse(
+        id=doc.id,
+        compliance_record_id=doc.compliance_record_id,
+        filename=doc.filename,
+        file_path=doc.file_path,
+        file_size=doc.file_size,
+        file_type=doc.file_type,
+        sha256=doc.sha256,
+        document_type=doc.document_type,
+        description=doc.description,
+        uploaded_at=doc.uploaded_at,
+        uploaded_by=doc.uploaded_by,
+        preview_url=_preview_url(doc),
+    )
+
+
 @app.post("/api/compliance/records/{record_id}/documents", response_model=schemas.DocumentAttachmentResponse)
 async def upload_document(
     record_id: int,
@@ -1831,31 +2218,31 @@ async def upload_document(
         if not record:
             raise HTTPException(status_code=404, detail="Compliance record not found")
         
-        # Validate file size (max 10MB)
-        file_content = await file.read()
-        file_size = len(file_content)
-        if file_size > 10 * 1024 * 1024:  # 10MB
-            raise HTTPException(status_code=400, detail="File size exceeds 10MB limit")
-        
         # Validate file type
-        allowed_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.doc', '.docx', '.xls', '.xlsx'}
-        file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in allowed_extensions:
+        file_ext = file_extension(file.filename)
+        if file_ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
-                detail=f"File type not allowed. Allowed types: {', '.join(allowed_extensions)}"
+                detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
             )
-        
-        # Create unique filename
-        import uuid
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = UPLOADS_DIR / f"record_{record_id}" / unique_filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save file
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
-        
+
+        # Streaming em blocos para um temporário (limite e SHA-256 verificados durante a cópia)
+        try:
+            staged = await stage_upload(file, UPLOADS_DIR)
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        file_size = staged.size
+
+        # Armazenamento por conteúdo: conteúdo repetido só ganha mais uma referência
+        import asyncio
+        try:
+            file_path = await asyncio.to_thread(add_reference, db, staged, _storage())
+        except Exception:
+            # Só o temporário: se já foi movido para blobs/, o arquivo pode ser de outro anexo
+            if staged.pending:
+                staged.discard()
+            raise
+
         # Create database record
         db_document = DocumentAttachment(
             compliance_record_id=record_id,
@@ -1863,6 +2250,7 @@ async def upload_document(
             file_path=str(file_path),
             file_size=file_size,
             file_type=file.content_type,
+            sha256=staged.sha256,
             document_type=document_type,
             uploaded_by=uploaded_by,
             description=description
@@ -1870,19 +2258,14 @@ async def upload_document(
         db.add(db_document)
         db.commit()
         db.refresh(db_document)
+
+        # Miniatura em background (pool de threads; uma por conteúdo)
+        from app.services import document_search, thumbnails
+        thumbnails.schedule(_storage(), UPLOADS_DIR, db_document)
+        # Texto para a busca nas evidências (pool de processos)
+        document_search.schedule(_storage(), db_document, session_factory=sessionmaker(bind=db.get_bind()))
         
-        return schemas.DocumentAttachmentResponse(
-            id=db_document.id,
-            compliance_record_id=db_document.compliance_record_id,
-            filename=db_document.filename,
-            file_path=db_document.file_path,
-            file_size=db_document.file_size,
-            file_type=db_document.file_type,
-            document_type=db_document.document_type,
-            description=db_document.description,
-            uploaded_at=db_document.uploaded_at,
-            uploaded_by=db_document.uploaded_by
-        )
+        return _document_response(db_document)
     except HTTPException:
         raise
     except Exception as e:
@@ -1903,37 +2286,98 @@ def list_documents(record_id: int, db: Session = Depends(get_db)):
         db.rollback()
         return []
 
-    return [
-        schemas.DocumentAttachmentResponse(
-            id=doc.id,
-            compliance_record_id=doc.compliance_record_id,
-            filename=doc.filename,
-            file_path=doc.file_path,
-            file_size=doc.file_size,
-            file_type=doc.file_type,
-            document_type=doc.document_type,
-            description=doc.description,
-            uploaded_at=doc.uploaded_at,
-            uploaded_by=doc.uploaded_by
-        )
-        for doc in documents
-    ]
+    return [_document_response(doc) for doc in documents]
+
+
+@app.get("/api/documents/search")
+def search_documents(
+    q: str,
+    airport_id: Optional[int] = None,
+    regulation_id: Optional[int] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+):
+    """
+    Busca textual nos anexos (DOCX, XLSX, PDF com texto): anexos que mencionam todos os
+    termos (ex.: "PCINC", "plano de emergência"), com trecho, aeroporto e norma. Filtros
+    opcionais por aeroporto e norma. Ver app/services/document_search.py.
+    """
+    from app.services.document_search import search_documents as search
+
+    return search(db, q, airport_id=airport_id, regulation_id=regulation_id, limit=max(1, min(limit, 100)))
+
+
+@app.post("/api/documents/search/reindex")
+def reindex_documents(db: Session = Depends(get_db)):
+    """Extrai em background o texto dos anexos ainda não indexados (anexos antigos ou com falha)."""
+    from app.services.document_search import schedule, unindexed_documents
+
+    storage = _storage()
+    session_factory = sessionmaker(bind=db.get_bind())
+    queued = sum(1 for doc in unindexed_documents(db) if schedule(storage, doc, session_factory=session_factory))
+    return {"queued": queued}
 
 
 @app.get("/api/documents/{document_id}/download")
-def download_document(document_id: int, db: Session = Depends(get_db)):
-    """Download a document attachment."""
+def download_document(document_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Download a document attachment. ETag (SHA-256), 304 para If-None-Match/If-Modified-Since
+    e Range (206) para visualização parcial de PDFs; ver app/services/file_serving.py.
+    Anexos no S3: redireciona para uma URL pré-assinada (o arquivo não passa pelo app).
+    """
+    from app.services.file_serving import serve_file
+
     document = db.query(DocumentAttachment).filter(DocumentAttachment.id == document_id).first()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
-    
-    if not os.path.exists(document.file_path):
+
+    storage = _storage()
+    media_type = document.file_type or "application/octet-stream"
+    url = storage.presigned_url(document.file_path, document.filename, media_type)
+    if url:
+        return RedirectResponse(url, status_code=307)
+
+    local_path = storage.local_path(document.file_path)
+    if not local_path:
         raise HTTPException(status_code=404, detail="File not found on server")
     
-    return FileResponse(
-        document.file_path,
-        media_type=document.file_type or "application/octet-stream",
-        filename=document.filename
+    return serve_file(
+        request,
+        local_path,
+        media_type=media_type,
+        filename=document.filename,
+        sha256=document.sha256,
+        last_modified=document.uploaded_at,
+        # Blob endereçado por conteúdo: o conteúdo deste anexo nunca muda
+        immutable=bool(document.sha256) and is_blob_path(document.file_path),
+    )
+
+
+@app.get("/api/documents/{document_id}/preview")
+def preview_document(document_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Miniatura JPEG do anexo (imagens; primeira página de PDFs), gerada após o upload e
+    guardada pelo hash do conteúdo (app/services/thumbnails.py). 404 se o tipo não tem
+    miniatura.
+    """
+    from app.services.file_serving import serve_file
+    from app.services.thumbnails import THUMBNAIL_SIZE, ensure_thumbnail
+
+    document = db.query(DocumentAttachment).filter(DocumentAttachment.id == document_id).first()
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    storage = _storage()
+    file_path = ensure_thumbnail(storage, UPLOADS_DIR, document)
+    if not file_path:
+        raise HTTPException(status_code=404, detail="Preview not available")
+    name = f"{os.path.splitext(document.filename)[0]}.jpg"
+    url = storage.presigned_url(file_path, name, "image/jpeg")
+    if url:
+        return RedirectResponse(url, status_code=307)
+    return serve_file(
+        request, file_path, media_type="image/jpeg", filename=name,
+        sha256=f"{document.sha256}-{THUMBNAIL_SIZE}", immutable=True, inline=True,
     )
 
 
@@ -1944,10 +2388,10 @@ def delete_document(document_id: int, db: Session = Depends(get_db)):
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    # Delete file from filesystem
-    if os.path.exists(document.file_path):
+    # Delete file from filesystem (blobs: a remoção do anexo decrementa as referências e o GC apaga)
+    if not is_blob_path(document.file_path):
         try:
-            os.remove(document.file_path)
+            _storage().delete(document.file_path)
         except Exception as e:
             print(f"Warning: Could not delete file {document.file_path}: {e}")
     
@@ -1958,5 +2402,18 @@ def delete_document(document_id: int, db: Session = Depends(get_db)):
     return {"message": "Document deleted successfully"}
 
 
+@app.post("/api/uploads/gc")
+def uploads_gc(dry_run: bool = True, db: Session = Depends(get_db)):
+    """
+    Coleta de lixo dos anexos: reconcilia o diretório de uploads com document_attachments
+    (arquivos de registros removidos, uploads interrompidos) e apaga blobs sem referências,
+    respeitando a carência de BLOB_GC_GRACE_SECONDS. dry_run=true (padrão) só relata o que
+    seria apagado e quantos bytes seriam liberados.
+    """
+    from app.services.uploads_gc import collect_uploads
+
+    return collect_uploads(db, UPLOADS_DIR, dry_run=dry_run, storage=_storage())
+
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
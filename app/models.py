@@ -1,7 +1,7 @@
 """
 Data models for the airport compliance system.
 """
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Enum as SQLEnum, Float, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Enum as SQLEnum, Float, DateTime, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -127,6 +127,102 @@ class ANACAirport(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class EAISCacheEntry(Base):
+    """
+    Cache persistente das consultas ao eAIS (AISWEB) por código ICAO.
+    payload NULL = código inexistente no eAIS (negative caching).
+    """
+    __tablename__ = "eais_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(4), unique=True, nullable=False, index=True)  # ICAO
+    payload = Column(Text, nullable=True)  # JSON com os campos extraídos pelo parser
+    raw_html = Column(LargeBinary, nullable=True)  # HTML bruto comprimido (zlib)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EAISArchiveBlob(Base):
+    """
+    Arquivo das páginas HTML do eAIS, endereçado pelo conteúdo (SHA-256 do HTML).
+    Páginas idênticas (aeródromo sem alteração entre ciclos AIRAC) são gravadas uma vez.
+    """
+    __tablename__ = "eais_archive_blobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, nullable=False, index=True)
+    codec = Column(String(10), nullable=False)  # zstd ou gzip
+    size = Column(Integer, nullable=False)  # Tamanho do HTML sem compressão (bytes)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class EAISArchiveFetch(Base):
+    """Cada consulta ao AISWEB: código ICAO, momento e página obtida (sha256 em eais_archive_blobs)."""
+    __tablename__ = "eais_archive_fetches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(4), nullable=False, index=True)  # ICAO
+    sha256 = Column(String(64), nullable=False, index=True)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class EAISEnrichJob(Base):
+    """
+    Estado dos jobs de enriquecimento em lote com o eAIS (app/services/eais_enrich.py), gravado
+    pelo worker que executa o job para que o status possa ser consultado em qualquer worker.
+    """
+    __tablename__ = "eais_enrich_jobs"
+
+    id = Column(String(32), primary_key=True)
+    status = Column(String(20), nullable=False)  # queued, running, done, failed
+    state = Column(Text, nullable=False)  # JSON de EnrichJob.to_dict()
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True, index=True)
+
+
+class ANACDatasetVersion(Base):
+    """
+    Versão do dataset da ANAC aplicada na sincronização de aeroportos, identificada pelo
+    hash do conteúdo. row_hashes (JSON gzip {ICAO: hash da linha}) permite calcular o diff
+    da próxima sincronização sem reler o dataset anterior.
+    """
+    __tablename__ = "anac_dataset_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    version = Column(String(20), nullable=False, index=True)  # Prefixo do content_hash (airports.versao_dados_anac)
+    content_hash = Column(String(64), nullable=False)  # SHA-256 das linhas (ordenadas por ICAO)
+    record_count = Column(Integer, nullable=False)
+    changed_count = Column(Integer, nullable=True)  # Linhas novas/alteradas em relação à versão anterior
+    row_hashes = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class SchemaMeta(Base):
+    """
+    Versões/hashes das etapas de inicialização (schema, seed do catálogo, backfills). No
+    startup, uma etapa cujo hash gravado é igual ao atual é pulada (app/services/startup.py).
+    """
+    __tablename__ = "schema_meta"
+
+    key = Column(String(100), primary_key=True)
+    value = Column(String(128), nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class WorkerLease(Base):
+    """
+    Último worker que obteve cada lease de tarefa singleton (app/services/leader.py). O lock
+    em si é um advisory lock do PostgreSQL ou um lock de arquivo; a tabela só dá visibilidade.
+    """
+    __tablename__ = "worker_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(200), nullable=False)  # hostname:pid
+    acquired_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    released_at = Column(DateTime, nullable=True)
+
+
 class Airport(Base):
     """Airport profile with variables that determine compliance requirements"""
     __tablename__ = "airports"
@@ -207,6 +303,10 @@ class Regulation(Base):
     # Requirements description
     requirements = Column(Text, nullable=False)  # What needs to be done
     expected_performance = Column(Text, nullable=True)  # Desempenho esperado/Verificação
+
+    # Versão do catálogo (app/services/regulation_catalog.py)
+    content_hash = Column(String(64), nullable=True)  # Hash dos campos do seed
+    template_hash = Column(String(64), nullable=True)  # Hash dos itens de ação gerados
     
     # Relationships
     compliance_records = relationship("ComplianceRecord", back_populates="regulation")
@@ -237,6 +337,9 @@ class ComplianceRecord(Base):
     
     # Custom fields for SESCINC-specific data (JSON)
     custom_fields = Column(Text, nullable=True)  # JSON object with custom fields based on regulation code
+
+    # Status antes de reconcile_airports marcar not_applicable; NULL = não retirado pela reconciliação
+    retired_status = Column(String(30), nullable=True)
     
     # Relationships
     airport = relationship("Airport", back_populates="compliance_records")
@@ -244,6 +347,34 @@ class ComplianceRecord(Base):
     documents = relationship("DocumentAttachment", back_populates="compliance_record", cascade="all, delete-orphan")
 
 
+class Blob(Base):
+    """
+    Conteúdo de anexo armazenado uma única vez, endereçado pelo SHA-256
+    (app/services/blob_store.py). ref_count = anexos (document_attachments) que apontam para ele.
+    """
+    __tablename__ = "blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_referenced_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # Última criação/remoção de referência
+
+
+class DocumentText(Base):
+    """
+    Texto extraído de um conteúdo de anexo (DOCX, XLSX, PDF com texto), pelo SHA-256: alimenta
+    a busca textual nas evidências (app/services/document_search.py). status: ok, empty
+    (sem texto extraível), unsupported (formato) ou error.
+    """
+    __tablename__ = "document_texts"
+
+    sha256 = Column(String(64), primary_key=True)
+    status = Column(String(20), nullable=False)
+    content = Column(Text, nullable=True)
+    extracted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class DocumentAttachment(Base):
     """Document attachments for compliance records"""
     __tablename__ = "document_attachments"
@@ -254,6 +385,7 @@ class DocumentAttachment(Base):
     file_path = Column(String(500), nullable=False)  # Path to stored file
     file_size = Column(Integer, nullable=False)  # Size in bytes
     file_type = Column(String(100), nullable=True)  # MIME type
+    sha256 = Column(String(64), nullable=True, index=True)  # Hash do conteúdo (calculado no upload)
     document_type = Column(String(50), nullable=True)  # Certificado, Relatório, Foto, Outro
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     uploaded_by = Column(String(100), nullable=True)
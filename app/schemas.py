@@ -90,6 +90,7 @@ class ComplianceRecordResponse(ComplianceRecordBase):
     verified_by: Optional[str] = None
     custom_fields: Optional[Dict] = None  # Custom fields for SESCINC-specific data
     regulation: Optional[RegulationResponse] = None  # Embedded regulation for display
+    document_count: Optional[int] = None  # Anexos do registro (nas listagens do aeroporto)
 class DocumentAttachmentBase(BaseModel):
     compliance_record_id: int
     filename: str
@@ -105,12 +106,26 @@ class DocumentAttachmentResponse(DocumentAttachmentBase):
     file_path: str
     file_size: int
     file_type: Optional[str] = None
+    sha256: Optional[str] = None
     uploaded_at: datetime
     uploaded_by: Optional[str] = None
+    preview_url: Optional[str] = None  # Miniatura (GET /api/documents/{id}/preview), se houver
     
     model_config = {"from_attributes": True}
     
     model_config = {"from_attributes": True}
+class RecordDocuments(BaseModel):
+    """Anexos de um registro de conformidade (GET /api/airports/{id}/documents)."""
+    compliance_record_id: int
+    regulation_id: int
+    regulation_code: Optional[str] = None
+    document_count: int
+    last_uploaded_at: Optional[datetime] = None
+    documents: Optional[List[DocumentAttachmentResponse]] = None  # Omitido com summary=true
+class AirportDocumentsResponse(BaseModel):
+    airport_id: int
+    document_count: int
+    records: List[RecordDocuments]
 class ComplianceCheckRequest(BaseModel):
     airport_id: int
 class ComplianceCheckResponse(BaseModel):
@@ -123,4 +138,10 @@ class ComplianceCheckResponse(BaseModel):
     pending_count: int
     compliance_records: List[ComplianceRecordResponse]
     recommendations: List[str] = []
-    anac_scores: Optional[dict] = None  # ANAC compliance scores
\ No newline at end of file
+    anac_scores: Optional[dict] = None  # ANAC compliance scores
+
+
+class EAISEnrichRequest(BaseModel):
+    codes: Optional[List[str]] = None  # Códigos ICAO a enriquecer
+    all_registered: bool = False  # True: todos os aeroportos cadastrados
+    refresh: bool = False  # True: ignora o cache do eAIS e consulta o AISWEB
@@ -0,0 +1,210 @@
+"""
+Índice espacial dos aeródromos da ANAC (anac_airports) para consultas de proximidade.
+
+Grade regular em graus (GEO_CELL_DEGREES, padrão 1° ~ 110 km): cada célula guarda os
+aeródromos que caem nela. A busca dos k mais próximos percorre anéis de células em volta do
+ponto e só calcula haversine para quem está nesses anéis; para quando o anel seguinte já
+está mais longe (limite inferior da distância) que o k-ésimo encontrado ou que o raio.
+
+Como o índice de busca textual (airport_search), é montado na primeira consulta, remontado
+quando anac_airports muda (verificação de quantidade/maior updated_at a cada
+AIRPORT_SEARCH_REFRESH_SECONDS, ou logo após uma sincronização neste processo).
+
+region_for()/group_by_region() agrupam aeroportos cadastrados por região do IBGE (pela UF;
+sem UF, pela UF do aeródromo ANAC mais próximo).
+"""
+import heapq
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.models import ANACAirport
+from app.services.airport_search import AIRPORT_SEARCH_REFRESH_SECONDS
+
+GEO_CELL_DEGREES = float(os.getenv("GEO_CELL_DEGREES", "1"))
+EARTH_RADIUS_KM = 6371.0088
+
+REGIONS = {
+    "Norte": ("AC", "AM", "AP", "PA", "RO", "RR", "TO"),
+    "Nordeste": ("AL", "BA", "CE", "MA", "PB", "PE", "PI", "RN", "SE"),
+    "Centro-Oeste": ("DF", "GO", "MS", "MT"),
+    "Sudeste": ("ES", "MG", "RJ", "SP"),
+    "Sul": ("PR", "RS", "SC"),
+}
+REGION_BY_STATE = {uf: region for region, states in REGIONS.items() for uf in states}
+# Distância máxima até o aeródromo ANAC usado para inferir a UF de quem não tem estado
+REGION_LOOKUP_RADIUS_KM = 50.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _valid_coords(lat, lon) -> bool:
+    return lat is not None and lon is not None and -90 <= lat <= 90 and -180 <= lon <= 180
+
+
+class GeoGrid:
+    """Grade de células de `cell_deg` graus com os pontos (code, lat, lon, dados)."""
+
+    def __init__(self, cell_deg: float = GEO_CELL_DEGREES):
+        self.cell_deg = cell_deg
+        self._cols = max(1, round(360 / cell_deg))
+        self._cells: Dict[Tuple[int, int], List[Tuple[str, float, float, Dict]]] = {}
+        self._min_row = self._max_row = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor((lon + 180) / self.cell_deg) % self._cols
+
+    def add(self, code: str, lat: float, lon: float, data: Dict) -> None:
+        cell = self._cell(lat, lon)
+        if not self._cells:
+            self._min_row = self._max_row = cell[0]
+        self._min_row, self._max_row = min(self._min_row, cell[0]), max(self._max_row, cell[0])
+        self._cells.setdefault(cell, []).append((code, lat, lon, data))
+        self._size += 1
+
+    def _ring_lower_bound(self, lat: float, lon: float, ring: int) -> float:
+        """Distância mínima (km) do ponto a qualquer ponto fora do bloco de anéis 0..ring-1."""
+        if ring == 0:
+            return 0.0
+        row, _ = self._cell(lat, lon)
+        south = (row - ring + 1) * self.cell_deg
+        north = (row + ring) * self.cell_deg
+        d_lat = min(lat - south, north - lat)
+        col_start = math.floor((lon + 180) / self.cell_deg) * self.cell_deg - 180
+        d_lon = min(lon - (col_start - (ring - 1) * self.cell_deg), col_start + ring * self.cell_deg - lon)
+        # Distância ao meridiano a d_lon graus: R * asin(cos(lat) * sin(d_lon))
+        lon_km = EARTH_RADIUS_KM * math.asin(math.cos(math.radians(lat)) * math.sin(math.radians(min(d_lon, 90))))
+        return min(EARTH_RADIUS_KM * math.radians(d_lat), lon_km)
+
+    def _ring(self, row: int, col: int, ring: int) -> Iterable[Tuple[int, int]]:
+        if ring == 0:
+            yield row, col
+            return
+        seen = set()
+        for dr in range(-ring, ring + 1):
+            r = row + dr
+            if r < self._min_row or r > self._max_row:
+                continue
+            steps = range(-ring, ring + 1) if abs(dr) == ring else (-ring, ring)
+            for dc in steps:
+                cell = (r, (col + dc) % self._cols)
+                if cell not in seen:
+                    seen.add(cell)
+                    yield cell
+
+    def nearest(self, lat: float, lon: float, k: int = 10, radius_km: Optional[float] = None) -> List[Tuple[float, str, Dict]]:
+        """Até k pontos mais próximos (distância km, código, dados), opcionalmente dentro do raio."""
+        if not self._cells or k <= 0:
+            return []
+        row, col = self._cell(lat, lon)
+        max_ring = max(row - self._min_row, self._max_row - row, self._cols // 2)
+        best: List[Tuple[float, str, Dict]] = []  # heap de máximo (distância negativa)
+        for ring in range(max_ring + 1):
+            bound = self._ring_lower_bound(lat, lon, ring)
+            if radius_km is not None and bound > radius_km:
+                break
+            if len(best) >= k and bound > -best[0][0]:
+                break
+            for cell in self._ring(row, col, ring):
+                for code, plat, plon, data in self._cells.get(cell, ()):
+                    d = haversine_km(lat, lon, plat, plon)
+                    if radius_km is not None and d > radius_km:
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, code, data))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, code, data))
+        return sorted(((-nd, code, data) for nd, code, data in best), key=lambda t: (t[0], t[1]))
+
+
+class AirportGeoIndex:
+    """GeoGrid dos aeródromos de anac_airports, remontado quando a tabela muda."""
+
+    def __init__(self, refresh_seconds: float = AIRPORT_SEARCH_REFRESH_SECONDS, clock=time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._grid = GeoGrid()
+        self._version = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._grid)
+
+    def invalidate(self) -> None:
+        self._checked_at = None
+
+    def load(self, rows: Iterable) -> None:
+        """Substitui o conteúdo do índice (objetos ou dicts com code, name, city, state, latitude, longitude)."""
+        grid = GeoGrid()
+        for row in rows:
+            get = row.get if isinstance(row, dict) else lambda k, r=row: getattr(r, k, None)
+            lat, lon = get("latitude"), get("longitude")
+            if not _valid_coords(lat, lon):
+                continue
+            code = (get("code") or "").upper()
+            grid.add(code, lat, lon, {
+                "code": code, "name": get("name"), "city": get("city"), "state": get("state"),
+                "latitude": lat, "longitude": lon,
+            })
+        self._grid = grid
+
+    def ensure_fresh(self, db) -> None:
+        checked = self._checked_at
+        if checked is not None and self._clock() - checked < self.refresh_seconds:
+            return
+        version = tuple(db.query(func.count(ANACAirport.id), func.max(ANACAirport.updated_at)).one())
+        with self._lock:
+            if version != self._version:
+                self.load(
+                    db.query(
+                        ANACAirport.code, ANACAirport.name, ANACAirport.city, ANACAirport.state,
+                        ANACAirport.latitude, ANACAirport.longitude,
+                    ).filter(ANACAirport.latitude.isnot(None), ANACAirport.longitude.isnot(None))
+                )
+                self._version = version
+            self._checked_at = self._clock()
+
+    def nearby(self, lat: float, lon: float, k: int = 10, radius_km: Optional[float] = None) -> List[Dict]:
+        return [
+            {**data, "distance_km": round(d, 2)}
+            for d, _, data in self._grid.nearest(lat, lon, k=k, radius_km=radius_km)
+        ]
+
+
+geo_index = AirportGeoIndex()
+
+
+def region_for(state: Optional[str], lat: Optional[float] = None, lon: Optional[float] = None,
+               index: Optional[AirportGeoIndex] = None) -> Optional[str]:
+    """Região do IBGE pela UF; sem UF, pela UF do aeródromo ANAC mais próximo (até REGION_LOOKUP_RADIUS_KM)."""
+    region = REGION_BY_STATE.get((state or "").strip().upper())
+    if region or not _valid_coords(lat, lon):
+        return region
+    for near in (index or geo_index).nearby(lat, lon, k=3, radius_km=REGION_LOOKUP_RADIUS_KM):
+        region = REGION_BY_STATE.get((near.get("state") or "").upper())
+        if region:
+            return region
+    return None
+
+
+def group_by_region(airports: Iterable, index: Optional[AirportGeoIndex] = None) -> Dict[str, List]:
+    """Aeroportos cadastrados agrupados por região ("Sem região" quando não dá para inferir)."""
+    groups: Dict[str, List] = {}
+    for airport in airports:
+        region = region_for(airport.estado, airport.latitude, airport.longitude, index=index)
+        groups.setdefault(region or "Sem região", []).append(airport)
+    return groups
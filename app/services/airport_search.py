@@ -0,0 +1,357 @@
+"""
+Busca de aeródromos (autocomplete do cadastro) sobre a tabela anac_airports.
+
+Índice em memória, por processo:
+  - trie de prefixos dos códigos ICAO e IATA ("SBG" -> SBGR, SBGL, ...)
+  - índice de trigramas (estilo pg_trgm) das palavras de nome e cidade, sem acento e em
+    maiúsculas: "sao" encontra "São Paulo", "guarulos" encontra "Guarulhos"
+
+Resultados ordenados por relevância: código exato > IATA exato > prefixo de código >
+nome/cidade começando com os termos > semelhança por trigramas.
+
+O índice é montado na primeira busca e atualizado de forma incremental: a cada
+AIRPORT_SEARCH_REFRESH_SECONDS (ou logo após uma sincronização neste processo) compara
+quantidade e maior updated_at da tabela e relê só as linhas alteradas. Como cada worker tem
+o seu índice, sincronizações feitas em outro processo também chegam por essa verificação.
+
+No PostgreSQL, ensure_pg_trgm() cria índices GIN de trigramas para a consulta SQL de
+reserva (ILIKE), usada se o índice em memória não puder ser montado.
+"""
+import bisect
+import heapq
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func, text
+
+from app.models import ANACAirport
+
+AIRPORT_SEARCH_REFRESH_SECONDS = float(os.getenv("AIRPORT_SEARCH_REFRESH_SECONDS", "30"))
+# "0" não tenta criar a extensão pg_trgm e os índices GIN no startup
+AIRPORT_SEARCH_PG_TRGM = os.getenv("AIRPORT_SEARCH_PG_TRGM", "1") != "0"
+
+# Fração mínima dos trigramas do termo presentes na palavra (tolerância a erro de digitação)
+MIN_SIMILARITY = 0.6
+MAX_QUERY_LENGTH = 60
+
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+_CODE_QUERY_RE = re.compile(r"^[A-Z0-9]{2,4}$")
+
+
+def fold_text(value: Optional[str]) -> str:
+    """Maiúsculas, sem acentos e só letras/dígitos separados por espaço ("São Paulo/SP" -> "SAO PAULO SP")."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM_RE.sub(" ", stripped.upper()).strip()
+
+
+def _trigrams(word: str, prefix: bool = False) -> Set[str]:
+    """Trigramas da palavra com 2 espaços antes e 1 depois (pg_trgm); prefix=True omite o final."""
+    padded = f"  {word}" if prefix else f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "codes")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.codes: Set[str] = set()
+
+
+class _PrefixTrie:
+    """Trie de chaves curtas (ICAO/IATA); cada nó guarda os aeródromos abaixo dele."""
+
+    def __init__(self):
+        self.root = _TrieNode()
+
+    def add(self, key: str, code: str) -> None:
+        node = self.root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.codes.add(code)
+
+    def remove(self, key: str, code: str) -> None:
+        node = self.root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return
+            node.codes.discard(code)
+
+    def find(self, prefix: str) -> Set[str]:
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.codes
+
+
+class _Entry:
+    __slots__ = ("code", "iata", "name", "city", "state", "name_words", "city_words")
+
+    def __init__(self, code: str, name: str, city: Optional[str], state: Optional[str], iata: Optional[str]):
+        self.code = code
+        self.iata = (iata or "").strip().upper() or None
+        self.name = name
+        self.city = city
+        self.state = state
+        self.name_words = frozenset(fold_text(name).split())
+        self.city_words = frozenset(fold_text(city).split())
+
+    def to_dict(self) -> Dict:
+        return {"code": self.code, "name": self.name, "city": self.city, "state": self.state}
+
+
+class AirportSearchIndex:
+    """
+    Índice de busca dos aeródromos da ANAC.
+
+    Nome e cidade são indexados por palavra (palavra -> aeródromos); prefixos e trigramas são
+    calculados sobre o vocabulário (palavras distintas, bem menor que a lista), e só as
+    palavras aceitas são expandidas para aeródromos.
+    """
+
+    def __init__(self, refresh_seconds: float = AIRPORT_SEARCH_REFRESH_SECONDS, clock=time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._codes = _PrefixTrie()
+        self._name_words: Dict[str, Set[str]] = {}
+        self._city_words: Dict[str, Set[str]] = {}
+        self._vocab: List[str] = []  # ordenado, para busca por prefixo
+        self._vocab_trigrams: Dict[str, Set[str]] = {}
+        self._watermark = None
+        self._built = False
+        self._checked_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --- manutenção ---------------------------------------------------------
+
+    def _add_word(self, postings: Dict[str, Set[str]], word: str, code: str) -> None:
+        if word not in self._name_words and word not in self._city_words:
+            bisect.insort(self._vocab, word)
+            for tg in _trigrams(word):
+                self._vocab_trigrams.setdefault(tg, set()).add(word)
+        postings.setdefault(word, set()).add(code)
+
+    def _remove_word(self, postings: Dict[str, Set[str]], word: str, code: str) -> None:
+        codes = postings.get(word)
+        if codes is None:
+            return
+        codes.discard(code)
+        if codes:
+            return
+        del postings[word]
+        if word in self._name_words or word in self._city_words:
+            return
+        del self._vocab[bisect.bisect_left(self._vocab, word)]
+        for tg in _trigrams(word):
+            words = self._vocab_trigrams.get(tg)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self._vocab_trigrams[tg]
+
+    def _add(self, entry: _Entry) -> None:
+        self._entries[entry.code] = entry
+        self._codes.add(entry.code, entry.code)
+        if entry.iata:
+            self._codes.add(entry.iata, entry.code)
+        for word in entry.name_words:
+            self._add_word(self._name_words, word, entry.code)
+        for word in entry.city_words:
+            self._add_word(self._city_words, word, entry.code)
+
+    def _remove(self, code: str) -> None:
+        entry = self._entries.pop(code, None)
+        if entry is None:
+            return
+        self._codes.remove(entry.code, code)
+        if entry.iata:
+            self._codes.remove(entry.iata, code)
+        for word in entry.name_words:
+            self._remove_word(self._name_words, word, code)
+        for word in entry.city_words:
+            self._remove_word(self._city_words, word, code)
+
+    def upsert(self, rows: Iterable) -> int:
+        """Insere/atualiza aeródromos (objetos ou dicts com code, name, city, state, iata_code)."""
+        count = 0
+        with self._lock:
+            for row in rows:
+                get = row.get if isinstance(row, dict) else lambda k, r=row: getattr(r, k, None)
+                code = (get("code") or "").strip().upper()
+                if not code:
+                    continue
+                self._remove(code)
+                self._add(_Entry(code, get("name") or "", get("city"), get("state"), get("iata_code")))
+                count += 1
+        return count
+
+    def invalidate(self) -> None:
+        """Força a verificação da tabela na próxima busca (ex.: logo após uma sincronização)."""
+        self._checked_at = None
+
+    def refresh(self, db) -> None:
+        """Atualiza o índice a partir de anac_airports (completo na 1ª vez, depois incremental)."""
+        total, newest = db.query(func.count(ANACAirport.id), func.max(ANACAirport.updated_at)).one()
+        with self._lock:
+            built, watermark, size = self._built, self._watermark, len(self._entries)
+        if built and newest == watermark and total == size:
+            self._checked_at = self._clock()
+            return
+        if built and total >= size and watermark is not None:
+            changed = db.query(ANACAirport).filter(ANACAirport.updated_at >= watermark).all()
+            with self._lock:
+                self.upsert(changed)
+                self._watermark = newest
+                complete = len(self._entries) == total
+        else:
+            complete = False
+        if not complete:
+            self._rebuild(db.query(ANACAirport).all(), newest)
+        self._checked_at = self._clock()
+
+    def _rebuild(self, rows: List, watermark) -> None:
+        fresh = AirportSearchIndex(self.refresh_seconds, self._clock)
+        fresh.upsert(rows)
+        with self._lock:
+            self._entries, self._codes = fresh._entries, fresh._codes
+            self._name_words, self._city_words = fresh._name_words, fresh._city_words
+            self._vocab, self._vocab_trigrams = fresh._vocab, fresh._vocab_trigrams
+            self._watermark = watermark
+            self._built = True
+
+    def ensure_fresh(self, db) -> None:
+        checked = self._checked_at
+        if checked is None or self._clock() - checked >= self.refresh_seconds:
+            self.refresh(db)
+
+    # --- busca --------------------------------------------------------------
+
+    def _matching_words(self, term: str, last: bool) -> Dict[str, float]:
+        """Palavras do vocabulário aceitas para o termo -> semelhança (0-1)."""
+        matches: Dict[str, float] = {}
+        if last or len(term) < 3:
+            # Último termo (ainda sendo digitado): prefixo. Palavra completa igual vale mais.
+            i = bisect.bisect_left(self._vocab, term)
+            while i < len(self._vocab) and self._vocab[i].startswith(term):
+                word = self._vocab[i]
+                matches[word] = 1.0 if word == term else 0.9 + 0.1 * len(term) / len(word)
+                i += 1
+        elif term in self._name_words or term in self._city_words:
+            matches[term] = 1.0
+        if len(term) >= 3:
+            wanted = _trigrams(term, prefix=last)
+            hits = Counter()
+            for tg in wanted:
+                words = self._vocab_trigrams.get(tg)
+                if words:
+                    hits.update(words)
+            needed = MIN_SIMILARITY * len(wanted)
+            for word, n in hits.items():
+                if n >= needed and word not in matches:
+                    matches[word] = 0.8 * n / len(wanted)
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Aeródromos mais relevantes para a busca (código, nome ou cidade; sem acento)."""
+        folded = fold_text((query or "")[:MAX_QUERY_LENGTH])
+        terms = folded.split()
+        if len(folded.replace(" ", "")) < 2 or limit <= 0:
+            return []
+        with self._lock:
+            code_scores: Dict[str, float] = {}
+            if len(terms) == 1 and _CODE_QUERY_RE.match(terms[0]):
+                term = terms[0]
+                for code in self._codes.find(term):
+                    if code == term:
+                        code_scores[code] = 1000.0
+                    elif self._entries[code].iata == term:
+                        code_scores[code] = 900.0
+                    else:
+                        code_scores[code] = 800.0 - (len(code) - len(term))
+
+            # Cada termo precisa casar com alguma palavra do nome ou da cidade (cidade vale 80%)
+            text_scores: Optional[Dict[str, float]] = None
+            for i, term in enumerate(terms):
+                per_term: Dict[str, float] = {}
+                for word, sim in self._matching_words(term, last=i == len(terms) - 1).items():
+                    for code in self._city_words.get(word, ()):
+                        if per_term.get(code, 0.0) < 0.8 * sim:
+                            per_term[code] = 0.8 * sim
+                    for code in self._name_words.get(word, ()):
+                        if per_term.get(code, 0.0) < sim:
+                            per_term[code] = sim
+                if text_scores is None:
+                    text_scores = per_term
+                else:
+                    text_scores = {c: s + per_term[c] for c, s in text_scores.items() if c in per_term}
+                if not text_scores:
+                    break
+
+            scores = code_scores
+            for code, total in (text_scores or {}).items():
+                score = 100.0 * total / len(terms)
+                if score > scores.get(code, 0.0):
+                    scores[code] = score
+            best = heapq.nsmallest(limit, scores, key=lambda c: (-scores[c], self._entries[c].name, c))
+            return [self._entries[code].to_dict() for code in best]
+
+
+search_index = AirportSearchIndex()
+
+
+def search_airports(db, query: str, limit: int = 20) -> List[Dict]:
+    """Busca pelo índice em memória; se não for possível montá-lo, consulta SQL (ILIKE)."""
+    try:
+        search_index.ensure_fresh(db)
+    except Exception as e:
+        print(f"Aviso: índice de busca de aeródromos indisponível, usando SQL: {e}")
+        db.rollback()
+        return _sql_search(db, query, limit)
+    return search_index.search(query, limit)
+
+
+def _sql_search(db, query: str, limit: int) -> List[Dict]:
+    q = (query or "").strip().upper()[:MAX_QUERY_LENGTH]
+    if len(q) < 2:
+        return []
+    rows = (
+        db.query(ANACAirport)
+        .filter((ANACAirport.code.ilike(f"%{q}%")) | (ANACAirport.name.ilike(f"%{q}%")))
+        .order_by(ANACAirport.code)
+        .limit(limit)
+        .all()
+    )
+    return [{"code": r.code, "name": r.name, "city": r.city, "state": r.state} for r in rows]
+
+
+def ensure_pg_trgm(engine) -> None:
+    """PostgreSQL: extensão pg_trgm + índices GIN para a busca SQL de reserva. Ignora falhas (sem permissão etc.)."""
+    if not AIRPORT_SEARCH_PG_TRGM or engine.dialect.name != "postgresql":
+        return
+    statements = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_anac_airports_name_trgm ON anac_airports USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_anac_airports_code_trgm ON anac_airports USING gin (code gin_trgm_ops)",
+    ]
+    try:
+        with engine.connect() as conn:
+            for sql in statements:
+                conn.execute(text(sql))
+            conn.commit()
+    except Exception as e:
+        print(f"  busca: pg_trgm indisponível ({e}); a busca SQL de reserva usa varredura")
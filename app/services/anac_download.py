@@ -0,0 +1,140 @@
+"""
+Downloads dos datasets da ANAC (Características Gerais, Lista de aeródromos).
+
+Um DownloadManager vale por uma execução de sincronização: cada URL é baixada no máximo
+uma vez e os caminhos de fallback reutilizam o conteúdo já obtido. As conexões vêm de uma
+requests.Session compartilhada (pool keep-alive por host). O download é gravado em
+data/staging/<hash da URL>.part; se cair no meio, a próxima tentativa continua de onde
+parou com HTTP Range + If-Range (ETag/Last-Modified), e o servidor devolve o arquivo inteiro
+se ele mudou nesse meio tempo.
+"""
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.services.upstream_health import breaker_for, guarded_get
+
+logger = logging.getLogger(__name__)
+
+STAGING_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "staging"
+CHUNK_SIZE = 1024 * 1024
+# Tentativas por URL na mesma execução (a segunda retoma o arquivo parcial)
+DOWNLOAD_ATTEMPTS = 2
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """Session com pool de conexões, compartilhada por todas as sincronizações do processo."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+class DownloadManager:
+    """Baixa cada URL no máximo uma vez por execução, com retomada de downloads parciais."""
+
+    def __init__(
+        self,
+        staging_dir: Path = STAGING_DIR,
+        session: Optional[requests.Session] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.staging_dir = Path(staging_dir)
+        self.session = session or shared_session()
+        self.headers = headers or {}
+        self._done: Dict[str, bytes] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, timeout: float = 60) -> bytes:
+        """
+        Conteúdo da URL. Repetições na mesma execução não refazem o download (nem a falha:
+        uma URL que falhou nas DOWNLOAD_ATTEMPTS tentativas levanta o mesmo erro de novo).
+        Propaga requests.RequestException.
+        """
+        with self._lock:
+            lock = self._locks.setdefault(url, threading.Lock())
+        with lock:
+            if url in self._done:
+                return self._done[url]
+            if url in self._errors:
+                raise self._errors[url]
+            last_error = None
+            for _ in range(DOWNLOAD_ATTEMPTS):
+                try:
+                    self._done[url] = self._download(url, timeout)
+                    return self._done[url]
+                except requests.RequestException as e:
+                    last_error = e
+                    logger.warning("Download ANAC falhou (%s...): %s", url[:60], e)
+            self._errors[url] = last_error
+            raise last_error
+
+    def _download(self, url: str, timeout: float) -> bytes:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        part = self.staging_dir / f"{key}.part"
+        meta_path = self.staging_dir / f"{key}.json"
+        meta = {}
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except ValueError:
+                meta = {}
+        offset = part.stat().st_size if part.exists() else 0
+        validator = meta.get("etag") or meta.get("last_modified")
+        headers = dict(self.headers)
+        if offset and validator and meta.get("url") == url:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+        else:
+            offset = 0
+
+        response = guarded_get(url, session=self.session, headers=headers, timeout=timeout, stream=True)
+        try:
+            if response.status_code == 416 and offset:
+                # Parcial já estava completo
+                return self._finish(part, meta_path)
+            response.raise_for_status()
+            resumed = response.status_code == 206 and (response.headers.get("Content-Range") or "").startswith(
+                f"bytes {offset}-"
+            )
+            if resumed:
+                logger.info("Download ANAC retomado em %d bytes (%s...)", offset, url[:60])
+            meta_path.write_text(json.dumps({
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }))
+            try:
+                with open(part, "ab" if resumed else "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+            except requests.RequestException as e:
+                breaker_for(url).record_failure(type(e).__name__)
+                raise
+            return self._finish(part, meta_path)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _finish(part: Path, meta_path: Path) -> bytes:
+        data = part.read_bytes()
+        part.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        return data
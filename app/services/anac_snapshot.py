@@ -0,0 +1,158 @@
+"""
+Snapshot binário dos aeródromos ANAC (data/anac_airports.snap).
+
+Substitui o cache JSON (~6800 dicts carregados inteiros a cada uso). Formato:
+
+    cabeçalho  MAGIC(8) versão(u32) quantidade(u32) criado_em(f64)
+    índice     quantidade x [código ICAO (4 bytes ASCII) | offset (u32) | tamanho (u32)],
+               ordenado pelo código
+    registros  JSON compacto (utf-8) de cada aeródromo
+
+O arquivo é lido via mmap: uma consulta por código faz busca binária no índice e decodifica
+um único registro, e as páginas ficam no cache do sistema operacional, compartilhadas entre
+os workers. Iterar o snapshot decodifica um registro por vez (sem montar a lista inteira).
+A escrita é atômica (arquivo temporário + os.replace), então leitores nunca veem um snapshot
+pela metade.
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "anac_airports.snap"
+
+MAGIC = b"ANACSNP1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIId")
+_ENTRY = struct.Struct("<4sII")
+
+
+def write_snapshot(airports: List[Dict], path: Path = SNAPSHOT_PATH, created_at: Optional[float] = None) -> int:
+    """Grava o snapshot atomicamente. Retorna a quantidade de aeródromos gravados."""
+    by_code = {}
+    for a in airports:
+        code = (a.get("code") or "").strip().upper()
+        if len(code) == 4 and code.isascii():
+            by_code[code] = a
+    codes = sorted(by_code)
+    records = [
+        json.dumps(by_code[c], ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+        for c in codes
+    ]
+    data_start = _HEADER.size + _ENTRY.size * len(codes)
+    index = bytearray()
+    offset = data_start
+    for code, rec in zip(codes, records):
+        index += _ENTRY.pack(code.encode("ascii"), offset, len(rec))
+        offset += len(rec)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    created = created_at if created_at is not None else time.time()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(codes), created))
+            f.write(index)
+            for rec in records:
+                f.write(rec)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return len(codes)
+
+
+class ANACSnapshot:
+    """Leitura do snapshot via mmap (somente leitura)."""
+
+    def __init__(self, path: Path = SNAPSHOT_PATH):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, created_at = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path}: formato de snapshot desconhecido")
+        self.count = count
+        self.created_at = created_at
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, i: int):
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + i * _ENTRY.size)
+
+    def _record(self, offset: int, length: int) -> Dict:
+        return json.loads(self._mm[offset:offset + length].decode("utf-8"))
+
+    def get(self, icao_code: str) -> Optional[Dict]:
+        """Aeródromo pelo código ICAO (busca binária no índice) ou None."""
+        key = (icao_code or "").strip().upper().encode("ascii", "ignore")
+        if len(key) != 4:
+            return None
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            code, offset, length = self._entry(mid)
+            if code < key:
+                lo = mid + 1
+            elif code > key:
+                hi = mid
+            else:
+                return self._record(offset, length)
+        return None
+
+    def codes(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self._entry(i)[0].decode("ascii")
+
+    def records(self) -> Iterator[Dict]:
+        for i in range(self.count):
+            _, offset, length = self._entry(i)
+            yield self._record(offset, length)
+
+    __iter__ = records
+
+    def is_current(self) -> bool:
+        """False se o arquivo foi substituído (nova sincronização) desde a abertura."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self._key
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+_open: Dict[Path, ANACSnapshot] = {}
+_open_lock = threading.Lock()
+
+
+def open_snapshot(path: Path = SNAPSHOT_PATH) -> Optional[ANACSnapshot]:
+    """Snapshot aberto (reaberto se o arquivo foi regravado); None se não existir ou for inválido."""
+    path = Path(path)
+    with _open_lock:
+        snap = _open.get(path)
+        if snap is not None and snap.is_current():
+            return snap
+        # Não fecha o mmap antigo: outra thread pode estar lendo; o GC libera quando sair de uso
+        _open.pop(path, None)
+        if not path.exists():
+            return None
+        try:
+            snap = ANACSnapshot(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        _open[path] = snap
+        return snap
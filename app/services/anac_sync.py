@@ -10,12 +10,21 @@ import csv
 import json
 import io
 import os
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from sqlalchemy.orm import Session
+from app.compliance_engine import APPLICABILITY_FIELDS, ComplianceEngine
 from app.models import Airport, AirportCategory, ANACAirport, AirportSize, AirportType
 from app.database import SessionLocal
+from app.services.airport_geo import geo_index
+from app.services.airport_search import search_index
+from app.services.anac_download import DownloadManager
+from app.services.anac_snapshot import SNAPSHOT_PATH, open_snapshot, write_snapshot
+from app.services.anac_versions import (
+    content_hash_of, decode_hashes, diff_hashes, latest_version, record_version, row_hash, version_label,
+)
+from app.services.upstream_health import hedged
 
 
 # Cache válido por 7 dias (ANAC atualiza ~a cada 40 dias)
@@ -25,6 +34,10 @@ CACHE_MAX_AGE_DAYS = 7
 VALID_REF_CODE = re.compile(r'^[1-4][A-E]$', re.I)
 
 
+def _event_value(value):
+    return value.value if hasattr(value, 'value') else value
+
+
 class ANACSyncService:
     """Service for synchronizing airport data with ANAC (fonte oficial preferida)"""
 
@@ -43,18 +56,40 @@ class ANACSyncService:
         "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
     }
 
+    # Acima disso a sincronização carrega a tabela airports inteira numa consulta, em vez de IN
+    SYNC_BATCH_SIZE = 500
+    # Aeroportos novos por bulk_insert_mappings
+    SYNC_INSERT_BATCH_SIZE = 1000
+
     def __init__(self, db: Session = None):
         self.db = db or SessionLocal()
         base_dir = Path(__file__).resolve().parent.parent.parent
-        self._cache_path = base_dir / "data" / "anac_airports_cache.json"
+        self._cache_path = base_dir / "data" / "anac_airports_cache.json"  # legado (JSON)
+        self._snapshot_path = SNAPSHOT_PATH
+        # Downloads e CSV parseado valem pela execução: fallbacks não baixam o mesmo arquivo de novo
+        self._downloads = DownloadManager(headers=self.HEADERS)
+        self._carac_rows: Optional[List[Dict]] = None
+        # Versão do dataset sendo aplicada por sync_airports (gravada em airports.versao_dados_anac)
+        self._dataset_version: Optional[str] = None
+        # Eventos de _update_airport: {airport_id, code, fields: {campo: [antes, depois]}}
+        self.change_events: List[Dict] = []
 
     def _get_cache_path(self) -> Path:
         self._cache_path.parent.mkdir(parents=True, exist_ok=True)
         return self._cache_path
 
-    def _load_cache(self, max_age_days: int = CACHE_MAX_AGE_DAYS) -> Optional[List[Dict]]:
-        """Carrega cache ANAC se existir e não estiver expirado."""
+    def _load_cache(self, max_age_days: int = CACHE_MAX_AGE_DAYS) -> Optional[Iterable[Dict]]:
+        """
+        Cache ANAC se não estiver expirado: o snapshot binário (iterável com len(), registros
+        decodificados um a um sob demanda) ou, se ainda não houver snapshot, a lista do JSON legado.
+        """
         try:
+            snap = open_snapshot(self._snapshot_path)
+            if snap is not None:
+                age_days = (datetime.now().timestamp() - snap.created_at) / 86400
+                if age_days > max_age_days:
+                    return None
+                return snap if len(snap) else None
             path = self._get_cache_path()
             if not path.exists():
                 return None
@@ -69,18 +104,20 @@ class ANACSyncService:
             return None
 
     def _save_cache(self, airports: List[Dict]) -> None:
-        """Salva dados ANAC no cache para uso offline."""
+        """Salva dados ANAC no snapshot binário para uso offline (escrita atômica)."""
         try:
-            path = self._get_cache_path()
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({
-                    "airports": airports,
-                    "updated_at": datetime.utcnow().isoformat(),
-                    "source": "anac",
-                }, f, ensure_ascii=False)
+            write_snapshot(airports, self._snapshot_path)
         except Exception as e:
             print(f"Aviso: não foi possível salvar cache ANAC: {e}")
 
+    def get_from_snapshot(self, icao_code: str) -> Optional[Dict]:
+        """Busca um aeródromo no snapshot (mmap + busca binária, sem carregar a lista)."""
+        snap = open_snapshot(self._snapshot_path)
+        return snap.get(icao_code) if snap is not None else None
+
+    def has_snapshot(self) -> bool:
+        return open_snapshot(self._snapshot_path) is not None
+
     def _parse_dms_to_decimal(self, dms_str: str) -> Optional[float]:
         """Converte coordenada DMS (ex: 22°54'36,0\"S) para decimal."""
         if not dms_str or not isinstance(dms_str, str):
@@ -99,15 +136,26 @@ class ANACSyncService:
         except (ValueError, IndexError):
             return None
 
+    def _caracteristicas_rows(self) -> List[Dict]:
+        """Linhas do CSV Características Gerais, baixado e parseado uma vez por execução."""
+        if self._carac_rows is None:
+            raw = self._downloads.fetch(self.ANAC_CARAC_GERAIS_URL, timeout=120)
+            for enc in ('utf-8', 'latin-1', 'cp1252'):
+                try:
+                    content = raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                content = raw.decode('latin-1', errors='replace')
+            self._carac_rows = list(csv.DictReader(io.StringIO(content)))
+        return self._carac_rows
+
     def _download_caracteristicas_gerais(self) -> Dict[str, Dict]:
         """Baixa Características Gerais e retorna dict por Código OACI (para enriquecimento)."""
         try:
-            r = requests.get(self.ANAC_CARAC_GERAIS_URL, headers=self.HEADERS, timeout=60)
-            r.raise_for_status()
-            content = r.content.decode('latin-1')
-            reader = csv.DictReader(io.StringIO(content))
             out = {}
-            for row in reader:
+            for row in self._caracteristicas_rows():
                 code = (row.get('Código OACI') or '').strip().upper()
                 if not code or len(code) != 4:
                     continue
@@ -205,19 +253,8 @@ class ANACSyncService:
         Contém ~6800 aeródromos com nome, coordenadas, RBAC 153/107, RCD, pistas.
         """
         try:
-            r = requests.get(self.ANAC_CARAC_GERAIS_URL, headers=self.HEADERS, timeout=120)
-            r.raise_for_status()
-            for enc in ('utf-8', 'latin-1', 'cp1252'):
-                try:
-                    content = r.content.decode(enc)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                content = r.content.decode('latin-1', errors='replace')
-            reader = csv.DictReader(io.StringIO(content))
             airports = []
-            for row in reader:
+            for row in self._caracteristicas_rows():
                 a = self._normalize_caracteristicas_row(row)
                 if a:
                     airports.append(a)
@@ -256,66 +293,71 @@ class ANACSyncService:
         if data:
             return data
         # 2. Fallback: Lista ANAC + enriquecimento com Características Gerais
-        for url in self.ANAC_URLS:
-            try:
-                response = requests.get(url, headers=self.HEADERS, timeout=30)
-                response.raise_for_status()
-                for enc in ('latin-1', 'utf-8-sig', 'utf-8'):
-                    try:
-                        content = response.content.decode(enc)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                if content.strip().startswith('<!') or '<html' in content.lower()[:200]:
+        # URLs alternativas disparadas em paralelo (escalonadas): vale a primeira que responder
+        airports = hedged([lambda url=url: self._fetch_lista(url) for url in self.ANAC_URLS])
+        if not airports:
+            return None
+        carac = self._download_caracteristicas_gerais()
+        from app.seed_data import ANAC_AIRPORTS_BOOTSTRAP
+        bootstrap_by_code = {a['code']: a for a in ANAC_AIRPORTS_BOOTSTRAP}
+        for a in airports:
+            code = a['code']
+            a.setdefault('number_of_runways', 1)
+            if code in carac:
+                a.setdefault('usage_class', carac[code]['usage_class'])
+                a.setdefault('avsec_classification', carac[code]['avsec_classification'])
+                a['number_of_runways'] = carac[code]['number_of_runways']
+            if code in bootstrap_by_code:
+                b = bootstrap_by_code[code]
+                if not a.get('reference_code') and b.get('reference_code'):
+                    a['reference_code'] = b['reference_code']
+                if not a.get('category') and b.get('category'):
+                    a['category'] = b['category']
+                if not a.get('usage_class') and b.get('usage_class'):
+                    a['usage_class'] = b['usage_class']
+                if not a.get('avsec_classification') and b.get('avsec_classification'):
+                    a['avsec_classification'] = b['avsec_classification']
+                if (not a.get('number_of_runways') or a.get('number_of_runways') == 1) and b.get('number_of_runways'):
+                    a['number_of_runways'] = b['number_of_runways']
+            # Inferir aircraft_size_category de reference_code
+            if a.get('reference_code') and not a.get('aircraft_size_category'):
+                ref = a['reference_code'].upper()
+                if len(ref) >= 2:
+                    lt = ref[-1]
+                    a['aircraft_size_category'] = 'A/B' if lt in ('A','B') else 'C' if lt == 'C' else 'D'
+        self._save_cache(airports)
+        if self.db:
+            self._save_to_anac_airports_table(airports)
+        return airports
+
+    def _fetch_lista(self, url: str) -> Optional[List[Dict]]:
+        """Baixa e parseia uma URL da Lista ANAC. None se falhar ou não for um CSV válido."""
+        try:
+            raw = self._downloads.fetch(url, timeout=30)
+            for enc in ('latin-1', 'utf-8-sig', 'utf-8'):
+                try:
+                    content = raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            if content.strip().startswith('<!') or '<html' in content.lower()[:200]:
+                return None
+            lines = content.strip().split('\n')
+            if lines and 'Atualizado em' in lines[0]:
+                content = '\n'.join(lines[1:])
+            for delim in (';', ','):
+                try:
+                    csv_reader = csv.DictReader(io.StringIO(content), delimiter=delim)
+                    airports = [self._normalize_anac_data(row) for row in csv_reader]
+                    airports = [a for a in airports if a]
+                    if len(airports) >= 10:
+                        return airports
+                except Exception:
                     continue
-                lines = content.strip().split('\n')
-                if lines and 'Atualizado em' in lines[0]:
-                    content = '\n'.join(lines[1:])
-                for delim in (';', ','):
-                    try:
-                        csv_reader = csv.DictReader(io.StringIO(content), delimiter=delim)
-                        airports = [self._normalize_anac_data(row) for row in csv_reader]
-                        airports = [a for a in airports if a]
-                        if len(airports) >= 10:
-                            # Enriquecer com Características Gerais
-                            carac = self._download_caracteristicas_gerais()
-                            from app.seed_data import ANAC_AIRPORTS_BOOTSTRAP
-                            bootstrap_by_code = {a['code']: a for a in ANAC_AIRPORTS_BOOTSTRAP}
-                            for a in airports:
-                                code = a['code']
-                                a.setdefault('number_of_runways', 1)
-                                if code in carac:
-                                    a.setdefault('usage_class', carac[code]['usage_class'])
-                                    a.setdefault('avsec_classification', carac[code]['avsec_classification'])
-                                    a['number_of_runways'] = carac[code]['number_of_runways']
-                                if code in bootstrap_by_code:
-                                    b = bootstrap_by_code[code]
-                                    if not a.get('reference_code') and b.get('reference_code'):
-                                        a['reference_code'] = b['reference_code']
-                                    if not a.get('category') and b.get('category'):
-                                        a['category'] = b['category']
-                                    if not a.get('usage_class') and b.get('usage_class'):
-                                        a['usage_class'] = b['usage_class']
-                                    if not a.get('avsec_classification') and b.get('avsec_classification'):
-                                        a['avsec_classification'] = b['avsec_classification']
-                                    if (not a.get('number_of_runways') or a.get('number_of_runways') == 1) and b.get('number_of_runways'):
-                                        a['number_of_runways'] = b['number_of_runways']
-                                # Inferir aircraft_size_category de reference_code
-                                if a.get('reference_code') and not a.get('aircraft_size_category'):
-                                    ref = a['reference_code'].upper()
-                                    if len(ref) >= 2:
-                                        lt = ref[-1]
-                                        a['aircraft_size_category'] = 'A/B' if lt in ('A','B') else 'C' if lt == 'C' else 'D'
-                            self._save_cache(airports)
-                            if self.db:
-                                self._save_to_anac_airports_table(airports)
-                            return airports
-                    except Exception:
-                        continue
-            except requests.RequestException as e:
-                print(f"Erro ao baixar ANAC ({url[:60]}...): {e}")
-            except Exception as e:
-                print(f"Erro ao processar ANAC: {e}")
+        except requests.RequestException as e:
+            print(f"Erro ao baixar ANAC ({url[:60]}...): {e}")
+        except Exception as e:
+            print(f"Erro ao processar ANAC: {e}")
         return None
 
     def _save_to_anac_airports_table(self, airports: List[Dict]) -> int:
@@ -351,6 +393,8 @@ class ANACSyncService:
                     self.db.add(ANACAirport(**row))
                 count += 1
             self.db.commit()
+            search_index.invalidate()
+            geo_index.invalidate()
         except Exception as e:
             self.db.rollback()
             print(f"Erro ao salvar em anac_airports: {e}")
@@ -378,10 +422,11 @@ class ANACSyncService:
             'number_of_runways': getattr(row, 'number_of_runways', None) or 1,
         }
 
-    def get_anac_data(self, use_cache_if_live_fails: bool = True) -> Tuple[Optional[List[Dict]], str]:
+    def get_anac_data(self, use_cache_if_live_fails: bool = True) -> Tuple[Optional[Iterable[Dict]], str]:
         """
         Obtém dados ANAC: tenta download ao vivo; se falhar, usa cache.
-        Retorna (dados, origem) onde origem é 'anac' (ao vivo) ou 'anac_cache'.
+        Retorna (dados, origem) onde origem é 'anac' (ao vivo, lista) ou 'anac_cache' (snapshot,
+        iterado sob demanda: para um código só, use get_from_snapshot).
         """
         data = self.download_anac_data()
         if data:
@@ -460,83 +505,202 @@ class ANACSyncService:
         except (ValueError, AttributeError):
             return None
     
-    def sync_airports(self, anac_data: List[Dict], dry_run: bool = False) -> Dict:
+    def sync_airports(
+        self,
+        anac_data: Iterable[Dict],
+        dry_run: bool = False,
+        on_change: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
         """
         Synchronize airports with ANAC data.
-        
+
+        O dataset é versionado pelo hash do conteúdo (anac_versions): só aeroportos cuja linha
+        da ANAC mudou desde a versão anterior - ou que ainda não foram sincronizados com ela -
+        são carregados e atualizados. Sincronizar o mesmo dataset de novo não escreve nada.
+
         Args:
-            anac_data: List of normalized airport data from ANAC
+            anac_data: Normalized airport data from ANAC (lista ou snapshot, percorrido uma vez)
             dry_run: If True, don't actually update the database
-            
+            on_change: Recebe cada registro de alteração em vez de acumulá-los em results['changes']
+
         Returns:
             Dictionary with sync results
         """
-        results = {
+        results = self.new_sync_results()
+        for change in self.iter_sync_airports(anac_data, dry_run=dry_run, results=results):
+            if on_change:
+                on_change(change)
+            else:
+                results['changes'].append(change)
+        return results
+
+    @staticmethod
+    def new_sync_results() -> Dict:
+        return {
             'created': 0,
             'updated': 0,
             'skipped': 0,
             'errors': 0,
+            'removed_upstream': [],
+            'dataset_version': None,
+            'previous_version': None,
+            'compliance': None,
             'changes': []
         }
-        
+
+    def _preload_airports(self, codes: List[str]) -> Dict[str, Airport]:
+        """code -> Airport dos códigos pedidos: uma consulta (tabela inteira se forem muitos, senão IN)."""
+        if not codes:
+            return {}
+        if len(codes) > self.SYNC_BATCH_SIZE:
+            wanted = set(codes)
+            return {a.code: a for a in self.db.query(Airport) if a.code in wanted}
+        return {a.code: a for a in self.db.query(Airport).filter(Airport.code.in_(codes))}
+
+    def iter_sync_airports(
+        self,
+        anac_data: Iterable[Dict],
+        dry_run: bool = False,
+        results: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Executa a sincronização gerando os registros de alteração à medida que acontecem
+        (para respostas em streaming). Contadores e versões ficam em `results`; o commit é
+        feito ao final da iteração.
+        """
+        if results is None:
+            results = self.new_sync_results()
         if not anac_data:
-            return results
-        
+            return
+
+        previous = latest_version(self.db)
+        previous_version = previous.version if previous else None
+        results['previous_version'] = previous_version
+
         try:
+            old_hashes = decode_hashes(previous.row_hashes) if previous else {}
+            # Uma consulta leve: quais códigos já estão cadastrados e com qual versão foram sincronizados
+            synced_version = {
+                code: v for code, v in self.db.query(Airport.code, Airport.versao_dados_anac)
+            }
+
+            # Uma passada pelos dados (o snapshot é decodificado registro a registro): guarda o
+            # hash de cada linha e só as linhas que vão criar ou atualizar um aeroporto
+            hashes: Dict[str, str] = {}
+            rows_by_code: Dict[str, Dict] = {}
             for airport_data in anac_data:
+                code = (airport_data.get('code') or '').upper()
+                if not code:
+                    continue
+                hashes[code] = h = row_hash(airport_data)
+                if code not in synced_version or old_hashes.get(code) != h or synced_version[code] != previous_version:
+                    rows_by_code[code] = airport_data
+                else:
+                    rows_by_code.pop(code, None)
+            content_hash = content_hash_of(hashes)
+            version = version_label(content_hash)
+            results['dataset_version'] = version
+            added, changed, removed = diff_hashes(old_hashes, hashes)
+            results['removed_upstream'] = sorted(removed)
+
+            to_create = [c for c in rows_by_code if c not in synced_version]
+            to_update = sorted(c for c in rows_by_code if c in synced_version)
+            results['skipped'] = len(hashes) - len(to_create) - len(to_update)
+
+            self._dataset_version = version
+            airports = self._preload_airports(to_update)
+            failed: List[str] = []
+            for code in to_update:
+                existing = airports[code]
                 try:
-                    # Find existing airport by ICAO code
-                    existing = self.db.query(Airport).filter(
-                        Airport.code == airport_data['code']
-                    ).first()
-                    
-                    if existing:
-                        # Update existing airport
-                        changes = self._update_airport(existing, airport_data, dry_run)
-                        if changes:
-                            results['updated'] += 1
-                            results['changes'].append({
-                                'airport_id': existing.id,
-                                'code': existing.code,
-                                'action': 'updated',
-                                'changes': changes
-                            })
-                        else:
-                            results['skipped'] += 1
-                    else:
-                        # Create new airport
-                        if not dry_run:
-                            new_airport = self._create_airport(airport_data)
-                            if new_airport:
-                                self.db.add(new_airport)
-                                results['created'] += 1
-                                results['changes'].append({
-                                    'code': airport_data['code'],
-                                    'action': 'created',
-                                    'name': airport_data['name']
-                                })
-                        else:
-                            results['created'] += 1
-                            
+                    changes = self._update_airport(existing, rows_by_code[code], dry_run)
                 except Exception as e:
-                    print(f"⚠️  Erro ao processar aeroporto {airport_data.get('code', 'UNKNOWN')}: {e}")
+                    print(f"⚠️  Erro ao processar aeroporto {code}: {e}")
                     results['errors'] += 1
-            
-            if not dry_run:
+                    # Fica na versão anterior (e sem alterações parciais): a próxima sincronização tenta de novo
+                    failed.append(code)
+                    if not dry_run:
+                        self.db.expire(existing)
+                    continue
+                if changes:
+                    results['updated'] += 1
+                    yield {
+                        'airport_id': existing.id,
+                        'code': existing.code,
+                        'action': 'updated',
+                        'changes': changes
+                    }
+                else:
+                    results['skipped'] += 1
+
+            pending = []
+            for code in to_create:
+                if dry_run:
+                    results['created'] += 1
+                    continue
+                mapping = self._airport_mapping(rows_by_code[code])
+                if not mapping:
+                    results['errors'] += 1
+                    continue
+                pending.append(mapping)
+                if len(pending) >= self.SYNC_INSERT_BATCH_SIZE:
+                    yield from self._insert_airports(pending, results)
+                    pending = []
+            if pending:
+                yield from self._insert_airports(pending, results)
+
+            if not dry_run and (to_create or to_update or version != previous_version):
+                if previous_version and version != previous_version:
+                    # Aeroportos não tocados estão em dia com o dataset novo: só troca a versão (1 UPDATE)
+                    query = self.db.query(Airport).filter(Airport.versao_dados_anac == previous_version)
+                    if removed:
+                        query = query.filter(Airport.code.notin_(list(removed)))
+                    if failed:
+                        query = query.filter(Airport.code.notin_(failed))
+                    query.update({Airport.versao_dados_anac: version}, synchronize_session=False)
+                if version != previous_version:
+                    record_version(self.db, content_hash, hashes, changed_count=len(added) + len(changed))
                 self.db.commit()
-            
-            return results
-            
+                results['compliance'] = self.apply_change_events()
+
         except Exception as e:
             if not dry_run:
                 self.db.rollback()
             print(f"❌ Erro durante sincronização: {e}")
             results['errors'] += 1
-            return results
-    
+        finally:
+            self._dataset_version = None
+
+    def apply_change_events(self) -> Dict:
+        """
+        Consome self.change_events: recalcula aplicabilidade e registros de conformidade só dos
+        aeroportos afetados, num lote (depois do commit da sincronização).
+        """
+        events, self.change_events = self.change_events, []
+        airport_ids = sorted({e['airport_id'] for e in events})
+        try:
+            return ComplianceEngine(self.db).reconcile_airports(
+                airport_ids, regenerate_action_items=True, reason="sincronização ANAC"
+            )
+        except Exception as e:
+            self.db.rollback()
+            print(f"⚠️  Erro ao recalcular conformidade após sincronização: {e}")
+            return {'airports': 0, 'error': str(e)}
+
+    def _insert_airports(self, mappings: List[Dict], results: Dict) -> Iterator[Dict]:
+        """Insere um lote de aeroportos novos (bulk_insert_mappings) e gera os registros 'created'."""
+        self.db.bulk_insert_mappings(Airport, mappings)
+        results['created'] += len(mappings)
+        for mapping in mappings:
+            yield {'code': mapping['code'], 'action': 'created', 'name': mapping['name']}
+
     def _update_airport(self, airport: Airport, anac_data: Dict, dry_run: bool) -> List[str]:
-        """Update airport with ANAC data and return list of changed fields. Propagates usage_class, size, annual_passengers."""
+        """
+        Update airport with ANAC data and return list of changed fields. Propagates usage_class, size, annual_passengers.
+        Alterações em campos que mudam a aplicabilidade das normas geram um evento em self.change_events.
+        """
         changes = []
+        before = {f: getattr(airport, f) for f in APPLICABILITY_FIELDS}
 
         # Update name if different
         if anac_data.get('name') and airport.name != anac_data['name']:
@@ -622,13 +786,24 @@ class ANACSyncService:
         if not dry_run:
             airport.data_sincronizacao_anac = datetime.utcnow()
             airport.origem_dados = 'anac'
+            if self._dataset_version:
+                airport.versao_dados_anac = self._dataset_version
             if anac_data.get('status'):
                 airport.status_operacional = anac_data['status']
+            changed = {
+                f: [_event_value(old), _event_value(getattr(airport, f))]
+                for f, old in before.items() if getattr(airport, f) != old
+            }
+            if changed:
+                self.change_events.append({'airport_id': airport.id, 'code': airport.code, 'fields': changed})
 
         return changes
     
-    def _create_airport(self, anac_data: Dict) -> Optional[Airport]:
-        """Create a new airport from ANAC data. Uses usage_class (RBAC 153) for size/annual_passengers."""
+    def _airport_mapping(self, anac_data: Dict) -> Optional[Dict]:
+        """
+        Colunas de um aeroporto novo a partir da linha ANAC (para bulk_insert_mappings). Usa
+        usage_class (RBAC 153) para size/annual_passengers.
+        """
         try:
             usage_class = anac_data.get('usage_class')
             if usage_class:
@@ -647,7 +822,7 @@ class ANACSyncService:
                 except KeyError:
                     pass
 
-            airport = Airport(
+            return dict(
                 name=anac_data['name'],
                 code=anac_data['code'],
                 size=size,
@@ -666,15 +841,14 @@ class ANACSyncService:
                 codigo_iata=anac_data.get('iata_code'),
                 data_sincronizacao_anac=datetime.utcnow(),
                 origem_dados='anac',
+                versao_dados_anac=self._dataset_version,
                 status_operacional=anac_data.get('status'),
             )
 
-            return airport
-
         except Exception as e:
             print(f"⚠️  Erro ao criar aeroporto: {e}")
             return None
-    
+
     def _infer_from_usage_class(self, usage_class: Optional[str]) -> Tuple[AirportSize, int]:
         """
         Infer size and annual_passengers from usage_class (RBAC 153).
@@ -0,0 +1,73 @@
+"""
+Versionamento do dataset da ANAC usado na sincronização de aeroportos (sync_airports).
+
+Cada linha normalizada tem um hash dos campos que a sincronização aplica (SYNC_FIELDS); o
+dataset inteiro é identificado pelo hash das linhas ordenadas por ICAO. A versão aplicada é
+gravada em anac_dataset_versions junto com os hashes das linhas, e a sincronização seguinte
+compara os hashes novos com os da versão anterior em memória: só aeroportos com linha nova
+ou alterada (ou ainda não sincronizados com a versão anterior) são tocados.
+"""
+import gzip
+import hashlib
+import json
+from typing import Dict, Optional, Set, Tuple
+
+from app.models import ANACDatasetVersion
+
+# Campos da linha normalizada que _update_airport/_airport_mapping aplicam no cadastro
+SYNC_FIELDS = (
+    "name", "usage_class", "avsec_classification", "category", "reference_code",
+    "aircraft_size_category", "number_of_runways", "city", "state", "latitude", "longitude",
+    "status", "iata_code",
+)
+VERSION_LENGTH = 16
+
+
+def row_hash(data: Dict) -> str:
+    payload = json.dumps([data.get(f) for f in SYNC_FIELDS], ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash_of(hashes: Dict[str, str]) -> str:
+    """Hash do dataset a partir de {ICAO: hash da linha} (linhas ordenadas por ICAO)."""
+    digest = hashlib.sha256()
+    for code in sorted(hashes):
+        digest.update(f"{code}:{hashes[code]}\n".encode("ascii", "replace"))
+    return digest.hexdigest()
+
+
+def version_label(content_hash: str) -> str:
+    return content_hash[:VERSION_LENGTH]
+
+
+def encode_hashes(hashes: Dict[str, str]) -> bytes:
+    return gzip.compress(json.dumps(hashes, separators=(",", ":"), sort_keys=True).encode("utf-8"), mtime=0)
+
+
+def decode_hashes(data: Optional[bytes]) -> Dict[str, str]:
+    return json.loads(gzip.decompress(data).decode("utf-8")) if data else {}
+
+
+def latest_version(db) -> Optional[ANACDatasetVersion]:
+    return db.query(ANACDatasetVersion).order_by(ANACDatasetVersion.id.desc()).first()
+
+
+def diff_hashes(old: Dict[str, str], new: Dict[str, str]) -> Tuple[Set[str], Set[str], Set[str]]:
+    """(novos, alterados, removidos) entre dois mapas {ICAO: hash}."""
+    added = {c for c in new if c not in old}
+    changed = {c for c, h in new.items() if c in old and old[c] != h}
+    removed = {c for c in old if c not in new}
+    return added, changed, removed
+
+
+def record_version(db, content_hash: str, hashes: Dict[str, str], changed_count: Optional[int] = None) -> ANACDatasetVersion:
+    """Adiciona a versão à sessão (quem chama faz o commit)."""
+    version = ANACDatasetVersion(
+        version=version_label(content_hash),
+        content_hash=content_hash,
+        record_count=len(hashes),
+        changed_count=changed_count,
+        row_hashes=encode_hashes(hashes),
+    )
+    db.add(version)
+    return version
@@ -0,0 +1,109 @@
+"""
+Armazenamento de anexos endereçado por conteúdo (SHA-256), com deduplicação.
+
+O mesmo certificado/relatório anexado em vários registros e aeroportos é gravado uma vez em
+uploads/blobs/<aa>/<bb>/<sha256>; cada DocumentAttachment aponta para o blob (file_path) e a
+tabela blobs conta as referências:
+  - add_reference: upload de conteúdo já existente só incrementa ref_count e descarta o
+    temporário (sem escrever no disco)
+  - remover um DocumentAttachment (endpoint ou cascata do aeroporto/registro) decrementa
+    ref_count via evento do ORM
+  - collect_garbage apaga blobs sem referências há mais de BLOB_GC_GRACE_SECONDS (a carência
+    evita apagar um blob que um upload concorrente acabou de voltar a referenciar)
+
+Anexos antigos (uploads/record_<id>/<uuid>) continuam onde estão. Os blobs ficam no
+armazenamento configurado (disco ou S3; app/services/storage.py), na mesma chave.
+"""
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import event, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Blob, DocumentAttachment
+from app.services.storage import as_storage
+from app.services.thumbnails import thumbnail_key
+from app.services.uploads import StagedUpload
+
+BLOBS_DIRNAME = "blobs"
+BLOB_GC_GRACE_SECONDS = int(os.getenv("BLOB_GC_GRACE_SECONDS", "3600"))
+
+
+def blob_key(sha256: str) -> str:
+    return f"{BLOBS_DIRNAME}/{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def blob_path(uploads_dir: Path, sha256: str) -> Path:
+    return Path(uploads_dir) / blob_key(sha256)
+
+
+def is_blob_path(path) -> bool:
+    """True se o file_path de um anexo aponta para o armazenamento por conteúdo."""
+    parts = Path(path).parts
+    return len(parts) >= 4 and parts[-4] == BLOBS_DIRNAME and parts[-1][:2] == parts[-3]
+
+
+def add_reference(db, staged: StagedUpload, storage) -> str:
+    """
+    Registra uma referência ao conteúdo do upload e retorna o file_path do blob (storage: um
+    armazenamento ou o diretório de uploads). Chame antes de adicionar outros objetos à
+    sessão: em corrida com outro upload do mesmo conteúdo novo, a sessão é revertida e a
+    referência refeita como incremento. O commit fica com quem chama.
+    """
+    storage = as_storage(storage)
+    key = blob_key(staged.sha256)
+    path = storage.locator(key)
+    now = datetime.utcnow()
+    increment = (
+        update(Blob).where(Blob.sha256 == staged.sha256)
+        .values(ref_count=Blob.ref_count + 1, last_referenced_at=now)
+    )
+    if db.execute(increment).rowcount:
+        if storage.exists(path):
+            staged.discard()
+        else:
+            storage.put(staged, key)  # Arquivo sumiu do armazenamento: restaura com o conteúdo recebido
+        return path
+    storage.put(staged, key)
+    db.add(Blob(sha256=staged.sha256, size=staged.size, ref_count=1, created_at=now, last_referenced_at=now))
+    try:
+        db.flush()
+    except IntegrityError:
+        # Outro upload do mesmo conteúdo criou o blob primeiro (o arquivo é idêntico)
+        db.rollback()
+        db.execute(increment)
+    return path
+
+
+@event.listens_for(DocumentAttachment, "after_delete")
+def _release_reference(mapper, connection, target):
+    """Anexo removido (direto ou em cascata): decrementa as referências do blob."""
+    if target.sha256 and is_blob_path(target.file_path):
+        connection.execute(
+            update(Blob).where(Blob.sha256 == target.sha256, Blob.ref_count > 0)
+            .values(ref_count=Blob.ref_count - 1, last_referenced_at=datetime.utcnow())
+        )
+
+
+def collect_garbage(db, storage, grace_seconds: int = BLOB_GC_GRACE_SECONDS,
+                    dry_run: bool = False, now: Optional[datetime] = None) -> Dict:
+    """
+    Apaga blobs sem referências há mais de grace_seconds (storage: um armazenamento ou o
+    diretório de uploads). Retorna quantidade e bytes liberados.
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(seconds=grace_seconds)
+    orphans = db.query(Blob).filter(Blob.ref_count <= 0, Blob.last_referenced_at < cutoff).all()
+    result = {"blobs": len(orphans), "bytes": sum(b.size for b in orphans), "dry_run": dry_run}
+    if dry_run or not orphans:
+        return result
+    storage = as_storage(storage)
+    for blob in orphans:
+        # Reconfere na hora de apagar: um upload pode ter voltado a referenciar o blob
+        deleted = db.query(Blob).filter(Blob.sha256 == blob.sha256, Blob.ref_count <= 0).delete(synchronize_session=False)
+        if deleted:
+            storage.delete(storage.locator(blob_key(blob.sha256)))
+            storage.delete(storage.locator(thumbnail_key(blob.sha256)))
+    db.commit()
+    return result
@@ -0,0 +1,77 @@
+"""
+Anexos de um aeroporto inteiro (GET /api/airports/{id}/documents), em vez de uma requisição
+por registro (GET /api/compliance/records/{id}/documents) na página de conformidade.
+
+  - airport_documents: todos os anexos agrupados por registro, numa consulta com join
+  - document_counts: contagem por registro (GROUP BY), embutida nas respostas de conformidade
+    (document_count em cada registro) e no modo summary do endpoint
+"""
+from typing import Dict, List
+
+from sqlalchemy import func
+
+from app.models import ComplianceRecord, DocumentAttachment, Regulation
+
+
+def document_counts(db, airport_id: int) -> Dict[int, int]:
+    """{id do registro: quantidade de anexos} dos registros do aeroporto que têm anexos."""
+    rows = (
+        db.query(DocumentAttachment.compliance_record_id, func.count(DocumentAttachment.id))
+        .join(ComplianceRecord, DocumentAttachment.compliance_record_id == ComplianceRecord.id)
+        .filter(ComplianceRecord.airport_id == airport_id)
+        .group_by(DocumentAttachment.compliance_record_id)
+    )
+    return dict(rows)
+
+
+def document_summary(db, airport_id: int) -> List[Dict]:
+    """Por registro com anexos: norma, quantidade e data do último upload (sem os anexos)."""
+    rows = (
+        db.query(
+            ComplianceRecord.id, ComplianceRecord.regulation_id, Regulation.code,
+            func.count(DocumentAttachment.id), func.max(DocumentAttachment.uploaded_at),
+        )
+        .join(DocumentAttachment, DocumentAttachment.compliance_record_id == ComplianceRecord.id)
+        .join(Regulation, ComplianceRecord.regulation_id == Regulation.id)
+        .filter(ComplianceRecord.airport_id == airport_id)
+        .group_by(ComplianceRecord.id, ComplianceRecord.regulation_id, Regulation.code)
+        .order_by(ComplianceRecord.id)
+    )
+    return [
+        {
+            "compliance_record_id": record_id,
+            "regulation_id": regulation_id,
+            "regulation_code": code,
+            "document_count": count,
+            "last_uploaded_at": last_uploaded_at,
+        }
+        for record_id, regulation_id, code, count, last_uploaded_at in rows
+    ]
+
+
+def airport_documents(db, airport_id: int) -> List[Dict]:
+    """Anexos do aeroporto agrupados por registro (ordem: registro, data do upload)."""
+    rows = (
+        db.query(DocumentAttachment, ComplianceRecord.regulation_id, Regulation.code)
+        .join(ComplianceRecord, DocumentAttachment.compliance_record_id == ComplianceRecord.id)
+        .join(Regulation, ComplianceRecord.regulation_id == Regulation.id)
+        .filter(ComplianceRecord.airport_id == airport_id)
+        .order_by(ComplianceRecord.id, DocumentAttachment.uploaded_at, DocumentAttachment.id)
+    )
+    groups: Dict[int, Dict] = {}
+    for doc, regulation_id, code in rows:
+        group = groups.get(doc.compliance_record_id)
+        if group is None:
+            group = groups[doc.compliance_record_id] = {
+                "compliance_record_id": doc.compliance_record_id,
+                "regulation_id": regulation_id,
+                "regulation_code": code,
+                "document_count": 0,
+                "last_uploaded_at": None,
+                "documents": [],
+            }
+        group["documents"].append(doc)
+        group["document_count"] += 1
+        if doc.uploaded_at and (group["last_uploaded_at"] is None or doc.uploaded_at > group["last_uploaded_at"]):
+            group["last_uploaded_at"] = doc.uploaded_at
+    return list(groups.values())
@@ -0,0 +1,421 @@
+"""
+Busca textual nas evidências (GET /api/documents/search): qual anexo menciona CCI, PLEM, PCINC...
+
+Extração de texto (extract_text), por formato:
+  - DOCX: XML do corpo (word/document.xml) dentro do zip
+  - XLSX: textos das células (xl/sharedStrings.xml e strings inline das planilhas)
+  - PDF: texto dos operadores Tj/TJ dos content streams (PDFs gerados com texto; PDFs
+    escaneados não têm texto). Com pypdf instalado (opcional), usa o extrator dele.
+  - demais formatos (imagens, DOC/XLS binários): sem texto
+
+Após o upload, a extração roda num pool de processos (TEXT_EXTRACT_WORKERS; o parse é CPU e
+não disputa o GIL com os workers HTTP). O texto é guardado uma vez por conteúdo
+(document_texts, pelo SHA-256) e indexado:
+  - SQLite: tabela FTS5 document_text_fts (external content sobre document_texts, mantida por
+    triggers; tokenizer unicode61 sem acentos), ranking bm25
+  - PostgreSQL: índice GIN em to_tsvector(DOCUMENT_SEARCH_PG_CONFIG, content), ranking ts_rank
+  - sem FTS5: varredura com LIKE (reserva)
+A busca junta o texto aos anexos e registros, com filtro opcional por aeroporto e norma.
+"""
+import io
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Airport, ComplianceRecord, DocumentAttachment, DocumentText, Regulation
+from app.services.uploads import file_extension
+
+try:
+    import pypdf
+except ImportError:  # opcional: sem pypdf usa o extrator simples de PDF
+    pypdf = None
+
+TEXT_EXTRACT_WORKERS = int(os.getenv("TEXT_EXTRACT_WORKERS", "2"))
+DOCUMENT_TEXT_MAX_CHARS = int(os.getenv("DOCUMENT_TEXT_MAX_CHARS", "500000"))
+DOCUMENT_SEARCH_PG_CONFIG = os.getenv("DOCUMENT_SEARCH_PG_CONFIG", "portuguese")
+TEXT_EXTENSIONS = {".docx", ".xlsx", ".pdf"}
+# Membro do zip maior que isso não é lido (proteção contra zip bomb)
+_ZIP_MEMBER_MAX_BYTES = 64 * 1024 * 1024
+FTS_TABLE = "document_text_fts"
+_SNIPPET_START, _SNIPPET_END = "«", "»"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_S = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+# --------------------------------------------------------------------------
+# Extração
+# --------------------------------------------------------------------------
+
+def _zip_member(zf: zipfile.ZipFile, name: str) -> Optional[bytes]:
+    try:
+        info = zf.getinfo(name)
+    except KeyError:
+        return None
+    return zf.read(info) if info.file_size <= _ZIP_MEMBER_MAX_BYTES else None
+
+
+def _docx_text(zf: zipfile.ZipFile) -> str:
+    xml = _zip_member(zf, "word/document.xml")
+    if xml is None:
+        return ""
+    parts = []
+    for event, elem in ElementTree.iterparse(io.BytesIO(xml), events=("end",)):
+        if elem.tag == f"{_W}t" and elem.text:
+            parts.append(elem.text)
+        elif elem.tag == f"{_W}tab":
+            parts.append("\t")
+        elif elem.tag in (f"{_W}p", f"{_W}br"):
+            parts.append("\n")
+            elem.clear()
+    return "".join(parts)
+
+
+def _xlsx_text(zf: zipfile.ZipFile) -> str:
+    names = ["xl/sharedStrings.xml"] + sorted(n for n in zf.namelist() if n.startswith("xl/worksheets/sheet"))
+    parts = []
+    for name in names:
+        xml = _zip_member(zf, name)
+        if xml is None:
+            continue
+        for event, elem in ElementTree.iterparse(io.BytesIO(xml), events=("end",)):
+            if elem.tag == f"{_S}t" and elem.text:
+                parts.append(elem.text)
+            elif elem.tag in (f"{_S}si", f"{_S}row"):
+                elem.clear()
+    return "\n".join(parts)
+
+
+_PDF_STREAM = re.compile(rb"stream\r?\n(.*?)endstream", re.S)
+_PDF_TEXT_BLOCK = re.compile(rb"BT(.*?)ET", re.S)
+_PDF_TEXT_OP = re.compile(rb"\[((?:\\.|[^\]\\])*)\]\s*TJ|\(((?:\\.|[^)\\])*)\)\s*(?:Tj|'|\")", re.S)
+_PDF_ARRAY_ITEM = re.compile(rb"\(((?:\\.|[^)\\])*)\)|(-?\d+(?:\.\d+)?)")
+_PDF_ESCAPE = re.compile(rb"\\([nrtbf()\\]|[0-7]{1,3}|\r?\n)")
+_PDF_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f", b"(": b"(", b")": b")", b"\\": b"\\"}
+
+
+def _pdf_string(raw: bytes) -> str:
+    def repl(m):
+        code = m.group(1)
+        if code in _PDF_ESCAPES:
+            return _PDF_ESCAPES[code]
+        if code[:1].isdigit():
+            return bytes([int(code, 8) & 0xFF])
+        return b""  # Quebra de linha escapada
+    return _PDF_ESCAPE.sub(repl, raw).decode("latin-1")
+
+
+def _pdf_text(data: bytes) -> str:
+    if pypdf is not None:
+        reader = pypdf.PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    lines = []
+    for match in _PDF_STREAM.finditer(data):
+        stream = match.group(1)
+        try:
+            stream = zlib.decompress(stream)
+        except zlib.error:
+            pass  # Stream sem compressão (ou outro filtro: os operadores não aparecem)
+        for block in _PDF_TEXT_BLOCK.finditer(stream):
+            words = []
+            for op in _PDF_TEXT_OP.finditer(block.group(1)):
+                if op.group(2) is not None:
+                    words.append(_pdf_string(op.group(2)))
+                    continue
+                # TJ: deslocamentos grandes (negativos) entre strings separam palavras
+                for item in _PDF_ARRAY_ITEM.finditer(op.group(1)):
+                    if item.group(1) is not None:
+                        words.append(_pdf_string(item.group(1)))
+                    elif float(item.group(2)) <= -200:
+                        words.append(" ")
+            if words:
+                lines.append("".join(words))
+    return "\n".join(lines)
+
+
+def extract_text(source, ext: str) -> str:
+    """
+    Texto de um anexo (source: caminho no disco ou bytes). Roda no pool de processos: só
+    recebe e devolve tipos simples. Limitado a DOCUMENT_TEXT_MAX_CHARS caracteres.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            source = f.read()
+    if ext == ".pdf":
+        content = _pdf_text(source)
+    else:
+        with zipfile.ZipFile(io.BytesIO(source)) as zf:
+            content = _docx_text(zf) if ext == ".docx" else _xlsx_text(zf)
+    content = re.sub(r"[ \t\r\f\v]+", " ", content)
+    content = re.sub(r"\s*\n\s*", "\n", content).strip()
+    return content[:DOCUMENT_TEXT_MAX_CHARS]
+
+
+# --------------------------------------------------------------------------
+# Indexação
+# --------------------------------------------------------------------------
+
+def ensure_search_index(engine) -> None:
+    """Cria o índice textual (FTS5 no SQLite, GIN de tsvector no PostgreSQL). Ignora falhas."""
+    if engine.dialect.name == "sqlite":
+        statements = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(content, content='document_texts', "
+            "content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS document_texts_ai AFTER INSERT ON document_texts BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.rowid, new.content); END",
+            f"CREATE TRIGGER IF NOT EXISTS document_texts_ad AFTER DELETE ON document_texts BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.rowid, old.content); END",
+            f"CREATE TRIGGER IF NOT EXISTS document_texts_au AFTER UPDATE ON document_texts BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.rowid, old.content); "
+            f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.rowid, new.content); END",
+            # Textos gravados antes do índice existir
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+        ]
+    elif engine.dialect.name == "postgresql":
+        statements = [
+            "CREATE INDEX IF NOT EXISTS ix_document_texts_fts ON document_texts "
+            f"USING gin (to_tsvector('{_pg_config()}', coalesce(content, '')))",
+        ]
+    else:
+        return
+    try:
+        with engine.connect() as conn:
+            for sql in statements:
+                conn.execute(text(sql))
+            conn.commit()
+    except Exception as e:
+        print(f"  busca em documentos: índice textual indisponível ({e}); a busca usa varredura")
+
+
+def _pg_config() -> str:
+    if not re.fullmatch(r"[a-z_]+", DOCUMENT_SEARCH_PG_CONFIG):
+        raise ValueError(f"DOCUMENT_SEARCH_PG_CONFIG inválido: {DOCUMENT_SEARCH_PG_CONFIG!r}")
+    return DOCUMENT_SEARCH_PG_CONFIG
+
+
+def _read_source(storage, document):
+    """Caminho local (o processo filho lê) ou os bytes (armazenamento remoto)."""
+    local = storage.local_path(document.file_path)
+    if local:
+        return local
+    with storage.open(document.file_path) as f:
+        return f.read()
+
+
+def index_document(db, storage, document, pool=None) -> str:
+    """
+    Extrai e grava o texto do conteúdo do anexo (uma vez por SHA-256). pool: executor onde
+    rodar extract_text (None = no próprio processo). Retorna o status.
+    """
+    if not document.sha256:
+        return "unsupported"
+    existing = db.get(DocumentText, document.sha256)
+    if existing is not None:
+        return existing.status
+    ext = file_extension(document.filename)
+    content = None
+    if ext not in TEXT_EXTENSIONS:
+        status = "unsupported"
+    else:
+        try:
+            source = _read_source(storage, document)
+        except OSError:
+            return "error"  # Arquivo ausente: não grava, uma reindexação tenta de novo
+        try:
+            content = pool.submit(extract_text, source, ext).result() if pool else extract_text(source, ext)
+            status = "ok" if content else "empty"
+        except Exception as e:  # Arquivo corrompido ou formato inesperado
+            print(f"⚠ texto do anexo {document.id}: {e}")
+            status = "error"
+        content = content or None
+    db.add(DocumentText(sha256=document.sha256, status=status, content=content, extracted_at=datetime.utcnow()))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # Outro worker indexou o mesmo conteúdo
+    return status
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_jobs: Optional[ThreadPoolExecutor] = None
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+class _DocumentRef:
+    __slots__ = ("id", "filename", "file_path", "sha256")
+
+    def __init__(self, document):
+        for name in self.__slots__:
+            setattr(self, name, getattr(document, name))
+
+
+def schedule(storage, document, session_factory: Optional[Callable] = None) -> bool:
+    """
+    Indexa o anexo em background: leitura numa thread, extração no pool de processos.
+    session_factory: sessões para gravar o texto (padrão: SessionLocal).
+    """
+    global _process_pool, _jobs
+    if not document.sha256 or file_extension(document.filename) not in TEXT_EXTENSIONS:
+        return False
+    with _pending_lock:
+        if document.sha256 in _pending:
+            return False
+        _pending.add(document.sha256)
+        if _jobs is None:
+            # spawn: o processo HTTP tem threads; fork poderia herdar locks em uso
+            _process_pool = ProcessPoolExecutor(TEXT_EXTRACT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+            _jobs = ThreadPoolExecutor(TEXT_EXTRACT_WORKERS, thread_name_prefix="document-text")
+    snapshot = _DocumentRef(document)
+
+    def job():
+        if session_factory is None:
+            from app.database import SessionLocal
+            db = SessionLocal()
+        else:
+            db = session_factory()
+        try:
+            index_document(db, storage, snapshot, pool=_process_pool)
+        except Exception as e:
+            print(f"⚠ indexação do anexo {snapshot.id}: {e}")
+        finally:
+            db.close()
+            with _pending_lock:
+                _pending.discard(snapshot.sha256)
+
+    _jobs.submit(job)
+    return True
+
+
+def unindexed_documents(db) -> List[DocumentAttachment]:
+    """Anexos com conteúdo ainda sem texto extraído (anteriores à busca ou com falha de leitura)."""
+    indexed = select(DocumentText.sha256)
+    return (
+        db.query(DocumentAttachment)
+        .filter(DocumentAttachment.sha256.isnot(None), DocumentAttachment.sha256.notin_(indexed))
+        .all()
+    )
+
+
+# --------------------------------------------------------------------------
+# Busca
+# --------------------------------------------------------------------------
+
+def _terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query or "")
+
+
+def _scope(airport_id: Optional[int], regulation_id: Optional[int]) -> Tuple[str, Dict]:
+    sql, params = "", {}
+    if airport_id is not None:
+        sql += " AND r.airport_id = :airport_id"
+        params["airport_id"] = airport_id
+    if regulation_id is not None:
+        sql += " AND r.regulation_id = :regulation_id"
+        params["regulation_id"] = regulation_id
+    return sql, params
+
+
+def _has_fts(db) -> bool:
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+    ).first() is not None
+
+
+def _snippet(content: str, terms: List[str], width: int = 80) -> str:
+    """Trecho ao redor do primeiro termo encontrado (busca de reserva, sem FTS)."""
+    lowered = content.lower()
+    hits = [lowered.find(t.lower()) for t in terms if lowered.find(t.lower()) >= 0]
+    start = max(0, min(hits) - width // 2) if hits else 0
+    excerpt = content[start:start + width].replace("\n", " ")
+    return ("…" if start else "") + excerpt + ("…" if start + width < len(content) else "")
+
+
+def _matches(db, terms: List[str], scope: str, params: Dict, limit: int) -> List[Tuple[int, str]]:
+    """[(id do anexo, trecho)] por relevância."""
+    joins = (
+        "JOIN document_attachments d ON d.sha256 = t.sha256 "
+        "JOIN compliance_records r ON r.id = d.compliance_record_id"
+    )
+    params = {**params, "limit": limit}
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite" and _has_fts(db):
+        # Termos entre aspas (sem operadores do FTS5); o último também como prefixo
+        params["match"] = " ".join(f'"{t}"' for t in terms[:-1]) + f' "{terms[-1]}"*'
+        rows = db.execute(text(
+            f"SELECT d.id, snippet({FTS_TABLE}, 0, '{_SNIPPET_START}', '{_SNIPPET_END}', '…', 16) "
+            f"FROM {FTS_TABLE} f JOIN document_texts t ON t.rowid = f.rowid {joins} "
+            f"WHERE {FTS_TABLE} MATCH :match{scope} ORDER BY bm25({FTS_TABLE}), d.id LIMIT :limit"
+        ), params)
+        return [tuple(row) for row in rows]
+    if dialect == "postgresql":
+        config = _pg_config()
+        params["query"] = " ".join(terms)
+        rows = db.execute(text(
+            f"SELECT m.id, ts_headline('{config}', m.content, plainto_tsquery('{config}', :query), "
+            f"'StartSel={_SNIPPET_START}, StopSel={_SNIPPET_END}, MaxWords=24, MinWords=8') FROM ("
+            f"SELECT d.id, t.content, ts_rank(to_tsvector('{config}', coalesce(t.content, '')), "
+            f"plainto_tsquery('{config}', :query)) AS rank FROM document_texts t {joins} "
+            f"WHERE to_tsvector('{config}', coalesce(t.content, '')) @@ plainto_tsquery('{config}', :query){scope} "
+            f"ORDER BY rank DESC, d.id LIMIT :limit) m ORDER BY m.rank DESC, m.id"
+        ), params)
+        return [tuple(row) for row in rows]
+    # Reserva: varredura
+    like = ""
+    for i, term in enumerate(terms):
+        like += f" AND lower(t.content) LIKE :term{i}"
+        params[f"term{i}"] = f"%{term.lower()}%"
+    rows = db.execute(text(
+        f"SELECT d.id, t.content FROM document_texts t {joins} "
+        f"WHERE t.content IS NOT NULL{like}{scope} ORDER BY d.id LIMIT :limit"
+    ), params)
+    return [(doc_id, _snippet(content, terms)) for doc_id, content in rows]
+
+
+def search_documents(db, query: str, airport_id: Optional[int] = None, regulation_id: Optional[int] = None,
+                     limit: int = 20) -> List[Dict]:
+    """Anexos cujo texto contém todos os termos, com trecho, aeroporto e norma."""
+    terms = _terms(query)
+    if not terms:
+        return []
+    scope, params = _scope(airport_id, regulation_id)
+    matches = _matches(db, terms, scope, params, limit)
+    if not matches:
+        return []
+    rows = {
+        doc.id: (doc, record, airport, regulation)
+        for doc, record, airport, regulation in db.query(DocumentAttachment, ComplianceRecord, Airport, Regulation)
+        .join(ComplianceRecord, DocumentAttachment.compliance_record_id == ComplianceRecord.id)
+        .join(Airport, ComplianceRecord.airport_id == Airport.id)
+        .join(Regulation, ComplianceRecord.regulation_id == Regulation.id)
+        .filter(DocumentAttachment.id.in_([doc_id for doc_id, _ in matches]))
+    }
+    results = []
+    for doc_id, snippet in matches:
+        if doc_id not in rows:
+            continue
+        doc, record, airport, regulation = rows[doc_id]
+        results.append({
+            "document_id": doc.id,
+            "filename": doc.filename,
+            "document_type": doc.document_type,
+            "uploaded_at": doc.uploaded_at,
+            "compliance_record_id": record.id,
+            "airport_id": airport.id,
+            "airport_code": airport.code,
+            "regulation_id": regulation.id,
+            "regulation_code": regulation.code,
+            "snippet": snippet,
+            "download_url": f"/api/documents/{doc.id}/download",
+        })
+    return results
@@ -0,0 +1,238 @@
+"""
+Arquivo das páginas HTML do eAIS e reprocessamento offline.
+
+Cada página obtida do AISWEB é gravada comprimida (zstd se o pacote `zstandard` estiver
+instalado, senão gzip) em eais_archive_blobs, endereçada pelo SHA-256 do conteúdo - páginas
+repetidas ocupam espaço uma vez só - e cada consulta registra código e horário em
+eais_archive_fetches.
+
+Quando o parser melhora, o comando abaixo reaplica o parser atual à última página arquivada
+de cada aeródromo, em paralelo (um processo por núcleo), e lista as diferenças campo a campo
+em relação ao cadastro - sem nenhuma requisição ao AISWEB:
+
+    python -m app.services.eais_archive reparse [--codes SBGR SBSP] [--workers 4] [--apply]
+
+--apply grava as diferenças no cadastro (airports), atualiza o payload do eais_cache e
+recalcula a conformidade dos aeroportos com campos de aplicabilidade alterados.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.exc import IntegrityError
+
+from app.database import SessionLocal, init_db
+from app.models import Airport, EAISArchiveBlob, EAISArchiveFetch, EAISCacheEntry
+from app.services.eais_enrich import ENRICH_FIELDS, changed_fields, reconcile_changed
+from app.services.eais_fetch import parse_eais_html
+
+try:
+    import zstandard
+except ImportError:  # opcional: sem zstandard o arquivo usa gzip
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_CODEC = "zstd" if zstandard else "gzip"
+# "0" desliga o arquivamento (o cache continua funcionando)
+EAIS_ARCHIVE_ENABLED = os.getenv("EAIS_ARCHIVE_ENABLED", "1") != "0"
+
+
+def compress(raw: bytes, codec: str = ARCHIVE_CODEC) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(raw)
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Página arquivada com zstd: instale o pacote zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def archive_page(db, icao: str, html: str, fetched_at: Optional[datetime] = None) -> str:
+    """Arquiva a página (se ainda não existir) e registra a consulta. Retorna o sha256."""
+    raw = html.encode("utf-8")
+    sha = hashlib.sha256(raw).hexdigest()
+    fetch = EAISArchiveFetch(code=icao, sha256=sha, fetched_at=fetched_at or datetime.utcnow())
+    if not db.query(EAISArchiveBlob.id).filter(EAISArchiveBlob.sha256 == sha).first():
+        db.add(EAISArchiveBlob(sha256=sha, codec=ARCHIVE_CODEC, size=len(raw), data=compress(raw)))
+        db.add(fetch)
+        try:
+            db.commit()
+            return sha
+        except IntegrityError:
+            # Outro processo gravou a mesma página ao mesmo tempo: basta registrar a consulta
+            db.rollback()
+            fetch = EAISArchiveFetch(code=icao, sha256=sha, fetched_at=fetch.fetched_at)
+    db.add(fetch)
+    db.commit()
+    return sha
+
+
+def load_page(db, sha256: str) -> Optional[str]:
+    blob = db.query(EAISArchiveBlob).filter(EAISArchiveBlob.sha256 == sha256).first()
+    if not blob:
+        return None
+    return decompress(blob.data, blob.codec).decode("utf-8")
+
+
+def _latest_pages(db, codes: Optional[List[str]] = None) -> List[Tuple[str, str, bytes]]:
+    """(código, codec, dados comprimidos) da última página arquivada de cada aeródromo."""
+    latest = db.query(
+        EAISArchiveFetch.code, func.max(EAISArchiveFetch.fetched_at).label("fetched_at")
+    ).group_by(EAISArchiveFetch.code)
+    if codes:
+        latest = latest.filter(EAISArchiveFetch.code.in_(codes))
+    latest = latest.subquery()
+    rows = (
+        db.query(EAISArchiveFetch.code, EAISArchiveBlob.codec, EAISArchiveBlob.data)
+        .join(latest, and_(
+            EAISArchiveFetch.code == latest.c.code,
+            EAISArchiveFetch.fetched_at == latest.c.fetched_at,
+        ))
+        .join(EAISArchiveBlob, EAISArchiveBlob.sha256 == EAISArchiveFetch.sha256)
+        .order_by(EAISArchiveFetch.code)
+        .all()
+    )
+    pages = {}
+    for code, codec, data in rows:
+        pages.setdefault(code, (code, codec, data))
+    return list(pages.values())
+
+
+def _reparse_one(page: Tuple[str, str, bytes]) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """Executado nos processos do pool: descomprime e aplica o parser atual."""
+    code, codec, data = page
+    try:
+        return code, parse_eais_html(decompress(data, codec).decode("utf-8"), code), None
+    except Exception as e:
+        return code, None, str(e)
+
+
+def reparse_archive(
+    session_factory: Callable = SessionLocal,
+    codes: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    apply: bool = False,
+) -> Dict:
+    """
+    Reaplica o parser à última página arquivada de cada aeródromo e compara com o cadastro.
+    workers=0 processa no processo atual (sem pool).
+    Retorna {"pages", "compared", "changes": {código: {campo: [atual, novo]}}, ...}.
+    """
+    db = session_factory()
+    try:
+        codes = sorted({c.upper() for c in codes}) if codes else None
+        pages = _latest_pages(db, codes)
+        if workers == 0:
+            parsed = map(_reparse_one, pages)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            parsed = pool.map(_reparse_one, pages, chunksize=16)
+        results = {}
+        errors = {}
+        try:
+            for code, payload, error in parsed:
+                if error:
+                    errors[code] = error
+                else:
+                    results[code] = payload
+        finally:
+            if workers != 0:
+                pool.shutdown()
+
+        columns = [getattr(Airport, col) for col in ENRICH_FIELDS.values()]
+        airports = {
+            row.code: row
+            for row in db.query(Airport.id, Airport.code, *columns).filter(Airport.code.in_(list(results)))
+        }
+        changes: Dict[str, Dict[str, list]] = {}
+        mappings = []
+        for code, payload in results.items():
+            if not payload or code not in airports:
+                continue
+            mapping = changed_fields(airports[code], payload)
+            if len(mapping) > 1:
+                mappings.append(mapping)
+                changes[code] = {
+                    col: [getattr(airports[code], col), value] for col, value in mapping.items() if col != "id"
+                }
+
+        compliance = None
+        if apply:
+            if mappings:
+                db.bulk_update_mappings(Airport, mappings)
+            cache_ids = dict(
+                db.query(EAISCacheEntry.code, EAISCacheEntry.id).filter(EAISCacheEntry.code.in_(list(results)))
+            )
+            db.bulk_update_mappings(EAISCacheEntry, [
+                {
+                    "id": cache_ids[code],
+                    "payload": json.dumps(payload, ensure_ascii=False, separators=(",", ":")) if payload else None,
+                }
+                for code, payload in results.items() if code in cache_ids
+            ])
+            db.commit()
+            compliance = reconcile_changed(db, mappings, reason="reprocessamento eAIS")
+
+        return {
+            "pages": len(pages),
+            "compared": sum(1 for code, payload in results.items() if payload and code in airports),
+            "not_registered": sorted(code for code in results if code not in airports),
+            "not_parsed": sorted(code for code, payload in results.items() if payload is None),
+            "errors": errors,
+            "changes": changes,
+            "applied": apply,
+            "compliance": compliance,
+        }
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.services.eais_archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rp = sub.add_parser("reparse", help="Reaplica o parser às páginas arquivadas e lista diferenças")
+    rp.add_argument("--codes", nargs="*", help="Códigos ICAO (padrão: todos os arquivados)")
+    rp.add_argument("--workers", type=int, default=None, help="Processos (padrão: núcleos; 0 = sem pool)")
+    rp.add_argument("--apply", action="store_true", help="Grava as diferenças no cadastro")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    init_db()  # banco ainda sem as tabelas do arquivo (app nunca iniciado nesta versão)
+    report = reparse_archive(codes=args.codes, workers=args.workers, apply=args.apply)
+    for code, fields in sorted(report["changes"].items()):
+        for col, (old, new) in fields.items():
+            print(f"{code} {col}: {old!r} -> {new!r}")
+    for code, error in sorted(report["errors"].items()):
+        print(f"{code} ERRO: {error}", file=sys.stderr)
+    print(
+        f"{report['pages']} páginas, {report['compared']} aeroportos comparados, "
+        f"{len(report['changes'])} com diferenças"
+        + (" (gravadas)" if report["applied"] else " (use --apply para gravar)")
+    )
+    if report["compliance"] and report["compliance"]["airports"]:
+        c = report["compliance"]
+        print(
+            f"Conformidade recalculada em {c['airports']} aeroportos: {c['created']} registros criados, "
+            f"{c['retired']} retirados, {c['restored']} restaurados"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Cache persistente das consultas ao eAIS (AISWEB) por código ICAO.
+
+Camadas: memória do processo (microssegundos) > tabela eais_cache (sobrevive a restarts
+e deploys) > AISWEB. Entradas dentro do TTL são servidas direto; entradas vencidas, mas
+dentro da janela de stale, são servidas na hora enquanto uma thread revalida em background
+(stale-while-revalidate). Códigos inexistentes no eAIS também são cacheados (negative caching)
+com TTL menor. Se o AISWEB falhar, a última versão conhecida é servida (stale-if-error).
+Toda página obtida também vai para o arquivo de eais_archive (reprocessamento offline).
+"""
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+import requests
+
+from app.database import SessionLocal
+from app.models import EAISCacheEntry
+from app.services.eais_fetch import _fetch_html, _normalize_icao, parse_eais_html
+
+logger = logging.getLogger(__name__)
+
+# eAIS muda a cada ciclo AIRAC (28 dias): 24h de TTL mantém os dados atuais sem martelar o AISWEB
+EAIS_CACHE_TTL_SECONDS = int(os.getenv("EAIS_CACHE_TTL_SECONDS", str(24 * 3600)))
+# Janela após o TTL em que a entrada ainda é servida enquanto revalida em background
+EAIS_CACHE_STALE_SECONDS = int(os.getenv("EAIS_CACHE_STALE_SECONDS", str(30 * 24 * 3600)))
+# Códigos inexistentes: TTL curto para não esconder aeródromos recém-publicados
+EAIS_CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv("EAIS_CACHE_NEGATIVE_TTL_SECONDS", str(6 * 3600)))
+
+_UPSTREAM_ERROR = object()
+
+
+class _Entry:
+    """Entrada em memória. payload None = código inexistente (negativa)."""
+    __slots__ = ("payload", "fetched_at")
+
+    def __init__(self, payload: Optional[Dict], fetched_at: float):
+        self.payload = payload
+        self.fetched_at = fetched_at
+
+
+def _spawn_thread(fn: Callable[[], None]) -> None:
+    threading.Thread(target=fn, daemon=True).start()
+
+
+class EAISCache:
+    """Cache de resultados do eAIS com TTL, stale-while-revalidate e negative caching."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = SessionLocal,
+        fetcher: Callable[[str], str] = _fetch_html,
+        ttl: int = EAIS_CACHE_TTL_SECONDS,
+        stale: int = EAIS_CACHE_STALE_SECONDS,
+        negative_ttl: int = EAIS_CACHE_NEGATIVE_TTL_SECONDS,
+        spawn: Callable[[Callable[[], None]], None] = _spawn_thread,
+    ):
+        self._session_factory = session_factory
+        self._fetcher = fetcher
+        self.ttl = ttl
+        self.stale = stale
+        self.negative_ttl = negative_ttl
+        self._spawn = spawn
+        self._mem: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self.stats = {"hits": 0, "stale_hits": 0, "negative_hits": 0, "misses": 0, "upstream_errors": 0}
+
+    def get(
+        self, icao_code: str, force_refresh: bool = False, fetcher: Optional[Callable[[str], str]] = None
+    ) -> Optional[Dict]:
+        """
+        Retorna os dados do aeródromo (mesmo formato de fetch_eais_airport) ou None.
+        force_refresh=True ignora o cache e consulta o AISWEB (mantendo stale-if-error).
+        fetcher substitui o fetcher padrão nesta consulta (ex.: com limite de taxa).
+        """
+        icao = _normalize_icao(icao_code)
+        if not icao:
+            return None
+        entry = self._lookup(icao)
+        if entry is not None and not force_refresh:
+            age = time.time() - entry.fetched_at
+            if entry.payload is None:
+                if age < self.negative_ttl:
+                    self.stats["negative_hits"] += 1
+                    return None
+            elif age < self.ttl:
+                self.stats["hits"] += 1
+                return dict(entry.payload)
+            elif age < self.ttl + self.stale:
+                self.stats["stale_hits"] += 1
+                self._revalidate_async(icao, fetcher)
+                return dict(entry.payload)
+        self.stats["misses"] += 1
+        fresh = self._fetch_and_store(icao, fetcher)
+        if fresh is _UPSTREAM_ERROR:
+            if entry is not None and entry.payload is not None:
+                return dict(entry.payload)
+            return None
+        return dict(fresh) if fresh else None
+
+    def get_raw_html(self, icao_code: str) -> Optional[str]:
+        """HTML bruto da última consulta armazenada (descomprimido)."""
+        icao = _normalize_icao(icao_code)
+        if not icao or not self._session_factory:
+            return None
+        db = self._session_factory()
+        try:
+            row = db.query(EAISCacheEntry.raw_html).filter(EAISCacheEntry.code == icao).first()
+            if not row or row[0] is None:
+                return None
+            return zlib.decompress(row[0]).decode("utf-8")
+        except Exception as e:
+            logger.warning("eAIS cache: erro ao ler HTML de %s: %s", icao, e)
+            return None
+        finally:
+            db.close()
+
+    def invalidate(self, icao_code: str) -> None:
+        """Remove o código da memória e da tabela (próxima consulta vai ao AISWEB)."""
+        icao = _normalize_icao(icao_code)
+        if not icao:
+            return
+        with self._lock:
+            self._mem.pop(icao, None)
+        if not self._session_factory:
+            return
+        db = self._session_factory()
+        try:
+            db.query(EAISCacheEntry).filter(EAISCacheEntry.code == icao).delete()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("eAIS cache: erro ao invalidar %s: %s", icao, e)
+        finally:
+            db.close()
+
+    def _lookup(self, icao: str) -> Optional[_Entry]:
+        entry = self._mem.get(icao)
+        if entry is not None or not self._session_factory:
+            return entry
+        db = self._session_factory()
+        try:
+            row = (
+                db.query(EAISCacheEntry.payload, EAISCacheEntry.fetched_at)
+                .filter(EAISCacheEntry.code == icao)
+                .first()
+            )
+        except Exception as e:
+            logger.warning("eAIS cache: erro ao ler %s do banco: %s", icao, e)
+            return None
+        finally:
+            db.close()
+        if not row:
+            return None
+        payload = json.loads(row[0]) if row[0] else None
+        entry = _Entry(payload, row[1].replace(tzinfo=timezone.utc).timestamp())
+        with self._lock:
+            self._mem.setdefault(icao, entry)
+        return entry
+
+    def _revalidate_async(self, icao: str, fetcher: Optional[Callable[[str], str]] = None) -> None:
+        with self._lock:
+            if icao in self._refreshing:
+                return
+            self._refreshing.add(icao)
+
+        def run():
+            try:
+                self._fetch_and_store(icao, fetcher)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(icao)
+
+        self._spawn(run)
+
+    def _fetch_and_store(self, icao: str, fetcher: Optional[Callable[[str], str]] = None):
+        try:
+            html = (fetcher or self._fetcher)(icao)
+            payload = parse_eais_html(html, icao)
+        except requests.RequestException as e:
+            self.stats["upstream_errors"] += 1
+            logger.warning("eAIS cache: erro de requisição para %s: %s", icao, e)
+            return _UPSTREAM_ERROR
+        except Exception as e:
+            self.stats["upstream_errors"] += 1
+            logger.exception("eAIS cache: erro inesperado ao extrair %s: %s", icao, e)
+            return _UPSTREAM_ERROR
+        now = datetime.utcnow()
+        with self._lock:
+            self._mem[icao] = _Entry(payload, now.replace(tzinfo=timezone.utc).timestamp())
+        self._persist(icao, payload, html, now)
+        return payload
+
+    def _persist(self, icao: str, payload: Optional[Dict], html: str, fetched_at: datetime) -> None:
+        if not self._session_factory:
+            return
+        db = self._session_factory()
+        try:
+            row = db.query(EAISCacheEntry).filter(EAISCacheEntry.code == icao).first()
+            if not row:
+                row = EAISCacheEntry(code=icao)
+                db.add(row)
+            row.payload = json.dumps(payload, ensure_ascii=False, separators=(",", ":")) if payload else None
+            row.raw_html = zlib.compress(html.encode("utf-8"), 6) if html else None
+            row.fetched_at = fetched_at
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("eAIS cache: erro ao persistir %s: %s", icao, e)
+        else:
+            self._archive(db, icao, html, fetched_at)
+        finally:
+            db.close()
+
+    def _archive(self, db, icao: str, html: str, fetched_at: datetime) -> None:
+        """Guarda a página no arquivo endereçado por conteúdo (reprocessamento offline)."""
+        from app.services.eais_archive import EAIS_ARCHIVE_ENABLED, archive_page
+
+        if not html or not EAIS_ARCHIVE_ENABLED:
+            return
+        try:
+            archive_page(db, icao, html, fetched_at)
+        except Exception as e:
+            db.rollback()
+            logger.warning("eAIS cache: erro ao arquivar página de %s: %s", icao, e)
+
+
+eais_cache = EAISCache()
@@ -0,0 +1,314 @@
+"""
+Enriquecimento em lote dos aeroportos cadastrados com dados do eAIS (AISWEB).
+
+Um job recebe uma lista de códigos ICAO (ou todos os cadastrados), consulta o eAIS em
+paralelo via eais_cache e grava em massa (bulk_update_mappings) os campos que mudaram.
+Aeroportos com campos de aplicabilidade alterados (peso máximo, pistas) têm a conformidade
+recalculada (ComplianceEngine.reconcile_airports).
+As requisições ao AISWEB passam por um token bucket global (taxa sustentada + rajada) e
+por um semáforo por host (máximo de conexões simultâneas), para não sobrecarregar o DECEA.
+Respostas já em cache não consomem tokens.
+
+O estado do job fica na tabela eais_enrich_jobs: o worker que executa grava o progresso e
+GET /api/airports/enrich/eais/{job_id} responde em qualquer worker.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from app.compliance_engine import APPLICABILITY_FIELDS, ComplianceEngine
+from app.database import SessionLocal
+from app.models import Airport, EAISEnrichJob
+from app.services.eais_cache import EAISCache, eais_cache
+from app.services.eais_fetch import EAIS_URL, _fetch_html, _normalize_icao
+
+logger = logging.getLogger(__name__)
+
+# Requisições/s sustentadas ao AISWEB e rajada máxima (tokens acumulados)
+EAIS_ENRICH_RATE_PER_SECOND = float(os.getenv("EAIS_ENRICH_RATE_PER_SECOND", "2"))
+EAIS_ENRICH_BURST = int(os.getenv("EAIS_ENRICH_BURST", "5"))
+# Conexões simultâneas por host (o AISWEB é um único host)
+EAIS_ENRICH_MAX_CONCURRENCY = int(os.getenv("EAIS_ENRICH_MAX_CONCURRENCY", "4"))
+# Aeroportos gravados por commit (o progresso do job também é gravado a cada lote)
+EAIS_ENRICH_BATCH_SIZE = 50
+# Jobs concluídos mantidos em eais_enrich_jobs para consulta de status
+MAX_FINISHED_JOBS = 20
+
+# Campos do eAIS gravados no cadastro (nome do campo no eAIS -> coluna de Airport).
+# usage_class/avsec ficam de fora: são inferidos e o usuário pode tê-los ajustado.
+ENRICH_FIELDS = {
+    "fire_category": "fire_category",
+    "reference_code": "reference_code",
+    "aircraft_size_category": "aircraft_size_category",
+    "max_aircraft_weight": "max_aircraft_weight",
+    "number_of_runways": "number_of_runways",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "city": "cidade",
+    "state": "estado",
+}
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` tokens/s, no máximo `capacity` acumulados."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Bloqueia até haver um token disponível e o consome."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+class RateLimitedFetcher:
+    """Envolve um fetcher (icao -> HTML) com token bucket global e limite de conexões por host."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str] = _fetch_html,
+        bucket: Optional[TokenBucket] = None,
+        max_concurrency: int = EAIS_ENRICH_MAX_CONCURRENCY,
+    ):
+        self._fetch = fetch
+        self.bucket = bucket or TokenBucket(EAIS_ENRICH_RATE_PER_SECOND, EAIS_ENRICH_BURST)
+        self.max_concurrency = max(1, max_concurrency)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_concurrency)
+            return self._host_slots[host]
+
+    def __call__(self, icao: str) -> str:
+        host = urlparse(EAIS_URL.format(icao=icao)).netloc
+        with self._slot(host):
+            self.bucket.acquire()
+            return self._fetch(icao)
+
+
+class EnrichJob:
+    """Job de enriquecimento: estado gravado em eais_enrich_jobs enquanto roda (ver to_dict e save)."""
+
+    def __init__(
+        self,
+        codes: Iterable[str],
+        refresh: bool = False,
+        session_factory: Callable = SessionLocal,
+        cache: EAISCache = eais_cache,
+        fetcher: Optional[Callable[[str], str]] = None,
+        workers: int = EAIS_ENRICH_MAX_CONCURRENCY,
+    ):
+        self.id = uuid.uuid4().hex[:12]
+        self.refresh = refresh
+        self._session_factory = session_factory
+        self._cache = cache
+        self._fetcher = fetcher or _default_fetcher
+        self._workers = max(1, workers)
+        self.codes: List[str] = []
+        self.invalid: List[str] = []
+        for code in codes:
+            icao = _normalize_icao(code)
+            if not icao:
+                self.invalid.append(code)
+            elif icao not in self.codes:
+                self.codes.append(icao)
+        self.status = "queued"
+        self.processed = 0
+        self.updated: Dict[str, List[str]] = {}
+        self.unchanged: List[str] = []
+        self.not_registered: List[str] = []
+        self.not_found: List[str] = []
+        self.errors: Dict[str, str] = {}
+        self.compliance: Dict[str, int] = {}
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "refresh": self.refresh,
+            "total": len(self.codes),
+            "processed": self.processed,
+            "updated": len(self.updated),
+            "unchanged": len(self.unchanged),
+            "not_found": self.not_found,
+            "not_registered": self.not_registered,
+            "invalid": self.invalid,
+            "errors": self.errors,
+            "changes": self.updated,
+            "compliance": self.compliance,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def save(self) -> None:
+        """Grava o estado do job em eais_enrich_jobs (consultado por get_job em qualquer worker)."""
+        db = self._session_factory()
+        try:
+            row = db.get(EAISEnrichJob, self.id)
+            if row is None:
+                row = EAISEnrichJob(id=self.id, created_at=self.created_at)
+                db.add(row)
+            row.status = self.status
+            row.state = json.dumps(self.to_dict(), ensure_ascii=False)
+            row.finished_at = self.finished_at
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("Enriquecimento eAIS %s: falha ao gravar o estado do job: %s", self.id, e)
+        finally:
+            db.close()
+
+    def run(self) -> None:
+        self.status = "running"
+        self.started_at = datetime.utcnow()
+        self.save()
+        db = self._session_factory()
+        try:
+            rows = (
+                db.query(Airport.id, Airport.code, *[getattr(Airport, col) for col in ENRICH_FIELDS.values()])
+                .filter(Airport.code.in_(self.codes))
+                .all()
+            )
+            current = {row.code: row for row in rows}
+            self.not_registered = [c for c in self.codes if c not in current]
+            pending: List[Dict] = []
+            with ThreadPoolExecutor(max_workers=self._workers) as pool:
+                futures = {pool.submit(self._lookup, code): code for code in self.codes if code in current}
+                for future in as_completed(futures):
+                    code = futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        self.errors[code] = str(e)
+                        data = None
+                    else:
+                        if not data:
+                            self.not_found.append(code)
+                    if data:
+                        mapping = changed_fields(current[code], data)
+                        if len(mapping) > 1:
+                            pending.append(mapping)
+                            self.updated[code] = [k for k in mapping if k != "id"]
+                        else:
+                            self.unchanged.append(code)
+                    self.processed += 1
+                    if len(pending) >= EAIS_ENRICH_BATCH_SIZE:
+                        self._flush(db, pending)
+                        pending = []
+                    if self.processed % EAIS_ENRICH_BATCH_SIZE == 0:
+                        self.save()
+            self._flush(db, pending)
+            self.status = "done"
+        except Exception as e:
+            db.rollback()
+            logger.exception("Enriquecimento eAIS %s falhou: %s", self.id, e)
+            self.errors["_job"] = str(e)
+            self.status = "failed"
+        finally:
+            db.close()
+            self.finished_at = datetime.utcnow()
+            self.save()
+            logger.info(
+                "Enriquecimento eAIS %s: %s, %d/%d processados, %d atualizados",
+                self.id, self.status, self.processed, len(self.codes), len(self.updated),
+            )
+
+    def _lookup(self, code: str) -> Optional[Dict]:
+        return self._cache.get(code, force_refresh=self.refresh, fetcher=self._fetcher)
+
+    def _flush(self, db, mappings: List[Dict]) -> None:
+        if not mappings:
+            return
+        db.bulk_update_mappings(Airport, mappings)
+        db.commit()
+        for key, value in reconcile_changed(db, mappings, reason="enriquecimento eAIS").items():
+            self.compliance[key] = self.compliance.get(key, 0) + value
+
+
+def changed_fields(row, data: Dict) -> Dict:
+    """Mapping para bulk_update_mappings com os campos do eAIS que diferem do cadastro."""
+    mapping = {"id": row.id}
+    for field, column in ENRICH_FIELDS.items():
+        value = data.get(field)
+        if value is not None and value != getattr(row, column):
+            mapping[column] = value
+    return mapping
+
+
+def reconcile_changed(db, mappings: List[Dict], reason: str) -> Dict[str, int]:
+    """
+    Recalcula a conformidade dos aeroportos cujos campos de aplicabilidade (peso máximo,
+    pistas) mudaram nos mappings gravados (depois do commit).
+    """
+    airport_ids = sorted({m["id"] for m in mappings if any(f in m for f in APPLICABILITY_FIELDS)})
+    return ComplianceEngine(db).reconcile_airports(airport_ids, regenerate_action_items=True, reason=reason)
+
+
+def _prune_finished(db) -> None:
+    """Remove de eais_enrich_jobs os jobs concluídos além dos MAX_FINISHED_JOBS mais recentes."""
+    old = [
+        job_id for (job_id,) in
+        db.query(EAISEnrichJob.id)
+        .filter(EAISEnrichJob.finished_at.isnot(None))
+        .order_by(EAISEnrichJob.finished_at.desc())
+        .offset(MAX_FINISHED_JOBS)
+    ]
+    if old:
+        db.query(EAISEnrichJob).filter(EAISEnrichJob.id.in_(old)).delete(synchronize_session=False)
+        db.commit()
+
+
+_default_fetcher = RateLimitedFetcher()
+
+
+def start_job(codes: Iterable[str], refresh: bool = False, session_factory: Callable = SessionLocal) -> EnrichJob:
+    """Grava o job em eais_enrich_jobs (status queued) e o inicia em uma thread de background."""
+    job = EnrichJob(codes, refresh=refresh, session_factory=session_factory)
+    db = session_factory()
+    try:
+        _prune_finished(db)
+    finally:
+        db.close()
+    job.save()
+    threading.Thread(target=job.run, daemon=True).start()
+    return job
+
+
+def get_job(db, job_id: str) -> Optional[Dict]:
+    """Estado gravado do job (EnrichJob.to_dict), ou None se não existe."""
+    row = db.get(EAISEnrichJob, job_id)
+    return json.loads(row.state) if row else None
@@ -5,11 +5,14 @@ Fonte oficial: https://aisweb.decea.mil.br/?codigo=XXXX&i=aerodromos
 Extrai dados para cadastro e verificação de conformidade (RBAC-153/154).
 NÃO usa ANAC - os dados vêm exclusivamente do eAIS.
 """
+import heapq
 import logging
 import re
 import requests
 from typing import Optional, Dict
 
+from app.services.upstream_health import guarded_get
+
 logger = logging.getLogger(__name__)
 
 EAIS_URL = "https://aisweb.decea.mil.br/?codigo={icao}&i=aerodromos"
@@ -21,6 +24,125 @@ HEADERS = {
 VALID_REF = re.compile(r"^[1-4][A-E]$", re.I)
 
 
+# Padrões compilados uma única vez (import). Os de palavra-chave são avaliados só nas
+# ocorrências da palavra-chave (ver _anchored_match), não na página inteira.
+_H1_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", re.DOTALL)
+_WS_RE = re.compile(r"\s+")
+_NAME_CODE_RE = re.compile(r"\(\s*([A-Z]{4})\s*\)")
+_STATE_SPAN_RE = re.compile(r'<span title="Estado">([A-Z]{2})</span>')
+# Cidade/UF: localiza "/UF" e só então olha os até 41 caracteres anteriores
+_CITY_SLASH_TAIL_RE = re.compile(r"/\s*([A-Z]{2})\s*(?:&nbsp;|</span>|[\s<])")
+_CITY_HEAD_RE = re.compile(r"[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40}\Z")
+_CITY_DASH_RE = re.compile(r"([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40})\s*[-–]\s*([A-Z]{2})\b")
+_CITY_DASH_TAIL_RE = re.compile(r"[-–]\s*[A-Z]{2}\b")
+_CITY_COMMA_RE = re.compile(r"([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40}),\s*([A-Z]{2})\b")
+_CITY_COMMA_TAIL_RE = re.compile(r",\s*[A-Z]{2}\b")
+_COORD_RE = re.compile(
+    r"(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})([NS])/(\d{1,3})\s+(\d{1,2})\s+(\d{1,2})([EW])"
+)
+_COORD_DEG_RE = re.compile(
+    r"(\d{1,2})[°º]\s*(\d{1,2})['′]?\s*(\d{1,2}(?:[.,]\d+)?)[\"″]?\s*([NS])\s*[/\s,]\s*(\d{1,3})[°º]?\s*(\d{1,2})['′]?\s*(\d{1,2}(?:[.,]\d+)?)[\"″]?\s*([EW])"
+)
+# Caracteres que podem preceder a palavra-chave dentro do match (ver _lead_start)
+_LEAD_COORD = re.compile(r"[\d\s]")
+_LEAD_DIGITS = re.compile(r"\d")
+_LEAD_NUMBER = re.compile(r"[\d.,\s]")
+_LEAD_RCD = re.compile(r"[1-4A-Ea-e\s\-(]")
+_LEAD_SPACE = re.compile(r"\s")
+
+# (padrão, palavras-chave em minúsculas, lead). Ordem = prioridade.
+_FIRE_CATEGORY_PATTERNS = [
+    (re.compile(r"CAT\s+CIVIL\s*[-–]\s*(\d+)", re.I), ("cat",), None),  # Formato exato: "CAT CIVIL - 7" (hífen ou en-dash)
+    (re.compile(r"CAT\s+CIVIL\s*:\s*(\d+)", re.I), ("cat",), None),
+    (re.compile(r"CAT\s+CIVIL\s+(\d+)\b", re.I), ("cat",), None),
+    (re.compile(r"RFFS\s*[-–]\s*CAT\s+CIVIL\s*[-–]\s*(\d+)", re.I), ("rffs",), None),  # Formato ROTAER COMPL
+    (re.compile(r"Categoria\s+Contraincêndio\s*[:\-]\s*(\d+)", re.I), ("categoria",), None),
+]
+_RCD_PATTERNS = [
+    (re.compile(r"compatíveis com o RCD\s+([1-4][A-E])", re.I), ("compatíveis com o rcd",), None),
+    (re.compile(r"RCD\s+([1-4][A-E])", re.I), ("rcd",), None),
+    (re.compile(r"código\s+([1-4][A-E])\b", re.I), ("código",), None),
+    (re.compile(r"([1-4][A-E])\s+ou inferior", re.I), ("ou inferior",), _LEAD_RCD),
+    (re.compile(r"\b([1-4][A-E])\s*[-(]?(?:RCD|referência)", re.I), ("rcd", "referência"), _LEAD_RCD),
+]
+_RWY_RCD_RE = re.compile(r"RWY\s+[\d/]+[LR]?\s+([1-4][A-E])", re.I)
+_TORA_ROW_RE = re.compile(r"<td[^>]*>\s*(\d{2}[LR]?)\s*</td>\s*<td[^>]*>\s*(\d+)")
+_RWY_CELL_RE = re.compile(r"<td[^>]*>\s*(\d{2}[LR]?)\s*</td>")
+_AD_INTL_RE = re.compile(r"AD\s*</[^>]+>\s*INTL")
+_AD_DOM_RE = re.compile(r"AD\s*</[^>]+>\s*DOM")
+_HANGAR_RE = re.compile(r"\bhangar(es)?\b", re.I)
+_PRAI_KEYWORDS = ["PRAI", "Plano de Remoção", "Remoção de ACFT", "Capacidade para remoção", "SALVAMENTO", "COMBATE"]
+# (padrão, palavras-chave, lead, unidade no grupo 2?) em ordem de especificidade
+_WEIGHT_PATTERNS = [
+    (re.compile(r"ACFT\s+[A-Z0-9\-]+\s*-\s*Peso\s*([\d.,]+)\s*Kg", re.I), ("acft",), None, 0),  # "ACFT A380-800 - Peso 575.000 Kg"
+    (re.compile(r"Capacidade\s+para\s+remoção[^.]*?Peso\s*([\d.,]+)\s*Kg", re.I), ("capacidade",), None, 0),
+    (re.compile(r"Peso\s+([\d.,\s]+)\s*(Kg|toneladas?|ton\.?|t\b)", re.I), ("peso",), None, 1),
+    (re.compile(r"([\d.,]+)\s*(?:Kg|kg)\b", re.I), ("kg",), _LEAD_NUMBER, 0),
+    (re.compile(r"([\d.,]+)\s*toneladas?\b", re.I), ("tonelada",), _LEAD_NUMBER, 0),
+    (re.compile(r"([\d.,]+)\s*ton\.?\b", re.I), ("ton",), _LEAD_NUMBER, 0),
+    (re.compile(r"Peso\s+([\d.,]+)\s*(?:Kg)?", re.I), ("peso",), None, 0),
+    (re.compile(r"(?:peso|Peso)\s*m[áa]x[.\s]*[:\-]?\s*([\d.,]+)", re.I), ("peso",), None, 0),
+    (re.compile(r"remoção[^.]*?([\d.,]+)\s*(?:kg|Kg|toneladas?)", re.I), ("remoção",), None, 0),
+]
+
+
+def _occurrences(hay: str, keyword: str, pos: int, endpos: int):
+    i = hay.find(keyword, pos, endpos)
+    while i != -1:
+        yield i
+        i = hay.find(keyword, i + 1, endpos)
+
+
+def _lead_start(lead, text: str, pos: int, o: int) -> int:
+    """
+    Início da sequência de caracteres `lead` que termina em o. Varre para trás sem limite: os
+    padrões aceitam espaços sem limite e HTML indentado pode ter centenas deles.
+    """
+    while o > pos and lead.match(text, o - 1):
+        o -= 1
+    return o
+
+
+def _anchored_match(pattern, text: str, hay: Optional[str], keywords, lead=None, pos: int = 0, endpos: Optional[int] = None):
+    """
+    Primeiro match (o mais à esquerda) de `pattern` em text[pos:endpos], tentando o regex só
+    nas ocorrências das palavras-chave em `hay` (o texto, ou sua cópia em minúsculas para
+    padrões re.I). `lead` descreve o que pode vir antes da palavra-chave dentro do match
+    (ex.: o número antes de "kg"). hay=None faz a busca comum na página inteira.
+    """
+    if endpos is None:
+        endpos = len(text)
+    if hay is None:
+        return pattern.search(text, pos, endpos)
+    for o in heapq.merge(*(_occurrences(hay, kw, pos, endpos) for kw in keywords)):
+        start = o
+        if lead is not None:
+            start = _lead_start(lead, text, pos, o)
+        for s in range(start, o + 1):
+            m = pattern.match(text, s, endpos)
+            if m:
+                return m
+    return None
+
+
+def _city_fallback_match(pattern, tail_re, text: str, dash: bool):
+    """
+    "Cidade - UF" / "Cidade, UF": todo match termina num sufixo "-UF"/",UF"; a busca começa
+    no máximo 41 caracteres (mais os espaços antes do hífen) antes do primeiro sufixo e termina
+    no último.
+    """
+    first = last = None
+    for last in tail_re.finditer(text):
+        if first is None:
+            first = last
+    if first is None:
+        return None
+    r = first.start()
+    if dash:
+        r = _lead_start(_LEAD_SPACE, text, 0, r)
+    return pattern.search(text, max(0, r - 41), last.end())
+
+
 def _parse_coords(match) -> tuple:
     """Converte DD MM SS N/S e DDD MM SS E/W para decimal."""
     d, mn, s, ns = int(match.group(1)), int(match.group(2)), float(match.group(3)), match.group(4)
@@ -59,283 +181,289 @@ def _infer_rcd_from_tora(tora_m: int) -> Optional[str]:
     return None
 
 
-def fetch_eais_airport(icao_code: str) -> Optional[Dict]:
-    """
-    Busca dados do aeródromo no eAIS (AISWEB) - ÚNICA FONTE.
-    Retorna dict com todos os campos para cadastro e conformidade.
-    """
-    icao = icao_code.upper().strip()
+def _normalize_icao(icao_code: str) -> Optional[str]:
+    """Normaliza o código ICAO (4 letras); retorna None se inválido."""
+    icao = (icao_code or "").upper().strip()
     if len(icao) != 4 or not icao.isalpha():
         return None
-    try:
-        r = requests.get(EAIS_URL.format(icao=icao), headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        text = r.text
-        if icao not in text and "Aeródromo" not in text[:3000]:
-            logger.warning(
-                "eAIS: página inválida ou formato inesperado para %s (código ou 'Aeródromo' não encontrado no conteúdo)",
-                icao,
-            )
-            return None
-        result = {"code": icao, "source": "eais"}
+    return icao
 
-        # Nome e código do h1
-        m = re.search(r"<h1[^>]*>(.*?)</h1>", text, re.DOTALL)
-        if m:
-            h1 = re.sub(r"\s+", " ", m.group(1)).strip()
-            name_match = re.search(r"(.+?)\s*\(\s*" + icao + r"\s*\)", h1)
-            result["name"] = name_match.group(1).strip() if name_match else h1.split("(")[0].strip()[:80]
-
-        # Estado: <span title="Estado">SP</span> ou extraído do padrão cidade/UF
-        m = re.search(r'<span title="Estado">([A-Z]{2})</span>', text)
-        result["state"] = m.group(1) if m else None
-        # Cidade: formatos do eAIS "Cidade/UF", "Cidade - UF", "Cidade, UF"
-        city_match = re.search(
-            r"([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40})/\s*([A-Z]{2})\s*(?:&nbsp;|</span>|[\s<])",
-            text,
+
+def _fetch_html(icao: str) -> str:
+    """
+    Baixa a página do aeródromo no AISWEB. Propaga requests.RequestException
+    (UpstreamUnavailable na hora, sem esperar o timeout, se o AISWEB estiver fora do ar).
+    """
+    r = guarded_get(EAIS_URL.format(icao=icao), headers=HEADERS, timeout=20)
+    r.raise_for_status()
+    return r.text
+
+
+def parse_eais_html(text: str, icao: str) -> Optional[Dict]:
+    """
+    Extrai os campos do aeródromo a partir do HTML do eAIS.
+    Retorna None quando a página não corresponde a um aeródromo válido.
+
+    Passada única: a página é convertida para minúsculas uma vez e cada campo é procurado
+    apenas a partir das ocorrências das suas palavras-chave (str.find), com padrões
+    pré-compilados - em vez de varrer a página inteira uma vez por padrão.
+    """
+    if icao not in text and "Aeródromo" not in text[:3000]:
+        logger.warning(
+            "eAIS: página inválida ou formato inesperado para %s (código ou 'Aeródromo' não encontrado no conteúdo)",
+            icao,
         )
-        if city_match:
-            city = city_match.group(1).strip()
+        return None
+    result = {"code": icao, "source": "eais"}
+    # Cópia em minúsculas alinhada ao texto para as palavras-chave dos padrões re.I.
+    # Se lower() mudar o tamanho (ex.: "İ"), os índices não batem: busca comum.
+    low = text.lower()
+    if len(low) != len(text):
+        low = None
+
+    # Nome e código do h1
+    m = _H1_RE.search(text)
+    if m:
+        h1 = _WS_RE.sub(" ", m.group(1)).strip()
+        name = None
+        for cm in _NAME_CODE_RE.finditer(h1):
+            if cm.group(1) == icao and cm.start() > 0:
+                name = h1[: cm.start()].strip()
+                break
+        result["name"] = name if name is not None else h1.split("(")[0].strip()[:80]
+
+    # Estado: <span title="Estado">SP</span> ou extraído do padrão cidade/UF
+    m = _STATE_SPAN_RE.search(text)
+    result["state"] = m.group(1) if m else None
+    # Cidade: formatos do eAIS "Cidade/UF", "Cidade - UF", "Cidade, UF"
+    for tail in _CITY_SLASH_TAIL_RE.finditer(text):
+        head = _CITY_HEAD_RE.search(text, max(0, tail.start() - 41), tail.start())
+        if head:
+            city = head.group(0).strip()
             if not any(c.isdigit() for c in city) and len(city) > 2:
                 result["city"] = city
             if not result.get("state"):
-                result["state"] = city_match.group(2)
-        # Fallback: "Cidade - UF" ou "Cidade, UF" (ex.: em tabelas)
-        if not result.get("city"):
-            for pat in [
-                r"([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40})\s*[-–]\s*([A-Z]{2})\b",
-                r"([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{2,40}),\s*([A-Z]{2})\b",
-            ]:
-                m = re.search(pat, text)
-                if m:
-                    city = m.group(1).strip()
-                    if not any(c.isdigit() for c in city) and len(city) > 2:
-                        result["city"] = city
-                        if not result.get("state"):
-                            result["state"] = m.group(2)
-                    break
-
-        # Coordenadas: DD MM SS N/S e DDD MM SS E/W (formato principal do eAIS)
-        coord_match = re.search(
-            r"(\d{1,2})\s+(\d{1,2})\s+(\d{1,2})([NS])/(\d{1,3})\s+(\d{1,2})\s+(\d{1,2})([EW])",
-            text,
-        )
-        if coord_match:
-            result["latitude"], result["longitude"] = _parse_coords(coord_match)
-        else:
-            # Fallback: formato graus-minutos "23°26'08"S" ou decimal "-23.4356"
-            deg_match = re.search(
-                r"(\d{1,2})[°º]\s*(\d{1,2})['′]?\s*(\d{1,2}(?:[.,]\d+)?)[\"″]?\s*([NS])\s*[/\s,]\s*(\d{1,3})[°º]?\s*(\d{1,2})['′]?\s*(\d{1,2}(?:[.,]\d+)?)[\"″]?\s*([EW])",
-                text,
-            )
-            if deg_match:
-                try:
-                    lat = (
-                        int(deg_match.group(1))
-                        + int(deg_match.group(2)) / 60
-                        + float(deg_match.group(3).replace(",", ".")) / 3600
-                    ) * (-1 if deg_match.group(4) == "S" else 1)
-                    lon = (
-                        int(deg_match.group(5))
-                        + int(deg_match.group(6)) / 60
-                        + float(deg_match.group(7).replace(",", ".")) / 3600
-                    ) * (-1 if deg_match.group(8) == "W" else 1)
-                    result["latitude"], result["longitude"] = lat, lon
-                except (ValueError, IndexError):
-                    pass
-
-        # CAT CIVIL (categoria contraincêndio 1-10) - crítico para RBAC-153/SESCINC
-        # Formato oficial eAIS/ROTAER: "RFFS - CAT CIVIL - 7" ou "CAT CIVIL - 10" (tabela COMPL)
-        # Priorizar padrões explícitos; evitar "CAT 1" de outros contextos (ex: categoria 1)
-        fire_category = None
-        for pat in [
-            r"CAT\s+CIVIL\s*[-–]\s*(\d+)",  # Formato exato: "CAT CIVIL - 7" (hífen ou en-dash)
-            r"CAT\s+CIVIL\s*:\s*(\d+)",
-            r"CAT\s+CIVIL\s+(\d+)\b",
-            r"RFFS\s*[-–]\s*CAT\s+CIVIL\s*[-–]\s*(\d+)",  # Formato ROTAER COMPL
-            r"Categoria\s+Contraincêndio\s*[:\-]\s*(\d+)",
-        ]:
-            cat_match = re.search(pat, text, re.I)
-            if cat_match and cat_match.group(1).isdigit():
-                val = int(cat_match.group(1))
-                if 1 <= val <= 10:
-                    fire_category = val
-                    break
-        if fire_category:
-            result["fire_category"] = fire_category
-            result["usage_class"], result["avsec_classification"] = _infer_usage_avsec_from_cat(fire_category)
-
-        # RCD - prioridade: explícito no texto > tabela RWY > inferência TORA
-        rcd = None
-        rcd_source = None
-        for pat, src in [
-            (r"compatíveis com o RCD\s+([1-4][A-E])", "texto"),
-            (r"RCD\s+([1-4][A-E])", "texto"),
-            (r"código\s+([1-4][A-E])\b", "texto"),
-            (r"([1-4][A-E])\s+ou inferior", "texto"),
-            (r"\b([1-4][A-E])\s*[-(]?(?:RCD|referência)", "texto"),
+                result["state"] = tail.group(1)
+            break
+    # Fallback: "Cidade - UF" ou "Cidade, UF" (ex.: em tabelas)
+    if not result.get("city"):
+        for pat, tail_re, dash in [
+            (_CITY_DASH_RE, _CITY_DASH_TAIL_RE, True),
+            (_CITY_COMMA_RE, _CITY_COMMA_TAIL_RE, False),
         ]:
-            m = re.search(pat, text, re.I)
+            m = _city_fallback_match(pat, tail_re, text, dash)
             if m:
-                rcd = m.group(1).upper()
-                rcd_source = src
+                city = m.group(1).strip()
+                if not any(c.isdigit() for c in city) and len(city) > 2:
+                    result["city"] = city
+                    if not result.get("state"):
+                        result["state"] = m.group(2)
                 break
-        # RCD no formato "RWY 02L/20R 3C" ou "RWY 02R/20L 4C"
-        if not rcd:
-            rcd_matches = re.findall(r"RWY\s+[\d/]+[LR]?\s+([1-4][A-E])", text, re.I)
-            if rcd_matches:
-                rcd = max(rcd_matches, key=lambda x: (int(x[0]), x[1]))
-                rcd_source = "tabela_rwy"
-        result["reference_code"] = rcd
-
-        # Inferir RCD a partir do TORA quando não explícito
-        if not rcd:
-            tora_matches = re.findall(
-                r"<td[^>]*>\s*(\d{2}[LR]?)\s*</td>\s*<td[^>]*>\s*(\d+)",
-                text,
-            )
-            if tora_matches:
-                toras = [int(t[1]) for t in tora_matches if t[1].isdigit()]
-                if toras:
-                    max_tora = max(toras)
-                    rcd = _infer_rcd_from_tora(max_tora)
-                    result["reference_code"] = rcd
-                    rcd_source = "inferido_tora"
-                    logger.debug("eAIS %s: RCD inferido por TORA %dm -> %s", icao, max_tora, rcd)
-                    if rcd and not result.get("aircraft_size_category"):
-                        lt = rcd[-1].upper()
-                        result["aircraft_size_category"] = "A/B" if lt in ("A", "B") else "C" if lt == "C" else "D"
-
-        # aircraft_size_category a partir do RCD
-        if rcd and len(rcd) >= 2:
-            lt = rcd[-1].upper()
-            result["aircraft_size_category"] = "A/B" if lt in ("A", "B") else "C" if lt == "C" else "D"
-
-        # Número de pistas
-        idx = text.find("TORA")
-        n_runways = 1
-        if idx > 0:
-            chunk = text[idx : idx + 1200]
-            rwy_cells = re.findall(r"<td[^>]*>\s*(\d{2}[LR]?)\s*</td>", chunk)
-            if rwy_cells:
-                n_runways = max(1, len(rwy_cells) // 2)
-        result["number_of_runways"] = n_runways
-
-        # Operações internacionais: designação oficial do eAIS (AD INTL / AD DOM)
-        # No HTML do eAIS, "AD" e "INTL"/"DOM" podem estar em elementos separados: <span>AD</span> INTL
-        has_intl = (
-            "AD INTL" in text
-            or bool(re.search(r"AD\s*</[^>]+>\s*INTL", text))
-        )
-        has_dom = (
-            "AD DOM" in text
-            or bool(re.search(r"AD\s*</[^>]+>\s*DOM", text))
-        )
-        if has_intl:
-            result["has_international_operations"] = True
-        elif has_dom:
-            result["has_international_operations"] = False
+
+    # Coordenadas: DD MM SS N/S e DDD MM SS E/W (formato principal do eAIS)
+    coord_match = _anchored_match(_COORD_RE, text, text, ("S/", "N/"), _LEAD_COORD)
+    if coord_match:
+        result["latitude"], result["longitude"] = _parse_coords(coord_match)
+    else:
+        # Fallback: formato graus-minutos "23°26'08"S" ou decimal "-23.4356"
+        deg_match = _anchored_match(_COORD_DEG_RE, text, text, ("°", "º"), _LEAD_DIGITS)
+        if deg_match:
+            try:
+                lat = (
+                    int(deg_match.group(1))
+                    + int(deg_match.group(2)) / 60
+                    + float(deg_match.group(3).replace(",", ".")) / 3600
+                ) * (-1 if deg_match.group(4) == "S" else 1)
+                lon = (
+                    int(deg_match.group(5))
+                    + int(deg_match.group(6)) / 60
+                    + float(deg_match.group(7).replace(",", ".")) / 3600
+                ) * (-1 if deg_match.group(8) == "W" else 1)
+                result["latitude"], result["longitude"] = lat, lon
+            except (ValueError, IndexError):
+                pass
+
+    # CAT CIVIL (categoria contraincêndio 1-10) - crítico para RBAC-153/SESCINC
+    # Formato oficial eAIS/ROTAER: "RFFS - CAT CIVIL - 7" ou "CAT CIVIL - 10" (tabela COMPL)
+    # Priorizar padrões explícitos; evitar "CAT 1" de outros contextos (ex: categoria 1)
+    fire_category = None
+    for pat, keywords, lead in _FIRE_CATEGORY_PATTERNS:
+        cat_match = _anchored_match(pat, text, low, keywords, lead)
+        if cat_match and cat_match.group(1).isdigit():
+            val = int(cat_match.group(1))
+            if 1 <= val <= 10:
+                fire_category = val
+                break
+    if fire_category:
+        result["fire_category"] = fire_category
+        result["usage_class"], result["avsec_classification"] = _infer_usage_avsec_from_cat(fire_category)
+
+    # RCD - prioridade: explícito no texto > tabela RWY > inferência TORA
+    rcd = None
+    rcd_source = None
+    for pat, keywords, lead in _RCD_PATTERNS:
+        m = _anchored_match(pat, text, low, keywords, lead)
+        if m:
+            rcd = m.group(1).upper()
+            rcd_source = "texto"
+            break
+    # RCD no formato "RWY 02L/20R 3C" ou "RWY 02R/20L 4C"
+    if not rcd:
+        if low is None:
+            rcd_matches = _RWY_RCD_RE.findall(text)
         else:
-            result["has_international_operations"] = False
+            rcd_matches = []
+            i = low.find("rwy")
+            while i != -1:
+                m = _RWY_RCD_RE.match(text, i)
+                if m:
+                    rcd_matches.append(m.group(1))
+                i = low.find("rwy", m.end() if m else i + 1)
+        if rcd_matches:
+            rcd = max(rcd_matches, key=lambda x: (int(x[0]), x[1]))
+            rcd_source = "tabela_rwy"
+    result["reference_code"] = rcd
 
-        # Operações de carga: "voos de carga" ou "AUTH voos de carga" indica que o AD opera carga
-        result["has_cargo_operations"] = bool(re.search(r"voos de carga|operações de carga", text, re.I))
+    # Inferir RCD a partir do TORA quando não explícito
+    if not rcd:
+        tora_matches = _TORA_ROW_RE.findall(text)
+        if tora_matches:
+            toras = [int(t[1]) for t in tora_matches if t[1].isdigit()]
+            if toras:
+                max_tora = max(toras)
+                rcd = _infer_rcd_from_tora(max_tora)
+                result["reference_code"] = rcd
+                rcd_source = "inferido_tora"
+                logger.debug("eAIS %s: RCD inferido por TORA %dm -> %s", icao, max_tora, rcd)
+                if rcd and not result.get("aircraft_size_category"):
+                    lt = rcd[-1].upper()
+                    result["aircraft_size_category"] = "A/B" if lt in ("A", "B") else "C" if lt == "C" else "D"
 
-        # Facilidades de manutenção: "hangar" ou "hangares" indica infraestrutura
-        result["has_maintenance_facility"] = bool(re.search(r"\bhangar(es)?\b", text, re.I))
+    # aircraft_size_category a partir do RCD
+    if rcd and len(rcd) >= 2:
+        lt = rcd[-1].upper()
+        result["aircraft_size_category"] = "A/B" if lt in ("A", "B") else "C" if lt == "C" else "D"
 
-        result["airport_type"] = "commercial"  # default para aeródromos no eAIS
+    # Número de pistas
+    idx = text.find("TORA")
+    n_runways = 1
+    if idx > 0:
+        rwy_cells = _RWY_CELL_RE.findall(text, idx, idx + 1200)
+        if rwy_cells:
+            n_runways = max(1, len(rwy_cells) // 2)
+    result["number_of_runways"] = n_runways
 
-        # Peso máximo de aeronaves (toneladas) - PRAI "Peso 575.000 Kg" ou "80 toneladas"
-        # Prioridade: seção PRAI > busca em toda a página
-        def _parse_weight(num_str: str, unit: str) -> Optional[int]:
-            s = num_str.replace(" ", "").strip()
-            # Formato BR: "575.000" = 575 mil kg; formato US: "575,000" = 575 mil
-            if "," in s and len(s.split(",")[-1]) == 3 and s.split(",")[-1].isdigit():
-                s = s.replace(",", "").replace(".", "")
-            else:
-                s = s.replace(".", "").replace(",", ".")
-            try:
-                val = float(s) if s else 0
-                if val <= 0:
-                    return None
-                u = (unit or "").lower()
-                if "tonelada" in u or "ton" in u or u == "t":
-                    return int(val)
-                if "kg" in u or "quilograma" in u:
-                    return int(val / 1000)
-                # Sem unidade: se > 1000 provavelmente kg, senão toneladas
-                if val > 1000:
-                    return int(val / 1000)
-                return int(val) if val <= 600 else None
-            except (ValueError, ZeroDivisionError):
+    # Operações internacionais: designação oficial do eAIS (AD INTL / AD DOM)
+    # No HTML do eAIS, "AD" e "INTL"/"DOM" podem estar em elementos separados: <span>AD</span> INTL
+    has_intl = "AD INTL" in text or bool(_AD_INTL_RE.search(text))
+    has_dom = "AD DOM" in text or bool(_AD_DOM_RE.search(text))
+    if has_intl:
+        result["has_international_operations"] = True
+    elif has_dom:
+        result["has_international_operations"] = False
+    else:
+        result["has_international_operations"] = False
+
+    # Operações de carga: "voos de carga" ou "AUTH voos de carga" indica que o AD opera carga
+    folded = low if low is not None else text.lower()
+    result["has_cargo_operations"] = "voos de carga" in folded or "operações de carga" in folded
+
+    # Facilidades de manutenção: "hangar" ou "hangares" indica infraestrutura
+    result["has_maintenance_facility"] = bool(_anchored_match(_HANGAR_RE, text, low, ("hangar",)))
+
+    result["airport_type"] = "commercial"  # default para aeródromos no eAIS
+
+    # Peso máximo de aeronaves (toneladas) - PRAI "Peso 575.000 Kg" ou "80 toneladas"
+    # Prioridade: seção PRAI > busca em toda a página
+    def _parse_weight(num_str: str, unit: str) -> Optional[int]:
+        s = num_str.replace(" ", "").strip()
+        # Formato BR: "575.000" = 575 mil kg; formato US: "575,000" = 575 mil
+        if "," in s and len(s.split(",")[-1]) == 3 and s.split(",")[-1].isdigit():
+            s = s.replace(",", "").replace(".", "")
+        else:
+            s = s.replace(".", "").replace(",", ".")
+        try:
+            val = float(s) if s else 0
+            if val <= 0:
                 return None
+            u = (unit or "").lower()
+            if "tonelada" in u or "ton" in u or u == "t":
+                return int(val)
+            if "kg" in u or "quilograma" in u:
+                return int(val / 1000)
+            # Sem unidade: se > 1000 provavelmente kg, senão toneladas
+            if val > 1000:
+                return int(val / 1000)
+            return int(val) if val <= 600 else None
+        except (ValueError, ZeroDivisionError):
+            return None
 
-        # Seção PRAI/Remoção: ampliar busca para formatos variados do eAIS
-        prai_section = ""
-        for kw in ["PRAI", "Plano de Remoção", "Remoção de ACFT", "Capacidade para remoção", "SALVAMENTO", "COMBATE"]:
-            idx = text.find(kw)
-            if idx >= 0:
-                prai_section = text[idx : idx + 3500]
+    # Seção PRAI/Remoção: ampliar busca para formatos variados do eAIS
+    start, end = 0, len(text)
+    for kw in _PRAI_KEYWORDS:
+        idx = text.find(kw)
+        if idx >= 0:
+            start, end = idx, min(len(text), idx + 3500)
+            break
+    # Padrões em ordem de especificidade (mais específico primeiro)
+    for pat, keywords, lead, unit in _WEIGHT_PATTERNS:
+        m = _anchored_match(pat, text, low, keywords, lead, start, end)
+        if m:
+            u = m.group(2) if unit == 1 and m.lastindex >= 2 else ""
+            w = _parse_weight(m.group(1), u)
+            if w and 1 <= w <= 600:  # faixa plausível (1t a A380 ~575t)
+                # Evitar falso positivo: PRAI pode citar aeronave mínima (ex: Learjet 6.300 kg)
+                # Aeroportos 4C/4D/4E operam jatos >30t; peso <30t é suspeito
+                rcd_val = result.get("reference_code") or rcd
+                if rcd_val and rcd_val[-1] in ("C", "D", "E") and w < 30:
+                    logger.debug("eAIS %s: peso %dt ignorado (RCD %s sugere aeronaves maiores)", icao, w, rcd_val)
+                    continue
+                result["max_aircraft_weight"] = w
                 break
-        search_text = prai_section if prai_section else text
-        # Padrões em ordem de especificidade (mais específico primeiro)
-        for pat, unit in [
-            (r"ACFT\s+[A-Z0-9\-]+\s*-\s*Peso\s*([\d.,]+)\s*Kg", 0),  # "ACFT A380-800 - Peso 575.000 Kg"
-            (r"Capacidade\s+para\s+remoção[^.]*?Peso\s*([\d.,]+)\s*Kg", 0),
-            (r"Peso\s+([\d.,\s]+)\s*(Kg|toneladas?|ton\.?|t\b)", 1),
-            (r"([\d.,]+)\s*(?:Kg|kg)\b", 0),
-            (r"([\d.,]+)\s*toneladas?\b", 0),
-            (r"([\d.,]+)\s*ton\.?\b", 0),
-            (r"Peso\s+([\d.,]+)\s*(?:Kg)?", 0),
-            (r"(?:peso|Peso)\s*m[áa]x[.\s]*[:\-]?\s*([\d.,]+)", 0),
-            (r"remoção[^.]*?([\d.,]+)\s*(?:kg|Kg|toneladas?)", 0),
-        ]:
-            m = re.search(pat, search_text, re.I)
-            if m:
-                u = m.group(2) if unit == 1 and m.lastindex >= 2 else ""
-                w = _parse_weight(m.group(1), u)
-                if w and 1 <= w <= 600:  # faixa plausível (1t a A380 ~575t)
-                    # Evitar falso positivo: PRAI pode citar aeronave mínima (ex: Learjet 6.300 kg)
-                    # Aeroportos 4C/4D/4E operam jatos >30t; peso <30t é suspeito
-                    rcd_val = result.get("reference_code") or rcd
-                    if rcd_val and rcd_val[-1] in ("C", "D", "E") and w < 30:
-                        logger.debug("eAIS %s: peso %dt ignorado (RCD %s sugere aeronaves maiores)", icao, w, rcd_val)
-                        continue
-                    result["max_aircraft_weight"] = w
-                    break
-
-        # Fallback: inferir max_aircraft_weight do RCD quando PRAI não tem peso explícito
-        if not result.get("max_aircraft_weight") and rcd and len(rcd) >= 2:
-            num, letter = int(rcd[0]) if rcd[0].isdigit() else 1, rcd[-1].upper()
-            if num >= 4 and letter in ("D", "E"):
-                result["max_aircraft_weight"] = 400 if letter == "D" else 575
-            elif num >= 4:
-                result["max_aircraft_weight"] = 80
-            elif num >= 3:
-                result["max_aircraft_weight"] = 80 if letter in ("C", "D", "E") else 50
-            else:
-                result["max_aircraft_weight"] = 50
-
-        # Fallback: inferir usage/avsec do RCD quando CAT CIVIL não encontrada
-        if not result.get("usage_class") and rcd:
-            num = int(rcd[0]) if rcd[0].isdigit() else 1
-            letter = rcd[-1].upper() if len(rcd) > 1 else "C"
-            if num >= 4 and letter in ("D", "E"):
-                result["usage_class"], result["avsec_classification"] = "IV", "AP-3"
-            elif num >= 4:
-                result["usage_class"], result["avsec_classification"] = "III", "AP-2"
-            elif num >= 3:
-                result["usage_class"], result["avsec_classification"] = "II", "AP-1"
-            else:
-                result["usage_class"], result["avsec_classification"] = "I", "AP-1"
-
-        # Log campos ausentes em nível DEBUG (útil para diagnóstico)
-        missing = [k for k in ("city", "state", "latitude", "longitude", "reference_code", "fire_category", "max_aircraft_weight") if result.get(k) is None]
-        if missing:
-            logger.debug("eAIS %s: campos não extraídos: %s", icao, missing)
-
-        return result
+
+    # Fallback: inferir max_aircraft_weight do RCD quando PRAI não tem peso explícito
+    if not result.get("max_aircraft_weight") and rcd and len(rcd) >= 2:
+        num, letter = int(rcd[0]) if rcd[0].isdigit() else 1, rcd[-1].upper()
+        if num >= 4 and letter in ("D", "E"):
+            result["max_aircraft_weight"] = 400 if letter == "D" else 575
+        elif num >= 4:
+            result["max_aircraft_weight"] = 80
+        elif num >= 3:
+            result["max_aircraft_weight"] = 80 if letter in ("C", "D", "E") else 50
+        else:
+            result["max_aircraft_weight"] = 50
+
+    # Fallback: inferir usage/avsec do RCD quando CAT CIVIL não encontrada
+    if not result.get("usage_class") and rcd:
+        num = int(rcd[0]) if rcd[0].isdigit() else 1
+        letter = rcd[-1].upper() if len(rcd) > 1 else "C"
+        if num >= 4 and letter in ("D", "E"):
+            result["usage_class"], result["avsec_classification"] = "IV", "AP-3"
+        elif num >= 4:
+            result["usage_class"], result["avsec_classification"] = "III", "AP-2"
+        elif num >= 3:
+            result["usage_class"], result["avsec_classification"] = "II", "AP-1"
+        else:
+            result["usage_class"], result["avsec_classification"] = "I", "AP-1"
+
+    # Log campos ausentes em nível DEBUG (útil para diagnóstico)
+    missing = [k for k in ("city", "state", "latitude", "longitude", "reference_code", "fire_category", "max_aircraft_weight") if result.get(k) is None]
+    if missing:
+        logger.debug("eAIS %s: campos não extraídos: %s", icao, missing)
+
+    return result
+
+
+def fetch_eais_airport(icao_code: str) -> Optional[Dict]:
+    """
+    Busca dados do aeródromo no eAIS (AISWEB) - ÚNICA FONTE.
+    Retorna dict com todos os campos para cadastro e conformidade.
+    """
+    icao = _normalize_icao(icao_code)
+    if not icao:
+        return None
+    try:
+        return parse_eais_html(_fetch_html(icao), icao)
     except requests.RequestException as e:
         logger.warning("eAIS: erro de requisição para %s: %s", icao_code, e)
         return None
@@ -349,13 +477,11 @@ def fetch_eais_raw_html(icao_code: str) -> Optional[str]:
     Busca o HTML bruto do eAIS para um aeródromo.
     Usado pelo endpoint de diagnóstico.
     """
-    icao = icao_code.upper().strip()
-    if len(icao) != 4 or not icao.isalpha():
+    icao = _normalize_icao(icao_code)
+    if not icao:
         return None
     try:
-        r = requests.get(EAIS_URL.format(icao=icao), headers=HEADERS, timeout=20)
-        r.raise_for_status()
-        return r.text
+        return _fetch_html(icao)
     except Exception as e:
         logger.warning("eAIS raw: erro ao buscar HTML para %s: %s", icao_code, e)
         return None
@@ -0,0 +1,140 @@
+"""
+Pacote de evidências de um aeroporto (GET /api/airports/{id}/evidence.zip): todos os anexos,
+agrupados por norma, num ZIP gerado em streaming.
+
+O ZIP é escrito num destino não posicionável (zipfile usa data descriptors), que só acumula
+os bytes até o próximo yield: cada arquivo é copiado em blocos de EVIDENCE_ZIP_CHUNK_SIZE,
+então a memória é constante e o primeiro byte sai logo após o primeiro cabeçalho, sem montar
+o pacote no disco. Os anexos vão sem compressão (PDF/JPG/DOCX já são comprimidos); o
+manifest.json (aeroporto, normas com código e status, anexos com hash) vai no final.
+"""
+import io
+import json
+import os
+import re
+import zipfile
+from datetime import datetime
+from typing import Dict, Iterator, List
+
+from app.models import ComplianceRecord, DocumentAttachment, Regulation
+
+EVIDENCE_ZIP_CHUNK_SIZE = int(os.getenv("EVIDENCE_ZIP_CHUNK_SIZE", str(64 * 1024)))
+MANIFEST_NAME = "manifest.json"
+
+
+class _Sink(io.RawIOBase):
+    """Destino do ZipFile: guarda o que foi escrito até drain()."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _safe(name: str) -> str:
+    return re.sub(r'[\\/:*?"<>|\x00-\x1f]+', "_", name or "").strip(" .") or "arquivo"
+
+
+def _value(v):
+    return v.value if hasattr(v, "value") else v
+
+
+def collect_evidence(db, airport) -> Dict:
+    """
+    Manifesto do pacote: todas as normas do aeroporto (código, status) com os anexos e o
+    caminho de cada um no ZIP (<código da norma>/<arquivo>). Só metadados; os arquivos são
+    lidos durante o streaming.
+    """
+    records = (
+        db.query(ComplianceRecord, Regulation)
+        .join(Regulation, ComplianceRecord.regulation_id == Regulation.id)
+        .filter(ComplianceRecord.airport_id == airport.id)
+        .order_by(Regulation.code)
+    )
+    regulations: Dict[int, Dict] = {}
+    for record, regulation in records:
+        regulations[record.id] = {
+            "code": regulation.code,
+            "title": regulation.title,
+            "anac_reference": regulation.anac_reference,
+            "status": _value(record.status),
+            "last_verified": record.last_verified,
+            "documents": [],
+        }
+    documents = (
+        db.query(DocumentAttachment)
+        .filter(DocumentAttachment.compliance_record_id.in_(list(regulations)))
+        .order_by(DocumentAttachment.uploaded_at, DocumentAttachment.id)
+    ) if regulations else []
+    used = set()
+    for doc in documents:
+        entry = regulations[doc.compliance_record_id]
+        folder = _safe(entry["code"])
+        base, ext = os.path.splitext(_safe(doc.filename))
+        arcname, n = f"{folder}/{base}{ext}", 1
+        while arcname in used:
+            n += 1
+            arcname = f"{folder}/{base} ({n}){ext}"
+        used.add(arcname)
+        entry["documents"].append({
+            "id": doc.id,
+            "filename": doc.filename,
+            "path": arcname,
+            "size": doc.file_size,
+            "sha256": doc.sha256,
+            "document_type": doc.document_type,
+            "description": doc.description,
+            "uploaded_at": doc.uploaded_at.isoformat() if doc.uploaded_at else None,
+            "uploaded_by": doc.uploaded_by,
+            "_source": doc.file_path,
+        })
+    return {
+        "airport": {"id": airport.id, "code": airport.code, "name": airport.name},
+        "generated_at": datetime.utcnow().isoformat(),
+        "document_count": sum(len(r["documents"]) for r in regulations.values()),
+        "regulations": list(regulations.values()),
+    }
+
+
+def stream_zip(manifest: Dict, chunk_size: int = EVIDENCE_ZIP_CHUNK_SIZE, open_file=open) -> Iterator[bytes]:
+    """Gera o ZIP em pedaços. Anexos ausentes no disco ficam no manifesto com missing=true."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for regulation in manifest["regulations"]:
+            for doc in regulation["documents"]:
+                source = doc.pop("_source")
+                try:
+                    src = open_file(source, "rb")
+                except OSError:
+                    doc["missing"] = True
+                    continue
+                with src:
+                    stamp = datetime.fromisoformat(doc["uploaded_at"]) if doc["uploaded_at"] else datetime.utcnow()
+                    info = zipfile.ZipInfo(doc["path"], date_time=stamp.timetuple()[:6])
+                    with zf.open(info, "w", force_zip64=(doc["size"] or 0) > 0x7FFFFFFF) as dest:
+                        while True:
+                            block = src.read(chunk_size)
+                            if not block:
+                                break
+                            dest.write(block)
+                            data = sink.drain()
+                            if data:
+                                yield data
+                data = sink.drain()
+                if data:
+                    yield data
+        zf.writestr(
+            MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+    yield sink.drain()
@@ -0,0 +1,143 @@
+"""
+Download de anexos com validadores HTTP (GET /api/documents/{id}/download).
+
+  - ETag forte com o SHA-256 do conteúdo (anexos antigos sem hash: ETag fraco de
+    tamanho+mtime) e Last-Modified
+  - If-None-Match / If-Modified-Since -> 304 sem corpo
+  - Range (um intervalo, ex.: leitores de PDF que pedem páginas) -> 206 com Content-Range;
+    intervalo fora do arquivo -> 416; If-Range que não confere -> arquivo inteiro
+  - Cache-Control: anexos no armazenamento por conteúdo nunca mudam (immutable); os demais
+    são revalidados (no-cache). Sempre private: os downloads podem exigir login.
+"""
+import os
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+RANGE_CHUNK_SIZE = 64 * 1024
+IMMUTABLE_CACHE = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE = "private, no-cache"
+
+
+def make_etag(sha256: Optional[str], stat_result: os.stat_result) -> str:
+    if sha256:
+        return f'"{sha256}"'
+    return f'W/"{stat_result.st_size:x}-{int(stat_result.st_mtime):x}"'
+
+
+def _etag_list(header: str):
+    return [t.strip() for t in header.split(",") if t.strip()]
+
+
+def _weak_match(etag: str, header: str) -> bool:
+    """Comparação fraca (If-None-Match): ignora o prefixo W/."""
+    tags = _etag_list(header)
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return "*" in tags or any((t[2:] if t.startswith("W/") else t) == bare for t in tags)
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (início, fim inclusivo) de um Range "bytes=a-b" / "bytes=a-" / "bytes=-n".
+    None = ignorar (sem Range, sintaxe inválida ou vários intervalos).
+    Levanta ValueError se o intervalo não é satisfazível.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, sep, end_s = header[6:].strip().partition("-")
+    if not sep or (start_s == end_s == "") or not all(p == "" or p.isdigit() for p in (start_s, end_s)):
+        return None
+    if start_s == "":
+        suffix = int(end_s)
+        if suffix == 0 or size == 0:
+            raise ValueError("range vazio")
+        return max(0, size - suffix), size - 1
+    start = int(start_s)
+    if end_s and int(end_s) < start:
+        return None
+    if start >= size:
+        raise ValueError("range fora do arquivo")
+    end = int(end_s) if end_s else size - 1
+    return start, min(end, size - 1)
+
+
+def _content_disposition(filename: str, disposition: str = "attachment") -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+
+def _iter_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            block = f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+def serve_file(request, path: str, *, media_type: str, filename: str, sha256: Optional[str] = None,
+               last_modified: Optional[datetime] = None, immutable: bool = False,
+               inline: bool = False) -> Response:
+    stat_result = os.stat(path)
+    etag = make_etag(sha256, stat_result)
+    modified = last_modified.replace(tzinfo=timezone.utc) if last_modified else \
+        datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc)
+    modified = modified.replace(microsecond=0)
+    headers = {
+        "Content-Disposition": _content_disposition(filename, "inline" if inline else "attachment"),
+        "ETag": etag,
+        "Last-Modified": formatdate(modified.timestamp(), usegmt=True),
+        "Cache-Control": IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE,
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _weak_match(etag, if_none_match):
+            return Response(status_code=304, headers=headers)
+    else:
+        since = _parse_date(request.headers.get("if-modified-since"))
+        if since is not None and modified <= since:
+            return Response(status_code=304, headers=headers)
+
+    size = stat_result.st_size
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    range_allowed = if_range is None or (
+        if_range == etag and not etag.startswith("W/")  # If-Range exige comparação forte
+        or (_parse_date(if_range) is not None and _parse_date(if_range) >= modified)
+    )
+    if range_allowed:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is None:
+        return FileResponse(
+            path, media_type=media_type, filename=filename, stat_result=stat_result,
+            headers=headers, method=request.method,
+        )
+    start, end = byte_range
+    return StreamingResponse(
+        _iter_range(path, start, end), status_code=206, media_type=media_type,
+        headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)},
+    )
@@ -0,0 +1,200 @@
+"""
+Eleição de líder entre workers (uvicorn --workers N, várias réplicas) para tarefas singleton:
+migrações/seed do startup e a carga completa de anac_airports.
+
+Cada tarefa tem um lease nomeado:
+  - PostgreSQL: advisory lock de sessão (pg_advisory_lock / pg_try_advisory_lock) numa conexão
+    reservada enquanto o lease dura; cai sozinho se o processo morrer
+  - SQLite/outros: flock exclusivo em LEADER_LOCK_DIR/<nome>.lock (só vale entre processos da
+    mesma máquina, que é o caso do SQLite). Sem fcntl (Windows) o lease é sempre concedido.
+
+lease(nome, blocking=True) espera o dono atual (usado no startup: quem chega depois encontra
+as etapas já gravadas em schema_meta e pula); blocking=False desiste na hora (tarefas em
+background que outro worker já está fazendo). Quem obtém um lease grava em worker_leases;
+leases() lista os dados com o estado real do lock (GET /api/health/leases).
+"""
+import hashlib
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import WorkerLease
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LEADER_LOCK_DIR = Path(os.getenv(
+    "LEADER_LOCK_DIR", str(Path(__file__).resolve().parent.parent.parent / "data" / "locks")
+))
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# Leases obtidos por este processo: nome → desde quando
+_held: Dict[str, datetime] = {}
+_held_lock = threading.Lock()
+
+
+def advisory_key(name: str) -> int:
+    """Chave bigint (com sinal) do advisory lock de um lease."""
+    return int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+class _PgLock:
+    def __init__(self, engine, name: str):
+        self.engine = engine
+        self.key = advisory_key(name)
+        self._conn = None
+
+    def acquire(self, blocking: bool) -> bool:
+        conn = self.engine.connect()
+        try:
+            if blocking:
+                conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": self.key})
+                acquired = True
+            else:
+                acquired = bool(conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": self.key}).scalar())
+            conn.commit()  # lock de sessão continua; não deixa transação aberta
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": self.key})
+            conn.commit()
+            conn.close()
+        except Exception:
+            # Conexão com problema: descarta em vez de devolver ao pool com o lock preso
+            conn.invalidate()
+
+    def is_held(self) -> bool:
+        unsigned = self.key & 0xFFFFFFFFFFFFFFFF
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text(
+                    "SELECT 1 FROM pg_locks WHERE locktype = 'advisory' AND granted"
+                    " AND classid = :hi AND objid = :lo AND objsubid = 1"
+                ),
+                {"hi": unsigned >> 32, "lo": unsigned & 0xFFFFFFFF},
+            ).first() is not None
+
+
+class _FileLock:
+    def __init__(self, name: str, lock_dir: Path):
+        self.path = Path(lock_dir) / f"{name}.lock"
+        self._file = None
+
+    def acquire(self, blocking: bool) -> bool:
+        if fcntl is None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(self.path, "a+")
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            f.close()
+            return False
+        f.seek(0)
+        f.truncate()
+        f.write(f"{WORKER_ID}\n")
+        f.flush()
+        self._file = f
+        return True
+
+    def release(self) -> None:
+        f, self._file = self._file, None
+        if f is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            f.close()
+
+    def is_held(self) -> bool:
+        if fcntl is None or not self.path.exists():
+            return False
+        with open(self.path, "a+") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return False
+
+
+def _make_lock(engine, name: str, lock_dir: Optional[Path]):
+    if engine.dialect.name == "postgresql":
+        return _PgLock(engine, name)
+    return _FileLock(name, lock_dir or LEADER_LOCK_DIR)
+
+
+def _record(engine, name: str, released: bool) -> None:
+    """Grava o dono em worker_leases (ignora falha: a tabela pode não existir antes do schema)."""
+    try:
+        with Session(engine) as db:
+            row = db.get(WorkerLease, name)
+            if released:
+                if row is not None and row.holder == WORKER_ID:
+                    row.released_at = datetime.utcnow()
+            else:
+                db.merge(WorkerLease(name=name, holder=WORKER_ID, acquired_at=datetime.utcnow(), released_at=None))
+            db.commit()
+    except Exception:
+        pass
+
+
+@contextmanager
+def lease(name: str, blocking: bool = False, engine=None, lock_dir: Optional[Path] = None) -> Iterator[bool]:
+    """Obtém o lease durante o bloco. Rende True se este worker é o dono, False se outro é."""
+    if engine is None:
+        from app.database import engine
+    lock = _make_lock(engine, name, lock_dir)
+    acquired = lock.acquire(blocking)
+    if acquired:
+        with _held_lock:
+            _held[name] = datetime.utcnow()
+        _record(engine, name, released=False)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            lock.release()
+            with _held_lock:
+                _held.pop(name, None)
+            _record(engine, name, released=True)
+
+
+def leases(engine=None, lock_dir: Optional[Path] = None) -> List[Dict]:
+    """Leases conhecidos: último dono, se o lock está preso agora e se é este worker."""
+    if engine is None:
+        from app.database import engine
+    with Session(engine) as db:
+        rows = db.query(WorkerLease).order_by(WorkerLease.name).all()
+    result = []
+    for row in rows:
+        try:
+            active = _make_lock(engine, row.name, lock_dir).is_held()
+        except Exception:
+            active = None
+        result.append({
+            "name": row.name,
+            "holder": row.holder,
+            "acquired_at": row.acquired_at.isoformat() if row.acquired_at else None,
+            "released_at": row.released_at.isoformat() if row.released_at else None,
+            "active": active,
+            "held_by_this_worker": row.name in _held and row.holder == WORKER_ID,
+        })
+    return result
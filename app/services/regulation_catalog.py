@@ -0,0 +1,123 @@
+"""
+Versionamento do catálogo de normas (seed_data.regulation_catalog) na tabela regulations.
+
+Cada norma guarda dois hashes:
+  - content_hash: dos campos do catálogo; o seed só escreve linhas cujo hash mudou, e só os
+    campos alterados
+  - template_hash: dos itens de ação gerados pelo ComplianceEngine (template_fingerprint);
+    muda quando o texto da norma ou os modelos de itens de ação no código mudam
+
+Depois do commit, só os registros de conformidade das normas afetadas são recalculados, em
+lote (ComplianceEngine.reconcile_airports com regulation_ids): normas novas ou com
+aplicabilidade alterada ganham/perdem registros; normas com template alterado também têm os
+itens de ação regerados. Atualizar o catálogo deixa de exigir o refresh-all da frota.
+"""
+import enum
+import hashlib
+import json
+from typing import Dict, List
+
+from app.models import Airport, Regulation
+
+# Campos da norma que decidem a quais aeroportos ela se aplica
+REGULATION_APPLICABILITY_COLUMNS = (
+    "applies_to_sizes", "applies_to_types", "min_passengers", "requires_international",
+    "requires_cargo", "requires_maintenance", "min_runways", "min_aircraft_weight",
+)
+CATALOG_REASON = "catálogo de normas atualizado"
+
+
+def _plain(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def regulation_hash(data: Dict) -> str:
+    """Hash dos campos de uma entrada do catálogo (independe da ordem das chaves)."""
+    payload = json.dumps(
+        {k: _plain(v) for k, v in data.items()}, ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def apply_catalog(db, catalog: List[Dict], update_existing: bool = True) -> Dict:
+    """
+    Grava o catálogo em regulations (inserindo normas novas e, com update_existing, só as
+    alteradas) e recalcula a conformidade das normas afetadas. Retorna um resumo.
+    """
+    from app.compliance_engine import ComplianceEngine
+
+    engine = ComplianceEngine(db)
+    existing = {r.code: r for r in db.query(Regulation)}
+    summary = {"added": 0, "updated": 0, "unchanged": 0, "total": len(catalog), "compliance": None}
+    added, applicability_changed, template_changed = [], set(), set()
+
+    for data in catalog:
+        content_hash = regulation_hash(data)
+        regulation = existing.get(data["code"])
+        if regulation is None:
+            regulation = Regulation(**data, content_hash=content_hash)
+            regulation.template_hash = engine.template_fingerprint(regulation)
+            db.add(regulation)
+            added.append(regulation)
+            continue
+        if not update_existing or regulation.content_hash == content_hash:
+            # Hash igual ao gravado: nada a escrever, mas o código dos templates pode ter mudado
+            if update_existing:
+                fingerprint = engine.template_fingerprint(regulation)
+                if regulation.template_hash != fingerprint:
+                    regulation.template_hash = fingerprint
+                    template_changed.add(regulation.id)
+                    summary["updated"] += 1
+                    continue
+            summary["unchanged"] += 1
+            continue
+        changed = {k: v for k, v in data.items() if k != "code" and getattr(regulation, k, None) != v}
+        for key, value in changed.items():
+            setattr(regulation, key, value)
+        regulation.content_hash = content_hash
+        if any(k in changed for k in REGULATION_APPLICABILITY_COLUMNS):
+            applicability_changed.add(regulation.id)
+        fingerprint = engine.template_fingerprint(regulation)
+        if regulation.template_hash != fingerprint:
+            # template_hash vazio (linha anterior ao versionamento) também regera os itens
+            regulation.template_hash = fingerprint
+            template_changed.add(regulation.id)
+        summary["updated" if changed else "unchanged"] += 1
+
+    summary["added"] = len(added)
+    if not (db.new or db.dirty):
+        return summary
+    db.commit()
+
+    applicability_changed |= {r.id for r in added}
+    applicability_changed -= template_changed
+    if applicability_changed or template_changed:
+        airport_ids = [airport_id for (airport_id,) in db.query(Airport.id)]
+        compliance = {"airports": 0, "created": 0, "retired": 0, "restored": 0, "action_items_regenerated": 0}
+        for regulation_ids, regenerate in ((applicability_changed, False), (template_changed, True)):
+            if not regulation_ids:
+                continue
+            result = engine.reconcile_airports(
+                airport_ids, regulation_ids=sorted(regulation_ids),
+                regenerate_action_items=regenerate, reason=CATALOG_REASON,
+            )
+            for key in compliance:
+                compliance[key] = max(compliance[key], result[key]) if key == "airports" else compliance[key] + result[key]
+        summary["compliance"] = compliance
+    return summary
+
+
+def catalog_fingerprint(catalog: List[Dict]) -> str:
+    """
+    Hash do catálogo inteiro, incluindo os itens de ação gerados (muda com o código dos
+    templates). Usado no startup para pular o seed quando nada mudou.
+    """
+    from app.compliance_engine import ComplianceEngine
+
+    engine = ComplianceEngine(None)
+    digest = hashlib.sha256()
+    for data in sorted(catalog, key=lambda d: d["code"]):
+        digest.update(regulation_hash(data).encode("ascii"))
+        digest.update(engine.template_fingerprint(Regulation(**data)).encode("ascii"))
+    return digest.hexdigest()
@@ -0,0 +1,277 @@
+"""
+Busca textual no catálogo de normas (GET /api/regulations/search).
+
+Índice invertido em memória, por processo, sobre código, título, referência ANAC, descrição,
+requisitos e desempenho esperado:
+  - palavras sem acento e em maiúsculas (fold_text da busca de aeródromos) e com o plural
+    reduzido ("inspeções" e "inspeção" -> INSPECAO, "extintores" -> EXTINTOR)
+  - todos os termos precisam aparecer (em qualquer campo); o último também como prefixo
+    (busca enquanto digita), do radical e da palavra como foi escrita ("extintore" e
+    "inspeçõ" casam com EXTINTOR e INSPECAO)
+  - ranking BM25 com peso por campo (código e título valem mais que o texto dos requisitos);
+    código exato vai para o topo
+  - trechos com os termos destacados entre «» por campo
+  - filtros por classificação, categoria de segurança e aplicabilidade a um aeroporto
+    (ComplianceEngine.regulation_applies_to_airport)
+
+O catálogo tem dezenas de normas: o índice inteiro é remontado quando a tabela muda. A
+verificação (ids e content_hash das normas) roda a cada
+REGULATION_SEARCH_REFRESH_SECONDS ou logo após o seed neste processo (invalidate).
+"""
+import bisect
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.models import Regulation
+from app.services.airport_search import fold_text
+
+REGULATION_SEARCH_REFRESH_SECONDS = float(os.getenv("REGULATION_SEARCH_REFRESH_SECONDS", "60"))
+
+# Campo -> peso no ranking
+FIELD_WEIGHTS = {
+    "code": 6.0,
+    "title": 4.0,
+    "anac_reference": 3.0,
+    "description": 2.0,
+    "requirements": 1.0,
+    "expected_performance": 1.0,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_QUERY_LENGTH = 200
+SNIPPET_WORDS = 24
+HIGHLIGHT_START, HIGHLIGHT_END = "«", "»"
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_PLURALS = (("OES", "AO"), ("AES", "AO"), ("AOS", "AO"), ("AIS", "AL"), ("EIS", "EL"), ("OIS", "OL"))
+
+
+def stem(word: str) -> str:
+    """Reduz o plural de uma palavra já normalizada (fold_text). Conservador: só sufixos comuns."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement in _PLURALS:
+        if word.endswith(suffix):
+            return word[:-len(suffix)] + replacement
+    if word.endswith("ES") and len(word) > 4 and word[-3] in "RSZ":
+        return word[:-2]
+    if word.endswith("S") and not word.endswith("SS"):
+        return word[:-1]
+    return word
+
+
+def _value(v):
+    return v.value if hasattr(v, "value") else v
+
+
+class _Doc:
+    __slots__ = ("id", "code", "title", "safety_category", "requirement_classification", "evaluation_type",
+                 "anac_reference", "texts", "length")
+
+    def __init__(self, regulation):
+        self.id = regulation.id
+        self.code = regulation.code
+        self.title = regulation.title
+        self.safety_category = _value(regulation.safety_category)
+        self.requirement_classification = _value(regulation.requirement_classification)
+        self.evaluation_type = _value(regulation.evaluation_type)
+        self.anac_reference = regulation.anac_reference
+        self.texts = {field: getattr(regulation, field) or "" for field in FIELD_WEIGHTS}
+        self.length = 0.0
+
+
+class RegulationSearchIndex:
+    """Índice invertido das normas: termo -> {id da norma: {campo: ocorrências}}."""
+
+    def __init__(self, refresh_seconds: float = REGULATION_SEARCH_REFRESH_SECONDS, clock=time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._docs: Dict[int, _Doc] = {}
+        self._postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        self._vocab: List[str] = []
+        self._surface: List[Tuple[str, str]] = []  # (palavra normalizada, termo), para prefixos
+        self._avg_length = 1.0
+        self._watermark = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # --- manutenção ---------------------------------------------------------
+
+    def build(self, regulations: Iterable) -> None:
+        docs: Dict[int, _Doc] = {}
+        postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        surface: Dict[str, str] = {}
+        for regulation in regulations:
+            doc = _Doc(regulation)
+            for field, weight in FIELD_WEIGHTS.items():
+                words = fold_text(doc.texts[field]).split()
+                doc.length += weight * len(words)
+                for word in words:
+                    term = surface.setdefault(word, stem(word))
+                    fields = postings.setdefault(term, {}).setdefault(doc.id, {})
+                    fields[field] = fields.get(field, 0) + 1
+            docs[doc.id] = doc
+        with self._lock:
+            self._docs, self._postings = docs, postings
+            self._vocab = sorted(postings)
+            self._surface = sorted(surface.items())
+            self._avg_length = (sum(d.length for d in docs.values()) / len(docs)) if docs else 1.0
+
+    def invalidate(self) -> None:
+        """Força a verificação da tabela na próxima busca (ex.: logo após o seed do catálogo)."""
+        self._checked_at = None
+
+    def _current_watermark(self, db) -> str:
+        rows = db.query(Regulation.id, Regulation.content_hash).order_by(Regulation.id).all()
+        return hashlib.sha256(repr(rows).encode()).hexdigest()
+
+    def refresh(self, db) -> None:
+        """Remonta o índice se as normas mudaram desde a última montagem."""
+        watermark = self._current_watermark(db)
+        if watermark != self._watermark:
+            self.build(db.query(Regulation).all())
+            self._watermark = watermark
+        self._checked_at = self._clock()
+
+    def ensure_fresh(self, db) -> None:
+        checked = self._checked_at
+        if checked is None or self._clock() - checked >= self.refresh_seconds:
+            self.refresh(db)
+
+    # --- busca --------------------------------------------------------------
+
+    def _expand(self, term: str, prefix: Optional[str] = None) -> Dict[str, float]:
+        """
+        Termos do vocabulário aceitos -> fator (termo exato 1.0, prefixo menos). prefix é a
+        palavra digitada (normalizada, sem radical): casa também com o início das palavras
+        originais, já que o radical de uma palavra incompleta nem sempre é prefixo do termo.
+        """
+        matches = {term: 1.0} if term in self._postings else {}
+        if prefix is not None:
+            i = bisect.bisect_left(self._vocab, term)
+            while i < len(self._vocab) and self._vocab[i].startswith(term):
+                word = self._vocab[i]
+                matches.setdefault(word, 0.5 + 0.5 * len(term) / len(word))
+                i += 1
+            i = bisect.bisect_left(self._surface, (prefix,))
+            while i < len(self._surface) and self._surface[i][0].startswith(prefix):
+                word, vocab_term = self._surface[i]
+                factor = 0.5 + 0.5 * len(prefix) / len(word)
+                matches[vocab_term] = max(matches.get(vocab_term, 0.0), factor)
+                i += 1
+        return matches
+
+    def _score_term(self, vocab_term: str) -> Dict[int, float]:
+        postings = self._postings[vocab_term]
+        idf = math.log(1 + (len(self._docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+        scores = {}
+        for doc_id, fields in postings.items():
+            tf = sum(FIELD_WEIGHTS[f] * n for f, n in fields.items())
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._docs[doc_id].length / self._avg_length)
+            scores[doc_id] = idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: str, limit: int = 20, allowed: Optional[Set[int]] = None,
+               safety_category: Optional[str] = None, classification: Optional[str] = None) -> List[Dict]:
+        words = fold_text((query or "")[:MAX_QUERY_LENGTH]).split()
+        terms = [stem(w) for w in words]
+        if not terms or limit <= 0:
+            return []
+        with self._lock:
+            scores: Optional[Dict[int, float]] = None
+            matched: Set[str] = set()
+            for i, term in enumerate(terms):
+                per_term: Dict[int, float] = {}
+                # Último termo também como prefixo (busca enquanto digita)
+                prefix = words[i] if i == len(terms) - 1 else None
+                for word, factor in self._expand(term, prefix).items():
+                    matched.add(word)
+                    for doc_id, score in self._score_term(word).items():
+                        per_term[doc_id] = max(per_term.get(doc_id, 0.0), factor * score)
+                scores = per_term if scores is None else {
+                    d: s + per_term[d] for d, s in scores.items() if d in per_term
+                }
+                if not scores:
+                    return []
+
+            folded_query = fold_text(query)
+            results: List[Tuple[float, _Doc]] = []
+            for doc_id, score in scores.items():
+                doc = self._docs[doc_id]
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                if safety_category and doc.safety_category != safety_category:
+                    continue
+                if classification and doc.requirement_classification != classification:
+                    continue
+                if fold_text(doc.code) == folded_query:
+                    score += 1000.0
+                results.append((score, doc))
+            results.sort(key=lambda item: (-item[0], item[1].code))
+            return [self._result(doc, score, matched) for score, doc in results[:limit]]
+
+    def _result(self, doc: _Doc, score: float, matched: Set[str]) -> Dict:
+        highlights = {}
+        for field in FIELD_WEIGHTS:
+            snippet = highlight(doc.texts[field], matched)
+            if snippet:
+                highlights[field] = snippet
+        return {
+            "id": doc.id,
+            "code": doc.code,
+            "title": doc.title,
+            "safety_category": doc.safety_category,
+            "requirement_classification": doc.requirement_classification,
+            "evaluation_type": doc.evaluation_type,
+            "anac_reference": doc.anac_reference,
+            "score": round(score, 4),
+            "highlights": highlights,
+        }
+
+
+def highlight(value: str, matched: Set[str], max_words: int = SNIPPET_WORDS) -> Optional[str]:
+    """
+    Trecho do texto com as palavras encontradas entre «». Textos curtos vão inteiros; nos
+    longos, uma janela de max_words palavras a partir de pouco antes da primeira ocorrência.
+    None se nenhuma palavra do campo casou.
+    """
+    words = list(_WORD_RE.finditer(value or ""))
+    hits = [i for i, m in enumerate(words) if stem(fold_text(m.group())) in matched]
+    if not hits:
+        return None
+    first = max(0, hits[0] - 4) if len(words) > max_words else 0
+    last = min(len(words), first + max_words)
+    start = words[first].start() if first else 0
+    end = words[last - 1].end() if last < len(words) else len(value)
+    parts, cursor = [], start
+    for i in hits:
+        if first <= i < last:
+            m = words[i]
+            parts.append(value[cursor:m.start()] + HIGHLIGHT_START + m.group() + HIGHLIGHT_END)
+            cursor = m.end()
+    parts.append(value[cursor:end])
+    return ("…" if start else "") + "".join(parts).strip() + ("…" if end < len(value) else "")
+
+
+search_index = RegulationSearchIndex()
+
+
+def search_regulations(db, query: str, limit: int = 20, airport=None, safety_category: Optional[str] = None,
+                       classification: Optional[str] = None) -> List[Dict]:
+    """Normas mais relevantes para a busca; airport restringe às aplicáveis ao aeroporto."""
+    search_index.ensure_fresh(db)
+    allowed = None
+    if airport is not None:
+        from app.compliance_engine import ComplianceEngine
+        allowed = {r.id for r in ComplianceEngine(db).get_applicable_regulations(airport)}
+    return search_index.search(
+        query, limit=limit, allowed=allowed, safety_category=safety_category, classification=classification,
+    )
@@ -0,0 +1,114 @@
+"""
+Inicialização incremental: etapas de startup controladas por hash (tabela schema_meta) e
+portão de prontidão.
+
+Cada etapa tem uma chave e um fingerprint (hash do que ela aplica: schema dos modelos, lista
+de migrações, catálogo de normas...). Se o valor gravado em schema_meta é igual ao atual, a
+etapa é pulada; senão roda e grava o novo valor (etapa com erro não grava, e roda de novo no
+próximo boot). Com nada mudado, o boot custa uma leitura de schema_meta.
+
+Etapas críticas (schema) rodam antes de servir; as demais rodam em background e, até
+terminarem, as rotas /api/ esperam o portão (StartupState.wait) em vez de responder com o
+banco pela metade. GET /api/health/ready expõe o estado.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import SchemaMeta
+
+STARTUP_READY_TIMEOUT_SECONDS = float(os.getenv("STARTUP_READY_TIMEOUT_SECONDS", "30"))
+# Força todas as etapas (ignora os hashes gravados)
+STARTUP_FORCE = os.getenv("STARTUP_FORCE", "").lower() in ("1", "true", "yes")
+
+
+def fingerprint(*parts) -> str:
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(metadata, *extra) -> str:
+    """Hash das tabelas/colunas dos modelos mais o que mais a etapa aplicar (migrações, enums)."""
+    tables = {
+        name: [(c.name, str(c.type), c.nullable, c.primary_key) for c in table.columns]
+        for name, table in metadata.tables.items()
+    }
+    return fingerprint(tables, *extra)
+
+
+def read_meta(engine) -> Dict[str, str]:
+    """{chave: valor} de schema_meta; vazio se a tabela ainda não existe."""
+    try:
+        with Session(engine) as db:
+            return {key: value for key, value in db.query(SchemaMeta.key, SchemaMeta.value)}
+    except Exception:
+        return {}
+
+
+def write_meta(engine, key: str, value: str) -> None:
+    with Session(engine) as db:
+        db.merge(SchemaMeta(key=key, value=value))
+        db.commit()
+
+
+class StartupState:
+    """Estado das etapas de startup e portão de prontidão das rotas /api/."""
+
+    def __init__(self):
+        self.steps: Dict[str, Dict] = {}
+        self.started_at = time.monotonic()
+        self.ready_after: Optional[float] = None
+        self._ready = threading.Event()
+        self._meta: Dict[str, str] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def load_meta(self, engine) -> None:
+        self._meta = {} if STARTUP_FORCE else read_meta(engine)
+
+    def is_current(self, key: str, value: str) -> bool:
+        return self._meta.get(key) == value
+
+    def run_step(self, engine, key: str, value: str, fn: Callable[[], None]) -> bool:
+        """Roda fn se o hash gravado para key difere de value. Retorna True se rodou."""
+        started = time.monotonic()
+        if self.is_current(key, value):
+            self.steps[key] = {"status": "skipped", "seconds": 0.0}
+            return False
+        try:
+            fn()
+        except Exception as e:
+            self.steps[key] = {"status": "error", "error": str(e), "seconds": round(time.monotonic() - started, 3)}
+            print(f"⚠ Startup: etapa {key} falhou: {e}")
+            return True
+        try:
+            write_meta(engine, key, value)
+        except Exception as e:
+            print(f"⚠ Startup: não foi possível gravar a versão de {key}: {e}")
+        self._meta[key] = value
+        self.steps[key] = {"status": "done", "seconds": round(time.monotonic() - started, 3)}
+        return True
+
+    def mark_ready(self) -> None:
+        if not self._ready.is_set():
+            self.ready_after = round(time.monotonic() - self.started_at, 3)
+            self._ready.set()
+
+    async def wait(self, timeout: float = STARTUP_READY_TIMEOUT_SECONDS) -> bool:
+        if self._ready.is_set():
+            return True
+        return await asyncio.to_thread(self._ready.wait, timeout)
+
+    def snapshot(self) -> Dict:
+        return {"ready": self.ready, "ready_after_seconds": self.ready_after, "steps": dict(self.steps)}
+
+
+startup_state = StartupState()
@@ -0,0 +1,177 @@
+"""
+Armazenamento dos anexos: disco local (padrão) ou bucket compatível com S3 (AWS, MinIO, R2).
+
+Os anexos são identificados pelo file_path gravado em document_attachments:
+  - local: caminho no disco (uploads/blobs/aa/bb/<sha256>, uploads/record_<id>/...)
+  - S3: s3://<bucket>/<S3_PREFIX><chave>
+
+No Railway o disco é efêmero e não é compartilhado entre réplicas; com STORAGE_BACKEND=s3
+todas as réplicas usam o mesmo bucket. O upload continua sendo recebido em streaming no
+temporário local (app/services/uploads.py) e é enviado ao bucket em partes (multipart, em
+paralelo, acima de S3_MULTIPART_CHUNK_SIZE) fora do event loop; o download redireciona para
+uma URL pré-assinada, então os bytes não passam pelos workers. Anexos antigos gravados no
+disco continuam sendo lidos do disco.
+
+boto3 é opcional: só é necessário com STORAGE_BACKEND=s3. Credenciais pelas variáveis
+padrão da AWS (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY).
+"""
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
+except ImportError:  # opcional: sem boto3 só o armazenamento local
+    boto3 = None
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local").lower()
+S3_BUCKET = os.getenv("S3_BUCKET", "")
+S3_PREFIX = os.getenv("S3_PREFIX", "")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL") or None  # MinIO/R2; vazio = AWS
+S3_REGION = os.getenv("S3_REGION") or None
+S3_PRESIGN_SECONDS = int(os.getenv("S3_PRESIGN_SECONDS", "300"))
+S3_MULTIPART_CHUNK_SIZE = int(os.getenv("S3_MULTIPART_CHUNK_SIZE", str(8 * 1024 * 1024)))
+S3_MAX_CONCURRENCY = int(os.getenv("S3_MAX_CONCURRENCY", "4"))
+
+S3_SCHEME = "s3://"
+
+
+def _content_disposition(filename: str) -> str:
+    return f"attachment; filename*=utf-8''{quote(filename)}"
+
+
+class LocalStorage:
+    """Anexos no disco, abaixo de root (o diretório de uploads)."""
+
+    name = "local"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def locator(self, key: str) -> str:
+        return str(self.root / key)
+
+    def exists(self, file_path: str) -> bool:
+        return os.path.exists(file_path)
+
+    def put(self, staged, key: str) -> str:
+        """Move o temporário do upload para a chave (os.replace, atômico)."""
+        return str(staged.commit(self.root / key))
+
+    def open(self, file_path: str) -> BinaryIO:
+        return open(file_path, "rb")
+
+    def delete(self, file_path: str) -> None:
+        Path(file_path).unlink(missing_ok=True)
+
+    def local_path(self, file_path: str) -> Optional[str]:
+        """Caminho para servir o arquivo pelo próprio app (None se não existe no disco)."""
+        return file_path if os.path.exists(file_path) else None
+
+    def presigned_url(self, file_path: str, filename: str, media_type: Optional[str] = None) -> Optional[str]:
+        return None
+
+
+class S3Storage:
+    """Anexos num bucket S3; file_paths que não são s3:// são lidos do disco (anexos antigos)."""
+
+    name = "s3"
+
+    def __init__(self, bucket: str, root: Path, prefix: str = S3_PREFIX, client=None,
+                 presign_seconds: int = S3_PRESIGN_SECONDS, chunk_size: int = S3_MULTIPART_CHUNK_SIZE,
+                 max_concurrency: int = S3_MAX_CONCURRENCY):
+        if boto3 is None:
+            raise RuntimeError("STORAGE_BACKEND=s3 requer o pacote boto3 (pip install boto3)")
+        if not bucket:
+            raise RuntimeError("STORAGE_BACKEND=s3 requer S3_BUCKET")
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client or boto3.client("s3", endpoint_url=S3_ENDPOINT_URL, region_name=S3_REGION)
+        self.presign_seconds = presign_seconds
+        self.transfer = TransferConfig(
+            multipart_threshold=chunk_size, multipart_chunksize=chunk_size, max_concurrency=max_concurrency,
+        )
+        self.local = LocalStorage(root)
+
+    def locator(self, key: str) -> str:
+        return f"{S3_SCHEME}{self.bucket}/{self.prefix}{key}"
+
+    def _split(self, file_path: str) -> Optional[Tuple[str, str]]:
+        if not file_path.startswith(S3_SCHEME):
+            return None
+        bucket, _, key = file_path[len(S3_SCHEME):].partition("/")
+        return bucket, key
+
+    def exists(self, file_path: str) -> bool:
+        target = self._split(file_path)
+        if target is None:
+            return self.local.exists(file_path)
+        try:
+            self.client.head_object(Bucket=target[0], Key=target[1])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def put(self, staged, key: str) -> str:
+        """Envia o temporário ao bucket (multipart acima do tamanho do bloco) e o apaga."""
+        try:
+            self.client.upload_file(str(staged.path), self.bucket, self.prefix + key, Config=self.transfer)
+        finally:
+            staged.discard()
+        return self.locator(key)
+
+    def open(self, file_path: str) -> BinaryIO:
+        target = self._split(file_path)
+        if target is None:
+            return self.local.open(file_path)
+        try:
+            return self.client.get_object(Bucket=target[0], Key=target[1])["Body"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                raise FileNotFoundError(file_path) from e
+            raise
+
+    def delete(self, file_path: str) -> None:
+        target = self._split(file_path)
+        if target is None:
+            self.local.delete(file_path)
+        else:
+            self.client.delete_object(Bucket=target[0], Key=target[1])
+
+    def local_path(self, file_path: str) -> Optional[str]:
+        return None if self._split(file_path) else self.local.local_path(file_path)
+
+    def presigned_url(self, file_path: str, filename: str, media_type: Optional[str] = None) -> Optional[str]:
+        target = self._split(file_path)
+        if target is None:
+            return None
+        params = {
+            "Bucket": target[0], "Key": target[1],
+            "ResponseContentDisposition": _content_disposition(filename),
+        }
+        if media_type:
+            params["ResponseContentType"] = media_type
+        return self.client.generate_presigned_url("get_object", Params=params, ExpiresIn=self.presign_seconds)
+
+
+_s3_storage: Optional[S3Storage] = None
+
+
+def get_storage(uploads_dir: Path):
+    """Armazenamento configurado em STORAGE_BACKEND (o cliente S3 é criado uma vez por processo)."""
+    global _s3_storage
+    if STORAGE_BACKEND != "s3":
+        return LocalStorage(uploads_dir)
+    if _s3_storage is None:
+        _s3_storage = S3Storage(S3_BUCKET, uploads_dir)
+    return _s3_storage
+
+
+def as_storage(target):
+    """Aceita um armazenamento ou um diretório (armazenamento local nesse diretório)."""
+    return target if hasattr(target, "put") else LocalStorage(target)
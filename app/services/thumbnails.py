@@ -0,0 +1,142 @@
+"""
+Miniaturas dos anexos (GET /api/documents/{id}/preview), para a lista de documentos do
+registro não precisar baixar os arquivos inteiros (fotos de inspeção TOPS, PDFs).
+
+  - imagens (JPG/PNG): reduzidas para caber em THUMBNAIL_SIZE px, orientação EXIF aplicada
+  - PDF: primeira página renderizada, se pypdfium2 estiver instalado
+  - demais tipos (DOC/XLS): sem miniatura
+
+As miniaturas são JPEG guardadas no armazenamento dos anexos (disco ou S3) em
+thumbnails/<aa>/<sha256>-<tamanho>.jpg: o mesmo conteúdo anexado em vários registros gera
+uma miniatura só, e ela nunca muda. Após o upload, um pool de THUMBNAIL_WORKERS threads gera
+a miniatura em background; o endpoint gera na hora se ela ainda não existir (anexos antigos).
+
+Pillow e pypdfium2 (PDF) estão em requirements.txt; a importação continua tolerante: sem eles não há miniaturas.
+"""
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from app.services.storage import as_storage
+from app.services.uploads import STAGING_DIRNAME, StagedUpload, file_extension
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # opcional: sem Pillow não há miniaturas
+    Image = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # opcional: sem pypdfium2 os PDFs ficam sem miniatura
+    pdfium = None
+
+THUMBNAIL_SIZE = int(os.getenv("THUMBNAIL_SIZE", "320"))
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "2"))
+THUMBNAILS_DIRNAME = "thumbnails"
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+# Anexos maiores que isso não são abertos para miniatura (proteção contra imagens gigantes)
+THUMBNAIL_MAX_SOURCE_BYTES = int(os.getenv("THUMBNAIL_MAX_SOURCE_BYTES", str(50 * 1024 * 1024)))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def thumbnail_key(sha256: str, size: int = THUMBNAIL_SIZE) -> str:
+    return f"{THUMBNAILS_DIRNAME}/{sha256[:2]}/{sha256}-{size}.jpg"
+
+
+def supports(document) -> bool:
+    """True se dá para gerar miniatura do anexo (conteúdo com hash e tipo suportado)."""
+    if Image is None or not document.sha256 or (document.file_size or 0) > THUMBNAIL_MAX_SOURCE_BYTES:
+        return False
+    ext = file_extension(document.filename)
+    return ext in IMAGE_EXTENSIONS or (ext == ".pdf" and pdfium is not None)
+
+
+def render(data: bytes, ext: str, size: int = THUMBNAIL_SIZE) -> bytes:
+    """JPEG de até size x size px a partir do conteúdo do anexo."""
+    if ext == ".pdf":
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page = pdf[0]
+            width, height = page.get_size()
+            image = page.render(scale=2 * size / max(width, height, 1)).to_pil()
+        finally:
+            pdf.close()
+    else:
+        image = Image.open(io.BytesIO(data))
+        image.draft("RGB", (size, size))  # JPEG: decodifica já reduzido
+        image = ImageOps.exif_transpose(image)
+    image.thumbnail((size, size))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    out = io.BytesIO()
+    image.save(out, "JPEG", quality=80, optimize=True)
+    return out.getvalue()
+
+
+def ensure_thumbnail(storage, uploads_dir: Path, document, size: int = THUMBNAIL_SIZE) -> Optional[str]:
+    """
+    file_path da miniatura do anexo, gerando-a se ainda não existe. None se o tipo não é
+    suportado ou o arquivo original não pode ser lido.
+    """
+    if not supports(document):
+        return None
+    storage = as_storage(storage)
+    key = thumbnail_key(document.sha256, size)
+    file_path = storage.locator(key)
+    if storage.exists(file_path):
+        return file_path
+    try:
+        with storage.open(document.file_path) as src:
+            data = src.read()
+        jpeg = render(data, file_extension(document.filename), size)
+    except Exception as e:  # Arquivo ausente, corrompido ou formato que o Pillow não lê
+        print(f"⚠ miniatura do anexo {document.id}: {e}")
+        return None
+    staging = Path(uploads_dir) / STAGING_DIRNAME
+    staging.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=staging, suffix=".part")
+    with os.fdopen(fd, "wb") as f:
+        f.write(jpeg)
+    return storage.put(StagedUpload(Path(tmp), len(jpeg), hashlib.sha256(jpeg).hexdigest()), key)
+
+
+def schedule(storage, uploads_dir: Path, document) -> bool:
+    """Gera a miniatura em background (uma vez por conteúdo, mesmo com uploads repetidos)."""
+    global _executor
+    if not supports(document):
+        return False
+    with _pending_lock:
+        if document.sha256 in _pending:
+            return False
+        _pending.add(document.sha256)
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumbnails")
+
+    # Cópia dos campos: o objeto do ORM pertence à sessão da requisição
+    snapshot = _DocumentRef(document)
+
+    def job():
+        try:
+            ensure_thumbnail(storage, uploads_dir, snapshot)
+        finally:
+            with _pending_lock:
+                _pending.discard(snapshot.sha256)
+
+    _executor.submit(job)
+    return True
+
+
+class _DocumentRef:
+    __slots__ = ("id", "filename", "file_path", "file_size", "sha256")
+
+    def __init__(self, document):
+        for name in self.__slots__:
+            setattr(self, name, getattr(document, name))
@@ -0,0 +1,101 @@
+"""
+Recebimento de anexos de conformidade (upload_document) em streaming.
+
+O corpo é lido em blocos de UPLOAD_CHUNK_SIZE e gravado num arquivo temporário no próprio
+diretório de uploads (mesmo sistema de arquivos: o os.replace final é atômico), com a escrita
+em thread para não bloquear o event loop. O limite de tamanho é verificado a cada bloco (o
+excesso é descartado sem ler o resto) e o SHA-256 é calculado durante a cópia. Memória por
+upload: um bloco, independente do tamanho do arquivo.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(256 * 1024)))
+ALLOWED_EXTENSIONS = {'.pdf', '.jpg', '.jpeg', '.png', '.doc', '.docx', '.xls', '.xlsx'}
+# Arquivos temporários ficam aqui dentro do diretório de uploads
+STAGING_DIRNAME = ".staging"
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, limit: int):
+        super().__init__(f"File size exceeds {limit // (1024 * 1024)}MB limit")
+        self.limit = limit
+
+
+class StagedUpload:
+    """Upload gravado no arquivo temporário, ainda não movido para o destino."""
+
+    def __init__(self, path: Path, size: int, sha256: str):
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+
+    def commit(self, destination: Path) -> Path:
+        """Move para o destino (atômico no mesmo sistema de arquivos)."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.path, destination)
+        self.path = destination
+        return destination
+
+    @property
+    def pending(self) -> bool:
+        """True enquanto o arquivo ainda está no diretório temporário (não foi movido por commit)."""
+        return Path(self.path).parent.name == STAGING_DIRNAME
+
+    def discard(self) -> None:
+        """Apaga o temporário; depois do commit o arquivo pertence ao destino e não é tocado."""
+        if self.pending:
+            Path(self.path).unlink(missing_ok=True)
+
+
+def _open_staging(uploads_dir: Path):
+    staging = Path(uploads_dir) / STAGING_DIRNAME
+    staging.mkdir(parents=True, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=staging, suffix=".part")
+    return os.fdopen(fd, "wb"), Path(path)
+
+
+def _finish(f) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+
+
+async def stage_upload(
+    file,
+    uploads_dir: Path,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> StagedUpload:
+    """
+    Copia o UploadFile para um temporário em uploads_dir/.staging, em blocos.
+    Levanta UploadTooLarge assim que o limite é passado (o temporário é apagado).
+    """
+    f, path = await asyncio.to_thread(_open_staging, uploads_dir)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(f.write, chunk)
+        await asyncio.to_thread(_finish, f)
+    except BaseException:
+        f.close()
+        path.unlink(missing_ok=True)
+        raise
+    return StagedUpload(path, size, digest.hexdigest())
+
+
+def file_extension(filename: Optional[str]) -> str:
+    return Path(filename or "").suffix.lower()
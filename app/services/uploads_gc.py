@@ -0,0 +1,179 @@
+"""
+Coleta de lixo do diretório de uploads: reconcilia os arquivos no disco com
+document_attachments/blobs.
+
+Órfãos:
+  - uploads/record_<id>/... sem DocumentAttachment com esse file_path (ex.: aeroporto
+    removido em cascata, que apaga as linhas mas não os arquivos)
+  - uploads/blobs/... sem linha em blobs (upload que falhou entre gravar o arquivo e o commit)
+  - temporários antigos em uploads/.staging (upload interrompido)
+  - blobs com ref_count zerado (blob_store.collect_garbage)
+
+O diretório é percorrido com os.scandir (sem montar a lista inteira em memória) e as
+consultas ao banco são feitas em lotes de UPLOADS_GC_BATCH_SIZE caminhos. Arquivos mais novos
+que BLOB_GC_GRACE_SECONDS são ignorados (upload em andamento). Na mesma passada, ref_count dos
+blobs é corrigido pela contagem real de anexos. dry_run só relata o que seria apagado.
+
+Com STORAGE_BACKEND=s3 o diretório local só tem temporários e anexos antigos; os blobs sem
+referências são apagados do bucket.
+
+Com UPLOADS_GC_INTERVAL_SECONDS > 0, um worker (lease "uploads_gc") roda a coleta
+periodicamente em background.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from sqlalchemy import func
+
+from app.models import Blob, DocumentAttachment
+from app.services.blob_store import BLOB_GC_GRACE_SECONDS, BLOBS_DIRNAME, collect_garbage
+from app.services.uploads import STAGING_DIRNAME
+
+UPLOADS_GC_BATCH_SIZE = int(os.getenv("UPLOADS_GC_BATCH_SIZE", "500"))
+UPLOADS_GC_INTERVAL_SECONDS = int(os.getenv("UPLOADS_GC_INTERVAL_SECONDS", "0"))
+
+
+def iter_files(root: Path) -> Iterator[Tuple[str, int, float]]:
+    """(caminho, tamanho, mtime) de cada arquivo abaixo de root, em streaming."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        yield entry.path, st.st_size, st.st_mtime
+        except FileNotFoundError:
+            continue
+
+
+def _batches(items: Iterator, size: int) -> Iterator[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _kind(root: Path, path: str) -> str:
+    """blob, staging, record (uploads/record_<id>/) ou other (nunca apagado)."""
+    parts = Path(path).relative_to(root).parts
+    if parts[0] == BLOBS_DIRNAME:
+        return "blob"
+    if parts[0] == STAGING_DIRNAME:
+        return "staging"
+    if parts[0].startswith("record_") and len(parts) > 1:
+        return "record"
+    return "other"
+
+
+def _remove_empty_dirs(root: Path) -> None:
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        if dirpath != str(root) and not dirnames and not filenames:
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass
+
+
+def collect_uploads(db, uploads_dir: Path, dry_run: bool = True, grace_seconds: int = BLOB_GC_GRACE_SECONDS,
+                    batch_size: int = UPLOADS_GC_BATCH_SIZE, now: float = None, storage=None) -> Dict:
+    """
+    Reconcilia uploads_dir com o banco. Retorna o relatório (arquivos, órfãos, bytes).
+    storage: onde estão os blobs (padrão: o próprio uploads_dir).
+    """
+    root = Path(uploads_dir)
+    storage = storage or root
+    now = time.time() if now is None else now
+    report = {
+        "dry_run": dry_run, "scanned": 0, "orphans": 0, "orphan_bytes": 0, "deleted": 0,
+        "reclaimed_bytes": 0, "ref_counts_fixed": 0, "by_kind": {"record": 0, "blob": 0, "staging": 0},
+    }
+    if not root.exists():
+        report["blobs"] = collect_garbage(db, storage, grace_seconds=grace_seconds, dry_run=dry_run)
+        return report
+
+    files = (f for f in iter_files(root) if now - f[2] >= grace_seconds)
+    for batch in _batches(files, batch_size):
+        report["scanned"] += len(batch)
+        records = [f for f in batch if _kind(root, f[0]) == "record"]
+        blobs = [f for f in batch if _kind(root, f[0]) == "blob"]
+        orphans = [f for f in batch if _kind(root, f[0]) == "staging"]
+        if records:
+            # file_path pode ter sido gravado relativo (padrão) ou absoluto
+            candidates = {f[0]: (f[0], os.path.abspath(f[0])) for f in records}
+            known = {
+                p for (p,) in db.query(DocumentAttachment.file_path)
+                .filter(DocumentAttachment.file_path.in_([c for pair in candidates.values() for c in pair]))
+            }
+            orphans += [f for f in records if not known.intersection(candidates[f[0]])]
+        if blobs:
+            shas = [Path(f[0]).name for f in blobs]
+            rows = {b.sha256: b for b in db.query(Blob).filter(Blob.sha256.in_(shas))}
+            counts = dict(
+                db.query(DocumentAttachment.sha256, func.count(DocumentAttachment.id))
+                .filter(DocumentAttachment.sha256.in_(shas)).group_by(DocumentAttachment.sha256)
+            )
+            for f, sha in zip(blobs, shas):
+                blob = rows.get(sha)
+                if blob is None:
+                    orphans.append(f)
+                elif blob.ref_count != counts.get(sha, 0):
+                    report["ref_counts_fixed"] += 1
+                    if not dry_run:
+                        blob.ref_count = counts.get(sha, 0)
+        for path, size, _ in orphans:
+            report["orphans"] += 1
+            report["orphan_bytes"] += size
+            report["by_kind"][_kind(root, path)] += 1
+            if not dry_run:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                report["deleted"] += 1
+                report["reclaimed_bytes"] += size
+        if not dry_run:
+            db.commit()
+
+    # Blobs que ficaram sem referência (inclusive os corrigidos acima)
+    report["blobs"] = collect_garbage(db, storage, grace_seconds=grace_seconds, dry_run=dry_run)
+    if not dry_run:
+        report["reclaimed_bytes"] += report["blobs"]["bytes"]
+        _remove_empty_dirs(root)
+    return report
+
+
+def start_periodic_gc(uploads_dir: Path, interval: int = UPLOADS_GC_INTERVAL_SECONDS, storage=None) -> bool:
+    """Thread em background que roda collect_uploads a cada interval segundos no worker líder."""
+    if interval <= 0:
+        return False
+
+    def loop():
+        from app.database import SessionLocal
+        from app.services.leader import lease
+        while True:
+            time.sleep(interval)
+            try:
+                with lease("uploads_gc") as leader:
+                    if not leader:
+                        continue
+                    db = SessionLocal()
+                    try:
+                        report = collect_uploads(db, uploads_dir, dry_run=False, storage=storage)
+                    finally:
+                        db.close()
+                    print(f"uploads gc: {report['deleted']} arquivo(s), {report['reclaimed_bytes']} bytes liberados")
+            except Exception as e:
+                print(f"⚠ uploads gc: {e}")
+
+    threading.Thread(target=loop, daemon=True, name="uploads-gc").start()
+    return True
@@ -0,0 +1,176 @@
+"""
+Saúde das fontes externas (AISWEB, sistemas.anac.gov.br, www.anac.gov.br).
+
+Cada host tem um circuit breaker: após UPSTREAM_FAILURE_THRESHOLD falhas seguidas
+(conexão, timeout, HTTP 5xx/429) o circuito abre e as chamadas seguintes falham na hora
+com UpstreamUnavailable - subclasse de requests.RequestException, então os tratamentos
+existentes (cache, fallback local) continuam valendo - em vez de esperar o timeout.
+Após UPSTREAM_RESET_SECONDS uma única requisição de teste é liberada (half-open): sucesso
+fecha o circuito, falha reabre.
+
+hedged() dispara alternativas (ex.: as URLs da ANAC) de forma escalonada e fica com a
+primeira que der certo.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "3"))
+UPSTREAM_RESET_SECONDS = float(os.getenv("UPSTREAM_RESET_SECONDS", "60"))
+# Espera antes de disparar a próxima alternativa enquanto a anterior não responde
+UPSTREAM_HEDGE_DELAY_SECONDS = float(os.getenv("UPSTREAM_HEDGE_DELAY_SECONDS", "2"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+T = TypeVar("T")
+
+
+class UpstreamUnavailable(requests.RequestException):
+    """Host com circuito aberto: a requisição nem foi feita."""
+
+
+class CircuitBreaker:
+    """Circuit breaker de um host (closed -> open -> half_open -> closed)."""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = UPSTREAM_FAILURE_THRESHOLD,
+        reset_timeout: float = UPSTREAM_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """Levanta UpstreamUnavailable se o circuito estiver aberto."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN and self._clock() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            raise UpstreamUnavailable(
+                f"{self.host} indisponível (circuito aberto após {self.failures} falhas: {self.last_error})"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("Upstream %s voltou: circuito fechado", self.host)
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning("Upstream %s: circuito aberto (%s)", self.host, error)
+                self.state = OPEN
+                self.opened_at = self._clock()
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, round(self.reset_timeout - (self._clock() - self.opened_at), 1))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "last_error": self.last_error,
+                "retry_in_seconds": retry_in,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def health_snapshot() -> Dict[str, Dict]:
+    """Estado do circuito de cada host já contatado."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.host: b.to_dict() for b in breakers}
+
+
+def guarded_get(url: str, session: Optional[requests.Session] = None, **kwargs) -> requests.Response:
+    """
+    requests.get (ou session.get) protegido pelo circuit breaker do host.
+    Falha na hora (UpstreamUnavailable) com o circuito aberto; 5xx/429 contam como falha.
+    """
+    breaker = breaker_for(url)
+    breaker.before_request()
+    try:
+        response = (session or requests).get(url, **kwargs)
+    except Exception as e:
+        breaker.record_failure(type(e).__name__)
+        raise
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        # 4xx (exceto 429) = host no ar; quem chamou decide o que fazer com o status
+        if response.status_code >= 500 or response.status_code == 429:
+            breaker.record_failure(f"HTTP {response.status_code}")
+            return response
+    breaker.record_success()
+    return response
+
+
+def hedged(attempts: List[Callable[[], Optional[T]]], delay: float = UPSTREAM_HEDGE_DELAY_SECONDS) -> Optional[T]:
+    """
+    Executa as alternativas em ordem de preferência, disparando a próxima quando a atual
+    falha (exceção ou None) ou demora mais que `delay` segundos. Retorna o primeiro
+    resultado não vazio (as demais tentativas em andamento são abandonadas) ou None.
+    """
+    if not attempts:
+        return None
+    pool = ThreadPoolExecutor(max_workers=len(attempts))
+    pending = set()
+    remaining = list(attempts)
+    try:
+        while remaining or pending:
+            if remaining:
+                pending.add(pool.submit(remaining.pop(0)))
+            done, pending = wait(pending, timeout=delay if remaining else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.debug("Tentativa alternativa falhou: %s", e)
+                    continue
+                if result:
+                    return result
+        return None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
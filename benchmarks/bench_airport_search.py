@@ -0,0 +1,69 @@
+"""
+Benchmark da busca de aeródromos (autocomplete) - latência por tecla digitada.
+
+Corpus sintético do tamanho da lista da ANAC (~6800 aeródromos) com nomes e cidades
+acentuados; cada consulta simula a digitação letra a letra ("s", "sa", "sao", ...).
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_airport_search [--airports 6800]
+"""
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.airport_search import AirportSearchIndex  # noqa: E402
+
+WORDS = [
+    "São", "José", "Santa", "Fazenda", "Rio", "Campos", "Guarulhos", "Galeão", "Aeroclube",
+    "Porto", "Alegre", "Belém", "Goiânia", "Cuiabá", "Vitória", "Itaú", "Boa", "Vista", "Três",
+    "Lagoas", "Maringá", "Paraná", "Uberlândia", "Sorocaba", "Jundiaí", "Estância", "Sítio",
+]
+QUERIES = ["sao paulo", "sbgr", "guarulos", "fazenda boa", "sbg", "goiania", "tres lagoas", "gru"]
+
+
+def make_airports(n: int, seed: int = 1):
+    rnd = random.Random(seed)
+    codes = rnd.sample([f"S{a}{b}{c}" for a in "BDGIJNSWZAC" for b in string.ascii_uppercase for c in string.ascii_uppercase], n)
+    airports = []
+    for i, code in enumerate(codes):
+        airports.append({
+            "code": code,
+            "name": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 4))),
+            "city": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3))),
+            "state": "SP",
+            "iata_code": "".join(rnd.choice(string.ascii_uppercase) for _ in range(3)) if i % 10 == 0 else None,
+        })
+    return airports
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--airports", type=int, default=6800)
+    args = parser.parse_args(argv)
+
+    airports = make_airports(args.airports)
+    index = AirportSearchIndex()
+    t0 = time.perf_counter()
+    index.upsert(airports)
+    print(f"índice: {len(index)} aeródromos em {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    timings = []
+    for query in QUERIES:
+        for end in range(1, len(query) + 1):
+            t = time.perf_counter()
+            index.search(query[:end], limit=20)
+            timings.append(time.perf_counter() - t)
+    timings.sort()
+    p50 = timings[len(timings) // 2] * 1000
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+    print(f"{len(timings)} teclas: p50 {p50:.2f} ms, p99 {p99:.2f} ms, máx {timings[-1] * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
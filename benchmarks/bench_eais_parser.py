@@ -0,0 +1,82 @@
+"""
+Benchmark do parser do eAIS (parse_eais_html) - throughput em páginas/s.
+
+Corpus:
+  - mock: as páginas mockadas de tests/test_eais_fetch.py (SBGR, DOM, AD INTL em span)
+  - grande: as mesmas páginas com linhas de tabela/NOTAM de preenchimento até o tamanho
+    de uma página real do AISWEB (~150-200 KB)
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_eais_parser [--seconds 2] [--rows 1500]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.eais_fetch import parse_eais_html  # noqa: E402
+from tests.test_eais_fetch import HTML_AD_SPAN_INTL, HTML_DOM, HTML_SBGR  # noqa: E402
+
+MOCK_PAGES = [("SBGR", HTML_SBGR), ("SBXX", HTML_DOM), ("SBYY", HTML_AD_SPAN_INTL)]
+
+FILLER_ROWS = [
+    '<tr><td class="label">Horário de funcionamento</td><td class="value">H24 exceto feriados</td></tr>',
+    '<tr><td class="label">Combustível</td><td class="value">JET A-1, AVGAS 100LL</td></tr>',
+    '<tr><td class="label">Observações</td><td class="value">Proibido pouso de ACFT sem plano de voo aprovado.</td></tr>',
+    '<div class="notam"><span class="tag">NOTAM</span> Obras na TWY B entre 0900 e 1700 UTC.</div>',
+    "<p>Serviços de tráfego aéreo: APP, TWR e GND disponíveis conforme AIP.</p>",
+    '<li><a href="/?i=cartas&amp;codigo=XXXX">Carta de aeródromo ADC</a></li>',
+    "<tr><td>VOR</td><td>114.5</td><td>H24</td><td>Ver AIP ENR</td></tr>",
+]
+
+
+def make_large_page(base: str, rows: int, seed: int) -> str:
+    """Insere `rows` linhas de preenchimento antes e depois do conteúdo do aeródromo."""
+    rnd = random.Random(seed)
+    filler = "\n".join(rnd.choice(FILLER_ROWS) for _ in range(rows))
+    half = len(filler) // 2
+    head, sep, tail = base.partition("</h1>")
+    if not sep:
+        return base + filler
+    tail = tail.replace("</body>", "<table>" + filler[half:] + "</table></body>")
+    return head + sep + "\n<table>" + filler[:half] + "</table>\n" + tail
+
+
+def run(name: str, pages, seconds: float) -> None:
+    n = 0
+    size = sum(len(html) for _, html in pages)
+    start = time.perf_counter()
+    while True:
+        for icao, html in pages:
+            parse_eais_html(html, icao)
+        n += len(pages)
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            break
+    print(
+        f"{name:<6} {len(pages)} páginas, {size / len(pages) / 1024:7.1f} KB/página: "
+        f"{n / elapsed:9.1f} páginas/s ({elapsed / n * 1000:.3f} ms/página)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="duração de cada medição")
+    parser.add_argument("--rows", type=int, default=1500, help="linhas de preenchimento por página grande")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    large = [
+        (icao, make_large_page(html, args.rows, seed))
+        for seed, (icao, html) in enumerate(MOCK_PAGES * 4)
+    ]
+    run("mock", MOCK_PAGES, args.seconds)
+    run("grande", large, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Testes do índice espacial (airport_geo): k mais próximos pela grade comparados com força
+bruta, raio e agrupamento por região.
+"""
+import random
+from types import SimpleNamespace
+
+from app.services.airport_geo import AirportGeoIndex, group_by_region, haversine_km, region_for
+
+AIRPORTS = [
+    {"code": "SBGR", "name": "Guarulhos", "city": "Guarulhos", "state": "SP", "latitude": -23.4356, "longitude": -46.4731},
+    {"code": "SBSP", "name": "Congonhas", "city": "São Paulo", "state": "SP", "latitude": -23.6261, "longitude": -46.6564},
+    {"code": "SBKP", "name": "Viracopos", "city": "Campinas", "state": "SP", "latitude": -23.0074, "longitude": -47.1345},
+    {"code": "SBGL", "name": "Galeão", "city": "Rio de Janeiro", "state": "RJ", "latitude": -22.8099, "longitude": -43.2506},
+    {"code": "SBBR", "name": "Brasília", "city": "Brasília", "state": "DF", "latitude": -15.8711, "longitude": -47.9186},
+    {"code": "SBEG", "name": "Eduardo Gomes", "city": "Manaus", "state": "AM", "latitude": -3.0386, "longitude": -60.0497},
+    {"code": "SXXX", "name": "Sem coordenadas", "city": None, "state": "SP", "latitude": None, "longitude": None},
+]
+
+
+def _index(rows):
+    index = AirportGeoIndex()
+    index.load(rows)
+    return index
+
+
+def test_nearest_sorted_with_radius():
+    index = _index(AIRPORTS)
+    assert len(index) == 6
+    near = index.nearby(-23.55, -46.63, k=3)
+    assert [r["code"] for r in near] == ["SBSP", "SBGR", "SBKP"]
+    assert near[0]["distance_km"] < near[1]["distance_km"] < near[2]["distance_km"]
+    assert [r["code"] for r in index.nearby(-23.55, -46.63, k=10, radius_km=50)] == ["SBSP", "SBGR"]
+    assert index.nearby(0.0, 0.0, k=5, radius_km=100) == []
+    assert index.nearby(-3.1, -60.0, k=1)[0]["code"] == "SBEG"
+
+
+def test_grid_matches_brute_force():
+    rnd = random.Random(7)
+    rows = [
+        {"code": f"P{i:04d}", "latitude": rnd.uniform(-34, 5), "longitude": rnd.uniform(-74, -34)}
+        for i in range(3000)
+    ]
+    index = _index(rows)
+    for _ in range(50):
+        lat, lon = rnd.uniform(-35, 6), rnd.uniform(-75, -33)
+        k, radius = rnd.choice([1, 5, 20]), rnd.choice([None, 30.0, 300.0])
+        expected = sorted(
+            (haversine_km(lat, lon, r["latitude"], r["longitude"]), r["code"]) for r in rows
+        )
+        if radius is not None:
+            expected = [e for e in expected if e[0] <= radius]
+        got = [r["code"] for r in index.nearby(lat, lon, k=k, radius_km=radius)]
+        assert got == [code for _, code in expected[:k]]
+
+
+def test_group_by_region_infers_missing_state_from_nearest():
+    index = _index(AIRPORTS)
+    assert region_for("sp") == "Sudeste"
+    assert region_for(None, -3.04, -60.05, index=index) == "Norte"
+    assert region_for(None, 0.0, 0.0, index=index) is None
+
+    airports = [
+        SimpleNamespace(code="SBGR", estado="SP", latitude=None, longitude=None),
+        SimpleNamespace(code="SBBR", estado="DF", latitude=None, longitude=None),
+        SimpleNamespace(code="SBEG", estado=None, latitude=-3.04, longitude=-60.05),
+        SimpleNamespace(code="XXXX", estado=None, latitude=None, longitude=None),
+    ]
+    groups = group_by_region(airports, index=index)
+    assert {region: [a.code for a in members] for region, members in groups.items()} == {
+        "Sudeste": ["SBGR"], "Centro-Oeste": ["SBBR"], "Norte": ["SBEG"], "Sem região": ["XXXX"],
+    }
@@ -0,0 +1,85 @@
+"""
+Testes da busca de aeródromos (airport_search): trie de códigos, trigramas sem acento,
+ordenação e atualização incremental a partir de anac_airports.
+"""
+from datetime import datetime, timedelta
+
+from app.models import ANACAirport
+from app.services.airport_search import AirportSearchIndex, fold_text
+
+AIRPORTS = [
+    {"code": "SBGR", "name": "Guarulhos - Governador André Franco Montoro", "city": "Guarulhos", "state": "SP", "iata_code": "GRU"},
+    {"code": "SBSP", "name": "Congonhas", "city": "São Paulo", "state": "SP", "iata_code": "CGH"},
+    {"code": "SBGL", "name": "Galeão - Antônio Carlos Jobim", "city": "Rio de Janeiro", "state": "RJ", "iata_code": "GIG"},
+    {"code": "SBSJ", "name": "Professor Urbano Ernesto Stumpf", "city": "São José dos Campos", "state": "SP", "iata_code": "SJK"},
+    {"code": "SDCO", "name": "Sorocaba", "city": "Sorocaba", "state": "SP"},
+]
+
+
+def _codes(results):
+    return [r["code"] for r in results]
+
+
+def test_fold_text():
+    assert fold_text("São José dos Campos/SP") == "SAO JOSE DOS CAMPOS SP"
+    assert fold_text("  Galeão -  Antônio ") == "GALEAO ANTONIO"
+    assert fold_text(None) == ""
+
+
+def test_code_prefix_and_iata():
+    index = AirportSearchIndex()
+    index.upsert(AIRPORTS)
+    assert _codes(index.search("SBG")) == ["SBGL", "SBGR"]
+    assert _codes(index.search("sbgr"))[0] == "SBGR"
+    assert _codes(index.search("GRU"))[0] == "SBGR"
+    assert index.search("S") == []
+
+
+def test_accent_insensitive_ranked_by_name_then_city():
+    index = AirportSearchIndex()
+    index.upsert(AIRPORTS)
+    assert set(_codes(index.search("sao"))) == {"SBSP", "SBSJ"}
+    assert _codes(index.search("galeao"))[0] == "SBGL"
+    # Nome começa com o termo vence cidade; erro de digitação ainda encontra
+    assert _codes(index.search("guarulos"))[0] == "SBGR"
+    assert _codes(index.search("sorocaba")) == ["SDCO"]
+    assert _codes(index.search("sao jose campos")) == ["SBSJ"]
+
+
+def test_upsert_replaces_old_terms():
+    index = AirportSearchIndex()
+    index.upsert(AIRPORTS)
+    index.upsert([{"code": "SDCO", "name": "Bertram Luiz Leupolz", "city": "Sorocaba", "state": "SP"}])
+    assert len(index) == len(AIRPORTS)
+    assert _codes(index.search("leupolz")) == ["SDCO"]
+    assert _codes(index.search("bertram")) == ["SDCO"]
+    assert index.search("sorocaba")[0]["name"] == "Bertram Luiz Leupolz"
+
+
+def test_refresh_reads_only_changed_rows(session_factory):
+    db = session_factory()
+    t0 = datetime(2026, 1, 1)
+    for a in AIRPORTS:
+        db.add(ANACAirport(**a, updated_at=t0))
+    db.commit()
+
+    index = AirportSearchIndex(refresh_seconds=3600)
+    index.ensure_fresh(db)
+    assert len(index) == len(AIRPORTS)
+
+    db.add(ANACAirport(code="SBKP", name="Viracopos", city="Campinas", state="SP", updated_at=t0 + timedelta(days=1)))
+    db.commit()
+    index.ensure_fresh(db)  # dentro do intervalo: não consulta a tabela
+    assert index.search("viracopos") == []
+
+    index.invalidate()
+    index.ensure_fresh(db)
+    assert _codes(index.search("viracopos")) == ["SBKP"]
+    assert len(index) == len(AIRPORTS) + 1
+
+    db.query(ANACAirport).filter(ANACAirport.code == "SBKP").delete()
+    db.commit()
+    index.invalidate()
+    index.ensure_fresh(db)
+    assert index.search("viracopos") == []
+    db.close()
@@ -0,0 +1,96 @@
+"""
+Testes do gerenciador de downloads da ANAC (anac_download).
+Session falsa: registra os headers enviados e simula queda no meio do download.
+"""
+import pytest
+import requests
+
+from app.services import upstream_health
+from app.services.anac_download import DownloadManager
+
+URL = "https://sistemas.anac.gov.br/dadosabertos/caracteristicas_gerais.csv"
+BODY = b"Codigo OACI;Nome\n" + b"SBGR;Guarulhos\n" * 1000
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, headers, fail_after=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers
+        self._fail_after = fail_after
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def iter_content(self, chunk_size):
+        sent = 0
+        for i in range(0, len(self._body), 1024):
+            if self._fail_after is not None and sent >= self._fail_after:
+                raise requests.ConnectionError("conexão interrompida")
+            chunk = self._body[i:i + 1024]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, body=BODY, etag='"v1"', fail_first_after=None):
+        self.body = body
+        self.etag = etag
+        self.fail_first_after = fail_first_after
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        headers = headers or {}
+        self.requests.append(headers)
+        fail_after, self.fail_first_after = self.fail_first_after, None
+        rng = headers.get("Range")
+        if rng and headers.get("If-Range") == self.etag:
+            start = int(rng.split("=")[1].rstrip("-"))
+            return FakeResponse(206, self.body[start:], {
+                "ETag": self.etag, "Content-Range": f"bytes {start}-{len(self.body) - 1}/{len(self.body)}",
+            })
+        return FakeResponse(200, self.body, {"ETag": self.etag}, fail_after)
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    upstream_health._breakers.clear()
+    yield
+    upstream_health._breakers.clear()
+
+
+def test_fetched_once_per_run(tmp_path):
+    """Segundo pedido da mesma URL (fallback) usa o conteúdo já baixado."""
+    session = FakeSession()
+    manager = DownloadManager(staging_dir=tmp_path, session=session)
+    assert manager.fetch(URL) == BODY
+    assert manager.fetch(URL) == BODY
+    assert len(session.requests) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_partial_download_resumes_with_range(tmp_path):
+    """Queda no meio: a nova tentativa pede só o restante (Range + If-Range)."""
+    session = FakeSession(fail_first_after=4096)
+    manager = DownloadManager(staging_dir=tmp_path, session=session)
+    assert manager.fetch(URL) == BODY
+    assert len(session.requests) == 2
+    assert session.requests[1]["Range"] == "bytes=4096-"
+    assert session.requests[1]["If-Range"] == '"v1"'
+
+
+def test_partial_from_previous_run_restarts_if_file_changed(tmp_path):
+    """Parcial de uma execução anterior com ETag diferente: baixa o arquivo novo inteiro."""
+    first = DownloadManager(staging_dir=tmp_path, session=FakeSession(fail_first_after=4096))
+    with pytest.raises(requests.ConnectionError):
+        first._download(URL, timeout=5)
+    assert list(tmp_path.glob("*.part"))
+
+    new_body = b"Codigo OACI;Nome\n" + b"SBSP;Congonhas\n" * 1000
+    session = FakeSession(body=new_body, etag='"v2"')
+    assert DownloadManager(staging_dir=tmp_path, session=session).fetch(URL) == new_body
+    assert session.requests[0]["If-Range"] == '"v1"'
@@ -0,0 +1,59 @@
+"""
+Testes do snapshot binário dos aeródromos ANAC (anac_snapshot).
+"""
+from app.services.anac_snapshot import ANACSnapshot, open_snapshot, write_snapshot
+
+AIRPORTS = [
+    {"code": "SBSP", "name": "Congonhas", "city": "São Paulo", "latitude": -23.6261},
+    {"code": "sbgr", "name": "Guarulhos", "city": "Guarulhos", "reference_code": "4E"},
+    {"code": "SBKP", "name": "Viracopos", "city": "Campinas"},
+    {"code": "", "name": "Sem código"},
+]
+
+
+def test_lookup_by_binary_search(tmp_path):
+    """Registros ordenados por ICAO; busca encontra cada código e rejeita ausentes."""
+    path = tmp_path / "anac.snap"
+    assert write_snapshot(AIRPORTS, path) == 3
+
+    snap = ANACSnapshot(path)
+    assert len(snap) == 3
+    assert list(snap.codes()) == ["SBGR", "SBKP", "SBSP"]
+    assert snap.get("sbsp")["city"] == "São Paulo"
+    assert snap.get("SBGR")["reference_code"] == "4E"
+    assert snap.get("SBAA") is None
+    assert snap.get("SBZZ") is None
+    assert snap.get("XX") is None
+    assert [r["name"] for r in snap.records()] == ["Guarulhos", "Viracopos", "Congonhas"]
+    snap.close()
+
+
+def test_rewrite_is_atomic_and_reopened(tmp_path):
+    """Nova sincronização substitui o arquivo; open_snapshot passa a ler a versão nova."""
+    path = tmp_path / "anac.snap"
+    write_snapshot(AIRPORTS, path)
+    first = open_snapshot(path)
+    assert open_snapshot(path) is first
+
+    write_snapshot([{"code": "SBRJ", "name": "Santos Dumont"}], path)
+    second = open_snapshot(path)
+    assert second is not first
+    assert second.get("SBRJ")["name"] == "Santos Dumont"
+    assert second.get("SBSP") is None
+    assert first.get("SBSP")["name"] == "Congonhas"  # leitor antigo continua válido
+    assert [p.name for p in tmp_path.iterdir()] == ["anac.snap"]
+
+
+def test_cache_is_iterated_without_building_a_list(tmp_path, session_factory):
+    """_load_cache devolve o próprio snapshot; a sincronização o percorre registro a registro."""
+    from app.services.anac_sync import ANACSyncService
+
+    path = tmp_path / "anac.snap"
+    write_snapshot([dict(a, code=a["code"].upper()) for a in AIRPORTS], path)
+    service = ANACSyncService(db=session_factory())
+    service._snapshot_path = path
+    cached = service._load_cache()
+    assert isinstance(cached, ANACSnapshot) and len(cached) == 3
+    result = service.sync_airports(cached)
+    assert (result["created"], result["errors"]) == (3, 0)
+    assert service.sync_airports(cached)["skipped"] == 3
@@ -0,0 +1,139 @@
+"""
+Testes da sincronização com diff por versão do dataset ANAC (sync_airports + anac_versions).
+"""
+import pytest
+from sqlalchemy import event
+
+from app.models import ANACDatasetVersion, Airport, AirportSize, AirportType
+from app.services.anac_sync import ANACSyncService
+from app.services.anac_versions import decode_hashes
+
+
+def _rows():
+    return [
+        {"code": "SBGR", "name": "Guarulhos", "usage_class": "IV", "city": "Guarulhos", "state": "SP",
+         "latitude": -23.43, "longitude": -46.47, "number_of_runways": 2},
+        {"code": "SBSP", "name": "Congonhas", "usage_class": "IV", "city": "São Paulo", "state": "SP"},
+        {"code": "SBKP", "name": "Viracopos", "usage_class": "III", "city": "Campinas", "state": "SP"},
+    ]
+
+
+@pytest.fixture
+def env(engine, session_factory):
+    writes = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_writes(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split()[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+            writes.append(statement)
+
+    return session_factory, writes
+
+
+def test_same_dataset_twice_writes_nothing(env):
+    Session, writes = env
+    first = ANACSyncService(db=Session()).sync_airports(_rows())
+    assert first["created"] == 3 and first["previous_version"] is None
+    writes.clear()
+
+    second = ANACSyncService(db=Session()).sync_airports(_rows())
+    assert second["dataset_version"] == first["dataset_version"]
+    assert (second["created"], second["updated"], second["skipped"]) == (0, 0, 3)
+    assert writes == []
+
+
+def test_only_changed_rows_are_touched(env):
+    Session, writes = env
+    first = ANACSyncService(db=Session()).sync_airports(_rows())
+    rows = _rows()
+    rows[2]["usage_class"] = "IV"
+    rows.append({"code": "SBRJ", "name": "Santos Dumont", "usage_class": "III", "state": "RJ"})
+    rows = [r for r in rows if r["code"] != "SBSP"]
+
+    result = ANACSyncService(db=Session()).sync_airports(rows)
+    assert result["previous_version"] == first["dataset_version"]
+    assert (result["created"], result["updated"], result["skipped"]) == (1, 1, 1)
+    assert result["removed_upstream"] == ["SBSP"]
+    assert [c["code"] for c in result["changes"]] == ["SBKP", "SBRJ"]
+
+    db = Session()
+    versions = {a.code: a.versao_dados_anac for a in db.query(Airport)}
+    assert versions == {
+        "SBGR": result["dataset_version"], "SBKP": result["dataset_version"],
+        "SBRJ": result["dataset_version"], "SBSP": first["dataset_version"],
+    }
+    assert db.query(Airport).filter(Airport.code == "SBKP").one().size == AirportSize.INTERNATIONAL
+    latest = db.query(ANACDatasetVersion).order_by(ANACDatasetVersion.id.desc()).first()
+    assert latest.version == result["dataset_version"]
+    assert latest.changed_count == 2
+    assert sorted(decode_hashes(latest.row_hashes)) == ["SBGR", "SBKP", "SBRJ"]
+
+
+def test_airport_registered_after_last_sync_is_updated(env):
+    Session, writes = env
+    ANACSyncService(db=Session()).sync_airports(_rows())
+    db = Session()
+    db.query(Airport).filter(Airport.code == "SBGR").delete()
+    db.add(Airport(name="GRU manual", code="SBGR", size=AirportSize.SMALL, airport_type=AirportType.COMMERCIAL))
+    db.commit()
+
+    result = ANACSyncService(db=Session()).sync_airports(_rows())
+    assert (result["created"], result["updated"], result["skipped"]) == (0, 1, 2)
+    assert Session().query(Airport).filter(Airport.code == "SBGR").one().name == "Guarulhos"
+
+
+def test_dry_run_reports_without_writing(env):
+    Session, writes = env
+    result = ANACSyncService(db=Session()).sync_airports(_rows(), dry_run=True)
+    assert result["created"] == 3
+    assert writes == []
+    assert Session().query(ANACDatasetVersion).count() == 0
+
+
+def test_large_sync_uses_constant_statements_and_streams_changes(env):
+    Session, writes = env
+    rows = [{"code": f"S{i:03d}", "name": f"Aeródromo {i}", "usage_class": "I", "state": "SP"} for i in range(1500)]
+    streamed = []
+    result = ANACSyncService(db=Session()).sync_airports(rows, on_change=streamed.append)
+    assert result["created"] == 1500
+    assert result["changes"] == []
+    assert len(streamed) == 1500 and streamed[0] == {"code": "S000", "action": "created", "name": "Aeródromo 0"}
+    # 2 lotes de bulk insert + a versão do dataset
+    assert len(writes) == 3
+
+    for r in rows[:900]:
+        r["usage_class"] = "II"
+    writes.clear()
+    updated = []
+    result = ANACSyncService(db=Session()).sync_airports(rows, on_change=updated.append)
+    assert (result["updated"], result["skipped"]) == (900, 600)
+    assert len(updated) == 900
+    # UPDATEs agrupados pelo unit of work (executemany), não um por aeroporto
+    assert len(writes) <= 5
+
+
+def test_failed_airport_is_retried_next_sync(env, monkeypatch):
+    Session, writes = env
+    first = ANACSyncService(db=Session()).sync_airports(_rows())
+    rows = _rows()
+    rows[2]["usage_class"] = "IV"
+    original = ANACSyncService._update_airport
+
+    def failing(self, airport, anac_data, dry_run):
+        if airport.code == "SBKP":
+            airport.name = "parcial"
+            raise ValueError("linha inválida")
+        return original(self, airport, anac_data, dry_run)
+
+    monkeypatch.setattr(ANACSyncService, "_update_airport", failing)
+    result = ANACSyncService(db=Session()).sync_airports(rows)
+    assert result["errors"] == 1
+    sbkp = Session().query(Airport).filter(Airport.code == "SBKP").one()
+    # Não avançou de versão nem gravou a alteração parcial
+    assert (sbkp.versao_dados_anac, sbkp.name) == (first["dataset_version"], "Viracopos")
+
+    monkeypatch.setattr(ANACSyncService, "_update_airport", original)
+    retry = ANACSyncService(db=Session()).sync_airports(rows)
+    assert (retry["updated"], retry["skipped"]) == (1, 2)
+    sbkp = Session().query(Airport).filter(Airport.code == "SBKP").one()
+    assert sbkp.versao_dados_anac == result["dataset_version"] and sbkp.size == AirportSize.INTERNATIONAL
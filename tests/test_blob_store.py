@@ -0,0 +1,101 @@
+"""
+Testes do armazenamento de anexos por conteúdo (app/services/blob_store.py).
+"""
+import asyncio
+import io
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app import main
+from app.models import (
+    Airport, AirportSize, AirportType, Blob, ComplianceRecord, DocumentAttachment, Regulation, SafetyCategory,
+)
+from app.services.blob_store import blob_path, collect_garbage, is_blob_path
+
+
+@pytest.fixture
+def db(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOADS_DIR", tmp_path)
+    regulation = Regulation(code="R1", title="R1", requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+    db.add(regulation)
+    for code in ("SBKP", "SBGR"):
+        airport = Airport(name=code, code=code, size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+        db.add(airport)
+        db.flush()
+        db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.commit()
+    return db
+
+
+def _upload(db, record_id, data, name="cert.pdf"):
+    return asyncio.run(main.upload_document(
+        record_id, file=UploadFile(io.BytesIO(data), filename=name), document_type=None,
+        description=None, uploaded_by=None, db=db,
+    ))
+
+
+def _files(root):
+    return sorted(p for p in root.rglob("*") if p.is_file())
+
+
+def test_duplicate_content_stored_once(db, tmp_path):
+    data = b"certificado SESCINC" * 1000
+    first = _upload(db, 1, data)
+    second = _upload(db, 2, data, name="copia.pdf")
+    assert first.file_path == second.file_path and is_blob_path(first.file_path)
+    assert _files(tmp_path) == [blob_path(tmp_path, first.sha256)]
+    assert db.get(Blob, first.sha256).ref_count == 2
+    other = _upload(db, 1, b"outro relatorio")
+    assert other.file_path != first.file_path
+    assert len(_files(tmp_path)) == 2
+
+
+def test_delete_decrements_and_gc_removes_orphans(db, tmp_path):
+    doc = _upload(db, 1, b"relatorio" * 100)
+    _upload(db, 2, b"relatorio" * 100)
+    main.delete_document(doc.id, db=db)
+    blob = db.get(Blob, doc.sha256)
+    db.refresh(blob)
+    assert blob.ref_count == 1
+    assert blob_path(tmp_path, doc.sha256).exists()
+
+    # Cascata: remover o aeroporto remove o anexo restante e zera as referências
+    db.delete(db.query(Airport).filter(Airport.code == "SBGR").one())
+    db.commit()
+    db.refresh(blob)
+    assert blob.ref_count == 0
+    assert db.query(DocumentAttachment).count() == 0
+
+    assert collect_garbage(db, tmp_path)["blobs"] == 0  # Ainda dentro da carência
+    later = datetime.utcnow() + timedelta(hours=2)
+    report = collect_garbage(db, tmp_path, dry_run=True, now=later)
+    assert report == {"blobs": 1, "bytes": 900, "dry_run": True}
+    assert blob_path(tmp_path, doc.sha256).exists()
+    collect_garbage(db, tmp_path, now=later)
+    assert not blob_path(tmp_path, doc.sha256).exists()
+    assert db.query(Blob).count() == 0
+
+
+def test_reupload_restores_missing_file(db, tmp_path):
+    doc = _upload(db, 1, b"foto da pista")
+    blob_path(tmp_path, doc.sha256).unlink()
+    _upload(db, 2, b"foto da pista")
+    assert blob_path(tmp_path, doc.sha256).read_bytes() == b"foto da pista"
+
+
+def test_failure_after_store_keeps_shared_blob(db, tmp_path, monkeypatch):
+    doc = _upload(db, 1, b"laudo compartilhado")
+    blob_path(tmp_path, doc.sha256).unlink()
+    real_add_reference = main.add_reference
+
+    def failing_add_reference(db, staged, storage):
+        real_add_reference(db, staged, storage)  # restaura o arquivo em blobs/ e falha depois
+        raise RuntimeError("falha no banco")
+
+    monkeypatch.setattr(main, "add_reference", failing_add_reference)
+    with pytest.raises(HTTPException):
+        _upload(db, 2, b"laudo compartilhado")
+    assert blob_path(tmp_path, doc.sha256).read_bytes() == b"laudo compartilhado"
+    assert not list((tmp_path / ".staging").iterdir())
@@ -0,0 +1,108 @@
+"""
+Testes do recálculo de conformidade dirigido pela sincronização ANAC
+(_update_airport -> change_events -> ComplianceEngine.reconcile_airports).
+"""
+import json
+
+import pytest
+
+from app.compliance_engine import ComplianceEngine
+from app.models import Airport, ComplianceRecord, ComplianceStatus, Regulation, SafetyCategory
+from app.services.anac_sync import ANACSyncService
+
+
+def _regulation(code, sizes=None, min_runways=None):
+    return Regulation(
+        code=code, title=code, requirements="Requisito", safety_category=SafetyCategory.OPERATIONAL_SAFETY,
+        applies_to_sizes=json.dumps(sizes) if sizes else None, min_runways=min_runways,
+    )
+
+
+@pytest.fixture
+def db(db):
+    db.add_all([
+        _regulation("GERAL"),
+        _regulation("GRANDE", sizes=["large"]),
+        _regulation("INTERNACIONAL", sizes=["international"]),
+        _regulation("DUAS-PISTAS", min_runways=2),
+    ])
+    db.commit()
+    return db
+
+
+def _rows(usage_kp="III", runways_gr=1):
+    return [
+        {"code": "SBKP", "name": "Viracopos", "usage_class": usage_kp, "number_of_runways": 1},
+        {"code": "SBGR", "name": "Guarulhos", "usage_class": "IV", "number_of_runways": runways_gr},
+    ]
+
+
+def _statuses(db, code):
+    airport = db.query(Airport).filter(Airport.code == code).one()
+    return {
+        db.get(Regulation, r.regulation_id).code: r.status
+        for r in db.query(ComplianceRecord).filter(ComplianceRecord.airport_id == airport.id)
+    }
+
+
+def test_sync_recomputes_only_affected_tracked_airports(db):
+    ANACSyncService(db=db).sync_airports(_rows())
+    kp = db.query(Airport).filter(Airport.code == "SBKP").one()
+    ComplianceEngine(db).check_compliance(kp.id)
+    grande = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "GRANDE").one()
+    grande.status = ComplianceStatus.COMPLIANT
+    db.commit()
+    assert _statuses(db, "SBKP") == {"GERAL": ComplianceStatus.PENDING_REVIEW, "GRANDE": ComplianceStatus.COMPLIANT}
+
+    # SBKP III -> IV; SBGR ganha pista mas não tem registros (não acompanhado): nada é criado para ele
+    result = ANACSyncService(db=db).sync_airports(_rows(usage_kp="IV", runways_gr=2))
+    assert result["compliance"] == {
+        "airports": 1, "created": 1, "retired": 1, "restored": 0, "action_items_regenerated": 1,
+    }
+    statuses = _statuses(db, "SBKP")
+    assert statuses == {
+        "GERAL": ComplianceStatus.PENDING_REVIEW,
+        "GRANDE": ComplianceStatus.NOT_APPLICABLE,
+        "INTERNACIONAL": ComplianceStatus.PENDING_REVIEW,
+    }
+    grande = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "GRANDE").one()
+    assert "status anterior: compliant" in grande.notes
+    assert grande.retired_status == "compliant"
+    assert _statuses(db, "SBGR") == {}
+
+    # Volta a III: registro retirado pela sincronização volta ao status anterior
+    result = ANACSyncService(db=db).sync_airports(_rows(usage_kp="III", runways_gr=2))
+    assert result["compliance"]["restored"] == 1
+    assert _statuses(db, "SBKP")["GRANDE"] == ComplianceStatus.COMPLIANT
+    grande = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "GRANDE").one()
+    assert grande.retired_status is None
+    assert "status restaurado: compliant" in grande.notes
+
+
+def test_manual_not_applicable_is_not_restored(db):
+    ANACSyncService(db=db).sync_airports(_rows())
+    kp = db.query(Airport).filter(Airport.code == "SBKP").one()
+    ComplianceEngine(db).check_compliance(kp.id)
+
+    # Retirada automática seguida de marcação manual: a decisão do usuário prevalece
+    ANACSyncService(db=db).sync_airports(_rows(usage_kp="IV"))
+    grande = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "GRANDE").one()
+    assert grande.retired_status == "pending_review"
+    grande = ComplianceEngine(db).update_compliance_status(grande.id, status=ComplianceStatus.NOT_APPLICABLE)
+    assert grande.retired_status is None
+
+    result = ANACSyncService(db=db).sync_airports(_rows(usage_kp="III"))
+    assert result["compliance"]["restored"] == 0
+    assert _statuses(db, "SBKP")["GRANDE"] == ComplianceStatus.NOT_APPLICABLE
+
+
+def test_unchanged_applicability_emits_no_events(db):
+    service = ANACSyncService(db=db)
+    service.sync_airports(_rows())
+    rows = _rows()
+    rows[0]["name"] = "Viracopos Campinas"
+    service = ANACSyncService(db=db)
+    result = service.sync_airports(rows)
+    assert result["updated"] == 1
+    assert result["compliance"]["airports"] == 0
+    assert service.change_events == []
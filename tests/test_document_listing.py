@@ -0,0 +1,77 @@
+"""
+Testes da listagem de anexos por aeroporto (app/services/document_listing.py).
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app import main
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, DocumentAttachment, Regulation, SafetyCategory,
+)
+
+
+@pytest.fixture
+def db(db):
+    regulations = [
+        Regulation(code=code, title=code, requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+        for code in ("153.401", "153.501", "153.601")
+    ]
+    airports = [
+        Airport(name=code, code=code, size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+        for code in ("SBKP", "SBGR")
+    ]
+    db.add_all(regulations + airports)
+    db.flush()
+    for airport in airports:
+        for regulation in regulations:
+            db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.flush()
+    start = datetime(2026, 1, 1)
+    # SBKP: registro 1 com 2 anexos, registro 2 com 1, registro 3 sem; SBGR: registro 4 com 1
+    for i, record_id in enumerate((2, 1, 1, 4)):
+        db.add(DocumentAttachment(
+            compliance_record_id=record_id, filename=f"doc{i}.pdf", file_path=f"uploads/doc{i}.pdf",
+            file_size=100 * (i + 1), uploaded_at=start + timedelta(days=i),
+        ))
+    db.commit()
+    return db
+
+
+def _count_queries(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_airport_documents_grouped_in_one_query(db):
+    statements = _count_queries(db)
+    result = main.list_airport_documents(1, db=db)
+    assert len(statements) == 2  # Aeroporto existe + anexos com join
+    assert result["document_count"] == 3
+    assert [(g["compliance_record_id"], g["regulation_code"], g["document_count"]) for g in result["records"]] == [
+        (1, "153.401", 2), (2, "153.501", 1),
+    ]
+    first = result["records"][0]
+    assert [d.filename for d in first["documents"]] == ["doc1.pdf", "doc2.pdf"]
+    assert first["last_uploaded_at"] == datetime(2026, 1, 3)
+
+
+def test_summary_has_counts_only(db):
+    result = main.list_airport_documents(2, summary=True, db=db)
+    assert result["document_count"] == 1
+    assert result["records"] == [{
+        "compliance_record_id": 4, "regulation_id": 1, "regulation_code": "153.401",
+        "document_count": 1, "last_uploaded_at": datetime(2026, 1, 4),
+    }]
+    with pytest.raises(HTTPException) as exc:
+        main.list_airport_documents(99, db=db)
+    assert exc.value.status_code == 404
+
+
+def test_compliance_records_embed_document_count(db):
+    records = asyncio.run(main.get_airport_compliance(1, db=db))
+    assert {r.id: r.document_count for r in records} == {1: 2, 2: 1, 3: 0}
@@ -0,0 +1,137 @@
+"""
+Testes da busca textual nas evidências (app/services/document_search.py).
+"""
+import hashlib
+import io
+import multiprocessing
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, DocumentAttachment, DocumentText, Regulation,
+    SafetyCategory,
+)
+from app.services.document_search import (
+    ensure_search_index, extract_text, index_document, search_documents, unindexed_documents,
+)
+from app.services.storage import LocalStorage
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+S = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+
+
+def _zip(members):
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return out.getvalue()
+
+
+def _docx(*paragraphs):
+    body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+    return _zip({"word/document.xml": f"<w:document {W}><w:body>{body}</w:body></w:document>"})
+
+
+def _xlsx(*cells):
+    items = "".join(f"<si><t>{c}</t></si>" for c in cells)
+    return _zip({
+        "xl/sharedStrings.xml": f"<sst {S}>{items}</sst>",
+        "xl/worksheets/sheet1.xml": f'<worksheet {S}><sheetData><row><c t="inlineStr"><is><t>Inspeção TOPS</t></is></c></row></sheetData></worksheet>',
+    })
+
+
+def _pdf():
+    plain = b"BT /F1 12 Tf 72 720 Td (Plano de Emerg\\352ncia - PLEM) Tj ET"
+    packed = zlib.compress(b"BT [(Exerc) 20 (\\355cio) -300 (CCI)] TJ ET")
+    return (
+        b"%PDF-1.4\n1 0 obj << /Length 60 >>\nstream\n" + plain + b"\nendstream\nendobj\n"
+        b"2 0 obj << /Filter /FlateDecode >>\nstream\n" + packed + b"\nendstream\nendobj\n%%EOF"
+    )
+
+
+def test_extract_text_by_format():
+    assert extract_text(_docx("Relatório do PCINC", "Revisão 3"), ".docx") == "Relatório do PCINC\nRevisão 3"
+    assert extract_text(_xlsx("Viatura CCI 01", "Tempo-resposta"), ".xlsx") == "Viatura CCI 01\nTempo-resposta\nInspeção TOPS"
+    assert extract_text(_pdf(), ".pdf") == "Plano de Emergência - PLEM\nExercício CCI"
+
+
+@pytest.fixture
+def db(db):
+    regulations = [
+        Regulation(code=code, title=code, requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+        for code in ("153.401", "153.501")
+    ]
+    airports = [
+        Airport(name=code, code=code, size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+        for code in ("SBKP", "SBGR")
+    ]
+    db.add_all(regulations + airports)
+    db.flush()
+    for airport in airports:
+        for regulation in regulations:
+            db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.commit()
+    return db
+
+
+def _attach(db, tmp_path, record_id, filename, data):
+    sha = hashlib.sha256(data).hexdigest()
+    path = tmp_path / sha
+    path.write_bytes(data)
+    doc = DocumentAttachment(
+        compliance_record_id=record_id, filename=filename, file_path=str(path), file_size=len(data), sha256=sha,
+    )
+    db.add(doc)
+    db.commit()
+    return doc
+
+
+def _seed(db, tmp_path):
+    docs = [
+        _attach(db, tmp_path, 1, "pcinc.docx", _docx("Plano Contraincêndio de Aeródromo (PCINC)", "Viatura CCI")),
+        _attach(db, tmp_path, 2, "plem.pdf", _pdf()),
+        _attach(db, tmp_path, 3, "checklist.xlsx", _xlsx("Viatura CCI 02 inoperante")),
+        _attach(db, tmp_path, 4, "foto.jpg", b"\xff\xd8\xff"),
+    ]
+    storage = LocalStorage(tmp_path)
+    assert [index_document(db, storage, d) for d in docs] == ["ok", "ok", "ok", "unsupported"]
+    return docs
+
+
+@pytest.mark.parametrize("fts", [True, False])
+def test_search_scoped_by_airport_and_regulation(db, tmp_path, fts):
+    if fts:
+        ensure_search_index(db.get_bind())
+    docs = _seed(db, tmp_path)
+
+    hits = search_documents(db, "cci")
+    assert {h["document_id"] for h in hits} == {docs[0].id, docs[1].id, docs[2].id}
+    # Registro 3 = SBGR / 153.401
+    hits = search_documents(db, "viatura cci", airport_id=2)
+    assert [(h["filename"], h["airport_code"], h["regulation_code"]) for h in hits] == [("checklist.xlsx", "SBGR", "153.401")]
+    assert search_documents(db, "cci", airport_id=1, regulation_id=2)[0]["filename"] == "plem.pdf"
+    # Sem acento e com prefixo do último termo
+    hit = search_documents(db, "emergencia")[0] if fts else search_documents(db, "emergência")[0]
+    assert hit["filename"] == "plem.pdf" and "PLEM" in hit["snippet"]
+    if fts:
+        assert "«Emergência»" in hit["snippet"]
+    assert search_documents(db, "sescinc") == [] and search_documents(db, "  ") == []
+
+
+def test_identical_content_indexed_once(db, tmp_path):
+    ensure_search_index(db.get_bind())
+    data = _docx("Certificado de treinamento CCI")
+    first = _attach(db, tmp_path, 1, "cert.docx", data)
+    second = _attach(db, tmp_path, 4, "cert-copia.docx", data)
+    assert [d.id for d in unindexed_documents(db)] == [first.id, second.id]
+    pool = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        assert index_document(db, LocalStorage(tmp_path), first, pool=pool) == "ok"
+    finally:
+        pool.shutdown()
+    assert unindexed_documents(db) == [] and db.query(DocumentText).count() == 1
+    assert {h["airport_code"] for h in search_documents(db, "treinamento")} == {"SBKP", "SBGR"}
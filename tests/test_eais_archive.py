@@ -0,0 +1,54 @@
+"""
+Testes do arquivo de páginas do eAIS e do reprocessamento offline (eais_archive).
+"""
+import pytest
+
+from app.models import Airport, AirportSize, AirportType, EAISArchiveBlob, EAISArchiveFetch
+from app.services.eais_archive import archive_page, load_page, reparse_archive
+from app.services.eais_cache import EAISCache
+from tests.test_eais_cache import FakeFetcher
+from tests.test_eais_fetch import HTML_SBGR
+
+
+def test_identical_pages_stored_once(session_factory):
+    """Mesma página consultada duas vezes: um blob, duas consultas registradas."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher)
+    cache.get("SBGR")
+    cache.get("SBGR", force_refresh=True)
+
+    db = session_factory()
+    assert db.query(EAISArchiveBlob).count() == 1
+    assert db.query(EAISArchiveFetch).filter(EAISArchiveFetch.code == "SBGR").count() == 2
+    sha = archive_page(db, "SBGR", HTML_SBGR)
+    assert load_page(db, sha) == HTML_SBGR
+    db.close()
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_reparse_reports_and_applies_diffs(session_factory, workers):
+    """Reprocessamento compara com o cadastro e, com apply, grava as diferenças."""
+    db = session_factory()
+    db.add(Airport(
+        name="Guarulhos", code="SBGR", size=AirportSize.INTERNATIONAL,
+        airport_type=AirportType.COMMERCIAL, fire_category=9, reference_code="4E",
+    ))
+    db.commit()
+    archive_page(db, "SBGR", HTML_SBGR)
+    archive_page(db, "SBXX", HTML_SBGR.replace("SBGR", "SBXX"))
+    db.close()
+
+    report = reparse_archive(session_factory, workers=workers)
+    assert report["pages"] == 2
+    assert report["compared"] == 1
+    assert report["not_registered"] == ["SBXX"]
+    assert report["changes"]["SBGR"]["fire_category"] == [9, 10]
+    assert "reference_code" not in report["changes"]["SBGR"]
+
+    assert report["compliance"] is None
+    applied = reparse_archive(session_factory, codes=["sbgr"], workers=workers, apply=True)
+    assert applied["compliance"] == {"airports": 0, "created": 0, "retired": 0, "restored": 0, "action_items_regenerated": 0}
+    db = session_factory()
+    assert db.query(Airport.fire_category).filter(Airport.code == "SBGR").scalar() == 10
+    db.close()
+    assert reparse_archive(session_factory, workers=workers)["changes"] == {}
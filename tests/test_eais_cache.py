@@ -0,0 +1,85 @@
+"""
+Testes do cache de consultas ao eAIS (eais_cache).
+Usa SQLite em memória e um fetcher falso no lugar do AISWEB.
+"""
+import requests
+
+from app.services.eais_cache import EAISCache
+from tests.test_eais_fetch import HTML_SBGR, HTML_INVALID
+
+
+class FakeFetcher:
+    """Simula o AISWEB contando as requisições."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, icao):
+        self.calls.append(icao)
+        if self.fail:
+            raise requests.ConnectionError("AISWEB fora do ar")
+        return self.pages.get(icao, HTML_INVALID)
+
+
+def test_repeat_lookup_served_from_memory(session_factory):
+    """Segunda consulta do mesmo ICAO não vai ao AISWEB."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher)
+
+    first = cache.get("SBGR")
+    second = cache.get("sbgr")
+    assert first["fire_category"] == 10
+    assert second == first
+    assert fetcher.calls == ["SBGR"]
+    assert cache.stats["hits"] == 1
+
+
+def test_persisted_entry_survives_restart(session_factory):
+    """Nova instância (novo processo) lê o resultado da tabela eais_cache."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    EAISCache(session_factory=session_factory, fetcher=fetcher).get("SBGR")
+
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher)
+    assert cache.get("SBGR")["reference_code"] == "4E"
+    assert "SBGR" in cache.get_raw_html("SBGR")
+    assert fetcher.calls == ["SBGR"]
+
+
+def test_negative_caching(session_factory):
+    """Código inexistente é cacheado e não gera nova consulta dentro do TTL negativo."""
+    fetcher = FakeFetcher({})
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher)
+
+    assert cache.get("XXXX") is None
+    assert cache.get("XXXX") is None
+    assert fetcher.calls == ["XXXX"]
+    assert cache.stats["negative_hits"] == 1
+
+
+def test_stale_while_revalidate(session_factory):
+    """Entrada vencida é servida na hora e revalidada em background."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    spawned = []
+    cache = EAISCache(
+        session_factory=session_factory, fetcher=fetcher, ttl=0, stale=3600, spawn=spawned.append
+    )
+    cache.get("SBGR")
+
+    stale = cache.get("SBGR")
+    assert stale["name"]
+    assert len(spawned) == 1 and fetcher.calls == ["SBGR"]
+    spawned[0]()
+    assert fetcher.calls == ["SBGR", "SBGR"]
+
+
+def test_stale_if_error(session_factory):
+    """Com o AISWEB fora do ar, a última versão conhecida é servida."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher, ttl=0, stale=0)
+    cache.get("SBGR")
+
+    fetcher.fail = True
+    assert cache.get("SBGR")["code"] == "SBGR"
+    assert cache.stats["upstream_errors"] == 1
@@ -0,0 +1,96 @@
+"""
+Testes do enriquecimento em lote com eAIS (eais_enrich).
+SQLite em memória, fetcher falso e token bucket com relógio simulado.
+"""
+import pytest
+
+from app.models import Airport, AirportSize, AirportType, ComplianceRecord, Regulation, SafetyCategory
+from app.services.eais_cache import EAISCache
+from app.services.eais_enrich import EnrichJob, RateLimitedFetcher, TokenBucket, get_job
+from tests.test_eais_cache import FakeFetcher
+from tests.test_eais_fetch import HTML_SBGR
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    db = session_factory()
+    for code, fire in (("SBGR", None), ("SBXX", 3)):
+        db.add(Airport(
+            name=code, code=code, size=AirportSize.LARGE,
+            airport_type=AirportType.COMMERCIAL, fire_category=fire,
+        ))
+    for code, min_runways in (("GERAL", None), ("DUAS-PISTAS", 2)):
+        db.add(Regulation(
+            code=code, title=code, requirements="Requisito",
+            safety_category=SafetyCategory.OPERATIONAL_SAFETY, min_runways=min_runways,
+        ))
+    db.flush()
+    # SBGR acompanhado (tem registros), com uma pista: DUAS-PISTAS ainda não se aplica
+    db.add(ComplianceRecord(airport_id=1, regulation_id=1))
+    db.commit()
+    db.close()
+    return session_factory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_burst_then_rate():
+    """Consome a rajada sem esperar e depois respeita a taxa sustentada."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_enrich_job_updates_changed_fields(session_factory):
+    """Campos do eAIS diferentes do cadastro são gravados; código inexistente é reportado."""
+    fetcher = FakeFetcher({"SBGR": HTML_SBGR})
+    cache = EAISCache(session_factory=session_factory, fetcher=fetcher)
+    clock = FakeClock()
+    limited = RateLimitedFetcher(fetcher, TokenBucket(100, 10, clock=clock, sleep=clock.sleep), 2)
+    job = EnrichJob(
+        ["sbgr", "SBXX", "SBZZ", "12"], session_factory=session_factory, cache=cache, fetcher=limited
+    )
+    job.run()
+
+    assert job.status == "done"
+    assert job.invalid == ["12"]
+    assert job.not_registered == ["SBZZ"]
+    assert job.not_found == ["SBXX"]
+    assert "fire_category" in job.updated["SBGR"]
+    db = session_factory()
+    sbgr = db.query(Airport).filter(Airport.code == "SBGR").one()
+    assert sbgr.fire_category == 10
+    assert sbgr.reference_code == "4E"
+    assert sbgr.cidade == "São Paulo"
+    assert db.query(Airport.fire_category).filter(Airport.code == "SBXX").scalar() == 3
+    # Pistas 1 -> 2: conformidade recalculada, registro da norma DUAS-PISTAS criado
+    assert sbgr.number_of_runways == 2
+    assert job.compliance["created"] == 1
+    assert db.query(ComplianceRecord).filter(ComplianceRecord.airport_id == sbgr.id).count() == 2
+    # Estado gravado no banco: consultável por outro worker
+    state = get_job(db, job.id)
+    assert state["status"] == "done" and state["processed"] == 2 and state["not_found"] == ["SBXX"]
+    assert get_job(db, "inexistente") is None
+    db.close()
+
+    # Segunda execução: dados vêm do cache e nada muda
+    again = EnrichJob(["SBGR"], session_factory=session_factory, cache=cache, fetcher=limited)
+    again.run()
+    assert again.unchanged == ["SBGR"]
+    assert sorted(fetcher.calls) == ["SBGR", "SBXX"]
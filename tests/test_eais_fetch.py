@@ -177,6 +177,60 @@ def test_infer_usage_avsec():
     assert _infer_usage_avsec_from_cat(1) == ("I", "AP-1")
 
 
+HTML_FALLBACKS = """
+<html><body><h1>Aeroporto Regional (SBXX)</h1>
+<p>Campo Grande - MS</p><p>20°28'09"S 054°40'21"W</p>
+<p>rffs - cat civil - 6</p><p>Operação de ACFT 3C ou inferior</p>
+<p>Salvamento: remoção de aeronaves até 45 toneladas</p><p>HANGARES disponíveis</p>
+</body></html>
+"""
+
+
+def test_parse_fallback_formats():
+    """Formatos alternativos: cidade com hífen, graus, palavras-chave em minúsculas/maiúsculas."""
+    from app.services.eais_fetch import parse_eais_html
+
+    result = parse_eais_html(HTML_FALLBACKS, "SBXX")
+    assert result["name"] == "Aeroporto Regional"
+    assert result["city"] == "Campo Grande"
+    assert result["state"] == "MS"
+    assert abs(result["latitude"] - (-20.4692)) < 0.001
+    assert abs(result["longitude"] - (-54.6725)) < 0.001
+    assert result["fire_category"] == 6
+    assert result["reference_code"] == "3C"
+    assert result["max_aircraft_weight"] == 45
+    assert result["has_maintenance_facility"] is True
+
+
+def test_parse_large_page_same_result():
+    """Página grande (conteúdo do AD cercado de tabelas/NOTAMs) extrai os mesmos campos."""
+    from app.services.eais_fetch import parse_eais_html
+
+    filler = '<tr><td class="label">Combustível</td><td class="value">JET A-1</td></tr>\n' * 2000
+    head, sep, tail = HTML_SBGR.partition("</h1>")
+    large = head + sep + "<table>" + filler + "</table>" + tail.replace("</body>", filler + "</body>")
+    assert parse_eais_html(large, "SBGR") == parse_eais_html(HTML_SBGR, "SBGR")
+
+
+def test_parse_long_whitespace_same_result():
+    """HTML indentado: muitos espaços entre palavra-chave e valor não mudam o resultado."""
+    from app.services.eais_fetch import parse_eais_html
+
+    def page(ws):
+        return f"""<html><body><h1>Aeroporto Regional (SBXX)</h1>
+<p>Campo Grande{ws}- MS</p><p>20{ws}28 09S/054 40 21W</p>
+<p>CAT CIVIL - 6</p><p>Operação de ACFT 3C{ws}ou inferior</p>
+<p>PRAI: peso máx: 300{ws}Kg</p>
+</body></html>"""
+
+    result = parse_eais_html(page(" " * 80), "SBXX")
+    assert result == parse_eais_html(page(" "), "SBXX")
+    assert result["city"] == "Campo Grande"
+    assert abs(result["latitude"] - (-20.4692)) < 0.001
+    assert result["reference_code"] == "3C"
+    assert result["max_aircraft_weight"] == 300
+
+
 @pytest.mark.skip(reason="Requer acesso ao eAIS; use EAIS_INTEGRATION=1 para rodar")
 def test_fetch_sbgr_integration():
     """Teste de integração com eAIS real (opcional)."""
@@ -0,0 +1,68 @@
+"""
+Testes do pacote de evidências em ZIP (app/services/evidence_bundle.py).
+"""
+import io
+import json
+import zipfile
+
+import pytest
+
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, ComplianceStatus, DocumentAttachment, Regulation,
+    SafetyCategory,
+)
+from app.services.evidence_bundle import MANIFEST_NAME, collect_evidence, stream_zip
+
+
+@pytest.fixture
+def db(db, tmp_path):
+    airport = Airport(name="Viracopos", code="SBKP", size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+    db.add(airport)
+    for code in ("RBAC-153-15", "RBAC-154-02", "RBAC-153-99"):
+        db.add(Regulation(code=code, title=code, requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY))
+    db.flush()
+    records = [
+        ComplianceRecord(airport_id=airport.id, regulation_id=i, status=status)
+        for i, status in ((1, ComplianceStatus.COMPLIANT), (2, ComplianceStatus.PARTIAL), (3, ComplianceStatus.PENDING_REVIEW))
+    ]
+    db.add_all(records)
+    db.flush()
+    big = tmp_path / "big.pdf"
+    big.write_bytes(bytes(range(256)) * 4096)  # 1 MB
+    small = tmp_path / "foto.jpg"
+    small.write_bytes(b"jpeg")
+    db.add_all([
+        DocumentAttachment(compliance_record_id=records[0].id, filename="certificado.pdf", file_path=str(big), file_size=big.stat().st_size),
+        DocumentAttachment(compliance_record_id=records[0].id, filename="certificado.pdf", file_path=str(small), file_size=4),
+        DocumentAttachment(compliance_record_id=records[1].id, filename="foto.jpg", file_path=str(tmp_path / "sumiu.jpg"), file_size=9),
+    ])
+    db.commit()
+    return db
+
+
+def test_zip_grouped_by_regulation_with_manifest(db, tmp_path):
+    manifest = collect_evidence(db, db.query(Airport).one())
+    chunks = list(stream_zip(manifest, chunk_size=16 * 1024))
+    zf = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert zf.testzip() is None
+    assert sorted(zf.namelist()) == sorted([
+        "RBAC-153-15/certificado.pdf", "RBAC-153-15/certificado (2).pdf", MANIFEST_NAME,
+    ])
+    assert zf.read("RBAC-153-15/certificado.pdf") == (tmp_path / "big.pdf").read_bytes()
+
+    data = json.loads(zf.read(MANIFEST_NAME))
+    statuses = {r["code"]: r["status"] for r in data["regulations"]}
+    assert statuses == {"RBAC-153-15": "compliant", "RBAC-153-99": "pending_review", "RBAC-154-02": "partial"}
+    [missing] = next(r for r in data["regulations"] if r["code"] == "RBAC-154-02")["documents"]
+    assert missing["filename"] == "foto.jpg" and missing["missing"] is True
+    assert "_source" not in json.dumps(data)
+
+
+def test_stream_is_incremental(db):
+    manifest = collect_evidence(db, db.query(Airport).one())
+    stream = stream_zip(manifest, chunk_size=16 * 1024)
+    first = next(stream)
+    assert first.startswith(b"PK\x03\x04")
+    sizes = [len(first)] + [len(c) for c in stream]
+    # Nenhum pedaço carrega o arquivo de 1 MB inteiro
+    assert max(sizes) < 64 * 1024
@@ -0,0 +1,102 @@
+"""
+Testes dos validadores HTTP no download de anexos (app/services/file_serving.py).
+"""
+import asyncio
+import hashlib
+
+import pytest
+from starlette.requests import Request
+
+from app.services.file_serving import IMMUTABLE_CACHE, REVALIDATE_CACHE, parse_range, serve_file
+
+DATA = bytes(range(256)) * 1024
+SHA = hashlib.sha256(DATA).hexdigest()
+
+
+def _request(**headers):
+    raw = [(k.replace("_", "-").lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw, "query_string": b""})
+
+
+def _run(response):
+    messages = []
+
+    async def receive():
+        # Cliente conectado até o fim da resposta (StreamingResponse escuta o disconnect)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response({"type": "http", "method": "GET", "headers": []}, receive, send))
+    start = messages[0]
+    headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], headers, body
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "relatorio.pdf"
+    path.write_bytes(DATA)
+    return str(path)
+
+
+def _serve(path, sha=SHA, immutable=True, **headers):
+    return _run(serve_file(
+        _request(**headers), path, media_type="application/pdf", filename="relatório.pdf",
+        sha256=sha, immutable=immutable,
+    ))
+
+
+def test_full_download_has_validators(pdf):
+    status, headers, body = _serve(pdf)
+    assert status == 200 and body == DATA
+    assert headers["etag"] == f'"{SHA}"'
+    assert headers["cache-control"] == IMMUTABLE_CACHE
+    assert headers["accept-ranges"] == "bytes"
+    assert "last-modified" in headers and "filename*=utf-8''relat%C3%B3rio.pdf" in headers["content-disposition"]
+
+
+def test_if_none_match_returns_304(pdf):
+    status, headers, body = _serve(pdf, if_none_match=f'"outro", W/"{SHA}"')
+    assert status == 304 and body == b""
+    _, headers, _ = _serve(pdf)
+    status, _, _ = _serve(pdf, if_modified_since=headers["last-modified"])
+    assert status == 304
+
+
+def test_range_returns_partial_content(pdf):
+    status, headers, body = _serve(pdf, range="bytes=1000-1999")
+    assert status == 206 and body == DATA[1000:2000]
+    assert headers["content-range"] == f"bytes 1000-1999/{len(DATA)}"
+    assert headers["content-length"] == "1000"
+    status, _, body = _serve(pdf, range="bytes=-10")
+    assert status == 206 and body == DATA[-10:]
+    status, headers, _ = _serve(pdf, range=f"bytes={len(DATA)}-")
+    assert status == 416 and headers["content-range"] == f"bytes */{len(DATA)}"
+
+
+def test_if_range_mismatch_sends_whole_file(pdf):
+    status, _, body = _serve(pdf, range="bytes=0-9", if_range='"versao-antiga"')
+    assert status == 200 and body == DATA
+    status, _, body = _serve(pdf, range="bytes=0-9", if_range=f'"{SHA}"')
+    assert status == 206 and body == DATA[:10]
+
+
+def test_legacy_file_gets_weak_etag_and_revalidation(pdf):
+    status, headers, _ = _serve(pdf, sha=None, immutable=False)
+    assert headers["etag"].startswith('W/"') and headers["cache-control"] == REVALIDATE_CACHE
+    # ETag fraco não serve para If-Range
+    status, _, _ = _serve(pdf, sha=None, immutable=False, range="bytes=0-9", if_range=headers["etag"])
+    assert status == 200
+
+
+def test_parse_range_edge_cases():
+    assert parse_range("bytes=0-0", 10) == (0, 0)
+    assert parse_range("bytes=5-100", 10) == (5, 9)
+    assert parse_range("bytes=0-1,4-5", 10) is None
+    assert parse_range("items=0-1", 10) is None
+    assert parse_range("bytes=5-2", 10) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=-0", 10)
@@ -0,0 +1,61 @@
+"""
+Testes da eleição de líder (app/services/leader.py) com o lock de arquivo (SQLite).
+Dois workers são simulados por duas aberturas do mesmo arquivo de lock (flock é por
+descrição de arquivo aberto, então conflita também dentro do mesmo processo).
+"""
+import multiprocessing
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.models import Base
+from app.services import leader
+from app.services.leader import WORKER_ID, lease, leases
+
+pytestmark = pytest.mark.skipif(leader.fcntl is None, reason="flock indisponível")
+
+
+def test_second_worker_does_not_get_the_lease(engine, tmp_path):
+    with lease("anac_populate", engine=engine, lock_dir=tmp_path) as first:
+        assert first is True
+        with lease("anac_populate", engine=engine, lock_dir=tmp_path) as second:
+            assert second is False
+        [row] = leases(engine, lock_dir=tmp_path)
+        assert row["holder"] == WORKER_ID and row["active"] is True and row["held_by_this_worker"] is True
+    [row] = leases(engine, lock_dir=tmp_path)
+    assert row["active"] is False and row["released_at"] is not None
+    with lease("anac_populate", engine=engine, lock_dir=tmp_path) as again:
+        assert again is True
+
+
+def _hold(lock_dir, path, started):
+    engine = create_engine(f"sqlite:///{path}")
+    with lease("startup", blocking=True, engine=engine, lock_dir=lock_dir):
+        started.set()
+        time.sleep(0.5)
+
+
+def test_blocking_lease_waits_for_other_process(tmp_path):
+    db_path = tmp_path / "leases.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    started = multiprocessing.Event()
+    proc = multiprocessing.Process(target=_hold, args=(tmp_path, db_path, started))
+    proc.start()
+    try:
+        assert started.wait(10)
+        with lease("startup", engine=engine, lock_dir=tmp_path) as leader_now:
+            assert leader_now is False
+        t0 = time.monotonic()
+        with lease("startup", blocking=True, engine=engine, lock_dir=tmp_path) as leader_now:
+            assert leader_now is True
+            assert time.monotonic() - t0 > 0.1
+    finally:
+        proc.join(10)
+
+
+def test_advisory_key_is_stable_signed_bigint():
+    key = leader.advisory_key("startup")
+    assert key == leader.advisory_key("startup") != leader.advisory_key("anac_populate")
+    assert -(2 ** 63) <= key < 2 ** 63
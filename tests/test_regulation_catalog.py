@@ -0,0 +1,114 @@
+"""
+Testes do versionamento do catálogo de normas (regulation_catalog.apply_catalog): escrita só
+das normas alteradas e recálculo só dos registros das normas afetadas.
+"""
+import json
+
+import pytest
+from sqlalchemy import event
+
+from app.compliance_engine import ComplianceEngine
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, ComplianceStatus, Regulation, SafetyCategory,
+)
+from app.services.regulation_catalog import apply_catalog, regulation_hash
+
+
+def _entry(code, sizes=None, requirements="Requisito"):
+    return {
+        "code": code, "title": code, "requirements": requirements,
+        "safety_category": SafetyCategory.OPERATIONAL_SAFETY,
+        "applies_to_sizes": json.dumps(sizes) if sizes else None,
+    }
+
+
+def _catalog(grande_sizes=("large", "international")):
+    return [_entry("GERAL"), _entry("GRANDE", sizes=list(grande_sizes)), _entry("MEDIO", sizes=["medium"])]
+
+
+@pytest.fixture
+def db(db):
+    apply_catalog(db, _catalog())
+    db.add_all([
+        Airport(name="Viracopos", code="SBKP", size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL, usage_class="III"),
+        Airport(name="Uberlândia", code="SBUL", size=AirportSize.MEDIUM, airport_type=AirportType.COMMERCIAL, usage_class="II"),
+    ])
+    db.commit()
+    compliance = ComplianceEngine(db)
+    for airport in db.query(Airport):
+        compliance.check_compliance(airport.id)
+    return db
+
+
+def _writes(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        if not statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def _statuses(db, code):
+    airport = db.query(Airport).filter(Airport.code == code).one()
+    return {
+        db.get(Regulation, r.regulation_id).code: r.status
+        for r in db.query(ComplianceRecord).filter(ComplianceRecord.airport_id == airport.id)
+    }
+
+
+def test_hash_ignores_key_order():
+    entry = _entry("GERAL")
+    assert regulation_hash(entry) == regulation_hash(dict(reversed(list(entry.items()))))
+    assert regulation_hash(entry) != regulation_hash({**entry, "requirements": "Outro"})
+
+
+def test_unchanged_catalog_writes_nothing(db, engine):
+    writes = _writes(engine)
+    summary = apply_catalog(db, _catalog())
+    assert summary["unchanged"] == 3 and summary["added"] == 0 and summary["updated"] == 0
+    assert summary["compliance"] is None
+    assert writes == []
+
+
+def test_applicability_change_reconciles_only_that_regulation(db, engine):
+    geral = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "GERAL").first()
+    geral.status = ComplianceStatus.COMPLIANT
+    db.commit()
+    assert _statuses(db, "SBUL") == {"GERAL": ComplianceStatus.PENDING_REVIEW, "MEDIO": ComplianceStatus.PENDING_REVIEW}
+
+    # GRANDE passa a valer também para médios: SBUL ganha o registro, o resto fica como está
+    writes = _writes(engine)
+    summary = apply_catalog(db, _catalog(grande_sizes=("medium", "large", "international")))
+    assert summary["updated"] == 1 and summary["unchanged"] == 2
+    assert summary["compliance"]["created"] == 1
+    assert summary["compliance"]["action_items_regenerated"] == 0
+    assert _statuses(db, "SBUL")["GRANDE"] == ComplianceStatus.PENDING_REVIEW
+    assert db.get(ComplianceRecord, geral.id).status == ComplianceStatus.COMPLIANT
+    updates = [s for s in writes if s.lstrip().upper().startswith("UPDATE REGULATIONS")]
+    assert len(updates) == 1
+
+
+def test_new_regulation_gets_records_without_full_refresh(db):
+    summary = apply_catalog(db, _catalog() + [_entry("NOVA")])
+    assert summary["added"] == 1
+    assert summary["compliance"]["created"] == 2
+    assert "NOVA" in _statuses(db, "SBKP") and "NOVA" in _statuses(db, "SBUL")
+
+
+def test_template_change_regenerates_action_items(db, monkeypatch):
+    original = ComplianceEngine._generate_action_items
+
+    def new_templates(self, regulation, airport):
+        items = original(self, regulation, airport)
+        return items + ["Novo item"] if regulation.code == "MEDIO" else items
+
+    monkeypatch.setattr(ComplianceEngine, "_generate_action_items", new_templates)
+    summary = apply_catalog(db, _catalog())
+    assert summary["updated"] == 1
+    assert summary["compliance"]["action_items_regenerated"] == 1
+    medio = db.query(ComplianceRecord).join(Regulation).filter(Regulation.code == "MEDIO").one()
+    assert "Novo item" in json.loads(medio.action_items)
+    assert apply_catalog(db, _catalog())["compliance"] is None
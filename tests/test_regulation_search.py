@@ -0,0 +1,89 @@
+"""
+Testes da busca no catálogo de normas (app/services/regulation_search.py).
+"""
+import json
+
+from app.models import (
+    Airport, AirportSize, AirportType, Regulation, RequirementClassification, SafetyCategory,
+)
+from app.seed_data import regulation_catalog
+from app.services.regulation_catalog import apply_catalog
+from app.services.regulation_search import RegulationSearchIndex, highlight, search_regulations, stem
+
+
+def _regulations(db):
+    db.add_all([
+        Regulation(
+            code="RBAC-153-03", title="Agentes Extintores para Combate a Incêndio",
+            requirements="Quantidade mínima de agentes extintores por categoria contraincêndio do aeródromo.",
+            safety_category=SafetyCategory.FIRE_SAFETY, requirement_classification=RequirementClassification.C,
+        ),
+        Regulation(
+            code="RBAC-153-11", title="Plano Contraincêndio de Aeródromo (PCINC)",
+            requirements="O PCINC deve prever inspeções periódicas das viaturas e dos extintores.",
+            safety_category=SafetyCategory.FIRE_SAFETY, requirement_classification=RequirementClassification.D,
+            applies_to_sizes=json.dumps(["large"]),
+        ),
+        Regulation(
+            code="RBAC-154-30", title="Sinalização Horizontal",
+            requirements="Inspeção da pintura de pista e das marcas de eixo.",
+            safety_category=SafetyCategory.OPERATIONAL_SAFETY,
+        ),
+    ])
+    db.commit()
+
+
+def test_stem_reduces_portuguese_plurals():
+    assert stem("INSPECOES") == stem("INSPECAO") == "INSPECAO"
+    assert stem("EXTINTORES") == "EXTINTOR" and stem("VIATURAS") == "VIATURA"
+    assert stem("OPERACIONAIS") == "OPERACIONAL" and stem("153") == "153"
+
+
+def test_ranked_accent_folded_search(db):
+    _regulations(db)
+    index = RegulationSearchIndex()
+    index.refresh(db)
+    # "extintores" casa com o título da 153-03 (peso maior) e com os requisitos da 153-11
+    assert [r["code"] for r in index.search("extintores")] == ["RBAC-153-03", "RBAC-153-11"]
+    # Sem acento, plural e prefixo do último termo
+    assert [r["code"] for r in index.search("inspecao vi")] == ["RBAC-153-11"]
+    assert {r["code"] for r in index.search("inspeções")} == {"RBAC-153-11", "RBAC-154-30"}
+    # Palavra incompleta: os resultados não somem no meio da digitação
+    for partial in ("extint", "extintor", "extintore", "extintores"):
+        assert [r["code"] for r in index.search(partial)] == ["RBAC-153-03", "RBAC-153-11"], partial
+    for partial in ("inspeç", "inspeçõ", "inspeçõe"):
+        assert {r["code"] for r in index.search(partial)} == {"RBAC-153-11", "RBAC-154-30"}, partial
+    # Código exato no topo
+    assert index.search("rbac 154 30")[0]["code"] == "RBAC-154-30"
+    assert index.search("pcinc")[0]["highlights"]["title"] == "Plano Contraincêndio de Aeródromo («PCINC»)"
+    assert index.search("sescinc") == [] and index.search("   ") == []
+
+
+def test_filters(db):
+    _regulations(db)
+    db.add(Airport(name="Pequeno", code="SDAA", size=AirportSize.SMALL, airport_type=AirportType.COMMERCIAL))
+    db.commit()
+    airport = db.query(Airport).one()
+    assert [r["code"] for r in search_regulations(db, "extintores", airport=airport)] == ["RBAC-153-03"]
+    assert [r["code"] for r in search_regulations(db, "extintores", classification="D")] == ["RBAC-153-11"]
+    assert [r["code"] for r in search_regulations(db, "inspecao", safety_category="operational_safety")] == ["RBAC-154-30"]
+
+
+def test_index_follows_catalog_changes(db):
+    index = RegulationSearchIndex(refresh_seconds=0)
+    apply_catalog(db, regulation_catalog())
+    index.ensure_fresh(db)
+    assert len(index) == len(regulation_catalog())
+    assert index.search("PCINC")[0]["code"] == "RBAC-153-11"
+    db.add(Regulation(code="RBAC-153-99", title="Norma local de teste", requirements="Teste",
+                      safety_category=SafetyCategory.OPERATIONAL_SAFETY))
+    db.commit()
+    index.ensure_fresh(db)
+    assert index.search("norma local")[0]["code"] == "RBAC-153-99"
+
+
+def test_highlight_window():
+    text = " ".join(f"palavra{i}" for i in range(100)) + " extintores de incêndio"
+    snippet = highlight(text, {"EXTINTOR"}, max_words=10)
+    assert snippet.startswith("…") and "«extintores»" in snippet
+    assert highlight("sem termos", {"EXTINTOR"}) is None
@@ -0,0 +1,17 @@
+"""
+Testes da tabela de rotas do app (sem subir o servidor).
+"""
+from app.main import app
+
+
+def _get_paths():
+    return [r.path for r in app.routes if "GET" in getattr(r, "methods", set())]
+
+
+def test_literal_airport_routes_before_id_route():
+    """/api/airports/<literal> precisa vir antes de /api/airports/{airport_id}, senão vira 422."""
+    paths = _get_paths()
+    by_id = paths.index("/api/airports/{airport_id}")
+    literals = [p for p in paths if p.startswith("/api/airports/") and p.count("/") == 3 and "{" not in p]
+    assert literals
+    assert all(paths.index(p) < by_id for p in literals)
@@ -0,0 +1,62 @@
+"""
+Testes das etapas de startup controladas por hash (app/services/startup.py).
+"""
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.services.startup import StartupState, read_meta, schema_fingerprint
+
+
+def test_unchanged_steps_are_skipped(engine):
+    calls = []
+    first = StartupState()
+    first.load_meta(engine)
+    assert first.run_step(engine, "seed", "v1", lambda: calls.append("seed")) is True
+    assert read_meta(engine) == {"seed": "v1"}
+
+    second = StartupState()
+    second.load_meta(engine)
+    assert second.run_step(engine, "seed", "v1", lambda: calls.append("seed")) is False
+    assert second.steps["seed"]["status"] == "skipped"
+    assert second.run_step(engine, "seed", "v2", lambda: calls.append("seed")) is True
+    assert calls == ["seed", "seed"]
+    assert read_meta(engine) == {"seed": "v2"}
+
+
+def test_failed_step_runs_again_next_boot(engine):
+    def boom():
+        raise RuntimeError("sem conexão")
+
+    state = StartupState()
+    state.load_meta(engine)
+    state.run_step(engine, "seed", "v1", boom)
+    assert state.steps["seed"]["status"] == "error"
+    assert read_meta(engine) == {}
+
+
+def test_meta_missing_table_runs_everything():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    assert read_meta(engine) == {}
+
+
+def test_schema_fingerprint_tracks_columns():
+    from sqlalchemy import Column, Integer, MetaData, String, Table
+
+    def metadata(*extra):
+        md = MetaData()
+        Table("t", md, Column("id", Integer, primary_key=True), *extra)
+        return md
+
+    assert schema_fingerprint(metadata()) == schema_fingerprint(metadata())
+    assert schema_fingerprint(metadata()) != schema_fingerprint(metadata(Column("nome", String(10))))
+    assert schema_fingerprint(metadata(), [("a", "INTEGER")]) != schema_fingerprint(metadata(), [("b", "INTEGER")])
+
+
+def test_readiness_gate():
+    state = StartupState()
+    assert asyncio.run(state.wait(timeout=0.01)) is False
+    state.mark_ready()
+    assert asyncio.run(state.wait(timeout=0.01)) is True
+    assert state.snapshot()["ready"] is True
@@ -0,0 +1,86 @@
+"""
+Testes do armazenamento de anexos (app/services/storage.py).
+
+O backend S3 roda contra um MinIO local quando S3_TEST_ENDPOINT_URL está definido
+(ex.: docker run -p 9000:9000 minio/minio server /data; credenciais em AWS_ACCESS_KEY_ID /
+AWS_SECRET_ACCESS_KEY); sem ele, ou sem boto3, esses testes são pulados.
+"""
+import os
+import urllib.request
+import uuid
+
+import pytest
+
+from app.services import storage as storage_module
+from app.services.storage import LocalStorage, S3Storage, as_storage, get_storage
+from app.services.uploads import StagedUpload
+
+
+def _staged(tmp_path, data):
+    path = tmp_path / f"{uuid.uuid4().hex}.part"
+    path.write_bytes(data)
+    return StagedUpload(path, len(data), "x")
+
+
+def test_local_storage_roundtrip(tmp_path):
+    store = LocalStorage(tmp_path / "uploads")
+    staged = _staged(tmp_path, b"certificado")
+    file_path = store.put(staged, "blobs/ab/cd/abcd")
+    assert file_path == str(tmp_path / "uploads" / "blobs/ab/cd/abcd")
+    assert str(staged.path) == file_path and store.exists(file_path)
+    with store.open(file_path) as f:
+        assert f.read() == b"certificado"
+    assert store.local_path(file_path) == file_path
+    assert store.presigned_url(file_path, "cert.pdf") is None
+    store.delete(file_path)
+    assert not store.exists(file_path) and store.local_path(file_path) is None
+    store.delete(file_path)  # Idempotente
+
+
+def test_default_backend_is_local(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_module, "STORAGE_BACKEND", "local")
+    assert isinstance(get_storage(tmp_path), LocalStorage)
+    store = LocalStorage(tmp_path)
+    assert as_storage(store) is store and as_storage(tmp_path).root == tmp_path
+
+
+@pytest.fixture
+def s3(tmp_path):
+    boto3 = pytest.importorskip("boto3")
+    endpoint = os.getenv("S3_TEST_ENDPOINT_URL")
+    if not endpoint:
+        pytest.skip("S3_TEST_ENDPOINT_URL não definido (MinIO local)")
+    client = boto3.client("s3", endpoint_url=endpoint, region_name="us-east-1")
+    bucket = f"test-{uuid.uuid4().hex[:12]}"
+    client.create_bucket(Bucket=bucket)
+    yield S3Storage(bucket, tmp_path, prefix="anexos/", client=client, chunk_size=5 * 1024 * 1024)
+    for obj in client.list_objects_v2(Bucket=bucket).get("Contents", []):
+        client.delete_object(Bucket=bucket, Key=obj["Key"])
+    client.delete_bucket(Bucket=bucket)
+
+
+def test_s3_multipart_upload_and_presigned_download(s3, tmp_path):
+    data = os.urandom(11 * 1024 * 1024)  # Acima do bloco: enviado em partes
+    staged = _staged(tmp_path, data)
+    file_path = s3.put(staged, "blobs/ab/cd/abcd")
+    assert file_path == f"s3://{s3.bucket}/anexos/blobs/ab/cd/abcd"
+    assert not staged.path.exists() and s3.exists(file_path)
+    assert s3.local_path(file_path) is None
+    with urllib.request.urlopen(s3.presigned_url(file_path, "relatório.pdf", "application/pdf")) as response:
+        assert response.read() == data
+        assert "relat%C3%B3rio.pdf" in response.headers["Content-Disposition"]
+    body = s3.open(file_path)
+    assert body.read(1024) == data[:1024]
+    body.close()
+    s3.delete(file_path)
+    assert not s3.exists(file_path)
+    with pytest.raises(FileNotFoundError):
+        s3.open(file_path)
+
+
+def test_s3_reads_legacy_local_files(s3, tmp_path):
+    legacy = tmp_path / "record_1" / "antigo.pdf"
+    legacy.parent.mkdir()
+    legacy.write_bytes(b"anexo antigo")
+    assert s3.exists(str(legacy)) and s3.local_path(str(legacy)) == str(legacy)
+    assert s3.presigned_url(str(legacy), "antigo.pdf") is None
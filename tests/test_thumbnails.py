@@ -0,0 +1,80 @@
+"""
+Testes das miniaturas dos anexos (app/services/thumbnails.py). Os que geram imagens
+precisam do Pillow e são pulados sem ele.
+"""
+import asyncio
+import io
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.requests import Request
+
+from app import main
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, DocumentAttachment, Regulation, SafetyCategory,
+)
+from app.services import thumbnails
+from app.services.blob_store import collect_garbage
+
+
+@pytest.fixture
+def db(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOADS_DIR", tmp_path)
+    regulation = Regulation(code="R1", title="R1", requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+    airport = Airport(name="SBKP", code="SBKP", size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+    db.add_all([regulation, airport])
+    db.flush()
+    db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.commit()
+    return db
+
+
+def _upload(db, data, name):
+    return asyncio.run(main.upload_document(
+        1, file=UploadFile(io.BytesIO(data), filename=name), document_type=None,
+        description=None, uploaded_by=None, db=db,
+    ))
+
+
+def _request():
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+
+
+def test_office_documents_have_no_preview(db):
+    doc = _upload(db, b"planilha", "inspecao.xlsx")
+    assert doc.preview_url is None
+    with pytest.raises(HTTPException) as exc:
+        main.preview_document(doc.id, _request(), db=db)
+    assert exc.value.status_code == 404
+
+
+def test_image_thumbnail_is_cached_by_content(db, tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    photo = io.BytesIO()
+    Image.new("RGB", (2000, 1000), (200, 30, 30)).save(photo, "PNG")
+    first = _upload(db, photo.getvalue(), "pista.png")
+    second = _upload(db, photo.getvalue(), "pista-copia.png")  # Mesmo conteúdo
+    assert first.preview_url == f"/api/documents/{first.id}/preview"
+
+    docs = db.query(DocumentAttachment).order_by(DocumentAttachment.id).all()
+    paths = {thumbnails.ensure_thumbnail(tmp_path, tmp_path, d) for d in docs}
+    assert len(paths) == 1
+    thumb = Image.open(paths.pop())
+    assert thumb.format == "JPEG" and max(thumb.size) == thumbnails.THUMBNAIL_SIZE
+
+    response = main.preview_document(second.id, _request(), db=db)
+    assert response.status_code == 200 and response.media_type == "image/jpeg"
+    assert response.headers["content-disposition"].startswith("inline")
+
+
+def test_thumbnail_removed_with_blob(db, tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    photo = io.BytesIO()
+    Image.new("RGB", (64, 64)).save(photo, "JPEG")
+    doc = _upload(db, photo.getvalue(), "foto.jpg")
+    thumb = thumbnails.ensure_thumbnail(tmp_path, tmp_path, db.get(DocumentAttachment, doc.id))
+    main.delete_document(doc.id, db=db)
+    collect_garbage(db, tmp_path, now=datetime.utcnow() + timedelta(days=1))
+    assert not Path(thumb).exists()
@@ -0,0 +1,83 @@
+"""
+Testes do upload de anexos em streaming (app/services/uploads.py e upload_document).
+"""
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app import main
+from app.models import (
+    Airport, AirportSize, AirportType, ComplianceRecord, DocumentAttachment, Regulation, SafetyCategory,
+)
+from app.services.uploads import STAGING_DIRNAME, UploadTooLarge, stage_upload
+
+
+class CountingFile:
+    """UploadFile mínimo que registra quantos bytes foram lidos."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = self._buf.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_stage_hashes_and_commits_atomically(tmp_path):
+    data = b"%PDF-1.4 " + bytes(range(256)) * 1000
+    staged = asyncio.run(stage_upload(CountingFile(data), tmp_path, chunk_size=4096))
+    assert staged.size == len(data)
+    assert staged.sha256 == hashlib.sha256(data).hexdigest()
+    dest = staged.commit(tmp_path / "record_1" / "a.pdf")
+    assert dest.read_bytes() == data
+    assert list((tmp_path / STAGING_DIRNAME).iterdir()) == []
+
+
+def test_limit_enforced_while_streaming(tmp_path):
+    upload = CountingFile(b"x" * 100_000)
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(stage_upload(upload, tmp_path, max_bytes=10_000, chunk_size=1024))
+    assert upload.bytes_read <= 10_000 + 1024
+    assert list((tmp_path / STAGING_DIRNAME).iterdir()) == []
+
+
+@pytest.fixture
+def db(db):
+    airport = Airport(name="Viracopos", code="SBKP", size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+    regulation = Regulation(code="R1", title="R1", requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+    db.add_all([airport, regulation])
+    db.flush()
+    db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.commit()
+    return db
+
+
+def _upload(db, record_id, name, data):
+    return asyncio.run(main.upload_document(
+        record_id, file=UploadFile(io.BytesIO(data), filename=name), document_type=None,
+        description=None, uploaded_by=None, db=db,
+    ))
+
+
+def test_upload_document_streams_to_store(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOADS_DIR", tmp_path)
+    data = b"certificado" * 5000
+    response = _upload(db, 1, "cert.pdf", data)
+    assert response.file_size == len(data)
+    assert response.sha256 == hashlib.sha256(data).hexdigest()
+    doc = db.get(DocumentAttachment, response.id)
+    with open(doc.file_path, "rb") as f:
+        assert f.read() == data
+
+
+def test_upload_document_rejects_before_reading(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOADS_DIR", tmp_path)
+    with pytest.raises(HTTPException) as exc:
+        _upload(db, 1, "script.exe", b"MZ")
+    assert exc.value.status_code == 400
+    assert db.query(DocumentAttachment).count() == 0
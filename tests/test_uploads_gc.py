@@ -0,0 +1,83 @@
+"""
+Testes da coleta de lixo do diretório de uploads (app/services/uploads_gc.py).
+"""
+import hashlib
+import time
+
+import pytest
+
+from app.models import (
+    Airport, AirportSize, AirportType, Blob, ComplianceRecord, DocumentAttachment, Regulation, SafetyCategory,
+)
+from app.services.blob_store import blob_path
+from app.services.uploads import STAGING_DIRNAME
+from app.services.uploads_gc import collect_uploads
+
+LATER = time.time() + 7200
+
+
+@pytest.fixture
+def db(db):
+    regulation = Regulation(code="R1", title="R1", requirements="R", safety_category=SafetyCategory.OPERATIONAL_SAFETY)
+    airport = Airport(name="SBKP", code="SBKP", size=AirportSize.LARGE, airport_type=AirportType.COMMERCIAL)
+    db.add_all([regulation, airport])
+    db.flush()
+    db.add(ComplianceRecord(airport_id=airport.id, regulation_id=regulation.id))
+    db.commit()
+    return db
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _attach(db, path, sha=None):
+    db.add(DocumentAttachment(compliance_record_id=1, filename=path.name, file_path=str(path), file_size=path.stat().st_size, sha256=sha))
+    db.commit()
+
+
+@pytest.fixture
+def tree(db, tmp_path):
+    kept = _write(tmp_path / "record_1" / "kept.pdf", b"k" * 10)
+    _attach(db, kept)
+    _write(tmp_path / "record_7" / "gone.pdf", b"g" * 100)          # registro removido em cascata
+    _write(tmp_path / STAGING_DIRNAME / "abc.part", b"s" * 20)      # upload interrompido
+    data = b"blob referenciado"
+    sha = hashlib.sha256(data).hexdigest()
+    _attach(db, _write(blob_path(tmp_path, sha), data), sha=sha)
+    db.add(Blob(sha256=sha, size=len(data), ref_count=3))          # contagem divergente
+    stray = hashlib.sha256(b"sem linha").hexdigest()
+    _write(blob_path(tmp_path, stray), b"sem linha")                 # falhou antes do commit
+    _write(tmp_path / "LEIAME.txt", b"nao e upload")
+    db.commit()
+    return tmp_path
+
+
+def test_dry_run_reports_without_deleting(db, tree):
+    report = collect_uploads(db, tree, dry_run=True, now=LATER, batch_size=2)
+    assert report["scanned"] == 6
+    assert report["orphans"] == 3
+    assert report["orphan_bytes"] == 100 + 20 + len(b"sem linha")
+    assert report["by_kind"] == {"record": 1, "blob": 1, "staging": 1}
+    assert report["ref_counts_fixed"] == 1 and report["deleted"] == 0
+    assert (tree / "record_7" / "gone.pdf").exists()
+    assert db.query(Blob).one().ref_count == 3
+
+
+def test_delete_mode_reclaims_orphans_only(db, tree):
+    report = collect_uploads(db, tree, dry_run=False, now=LATER, batch_size=2)
+    assert report["deleted"] == 3
+    assert report["reclaimed_bytes"] == 100 + 20 + len(b"sem linha")
+    assert not (tree / "record_7").exists()
+    assert (tree / "record_1" / "kept.pdf").exists()
+    assert (tree / "LEIAME.txt").exists()
+    assert db.query(Blob).one().ref_count == 1
+    assert collect_uploads(db, tree, dry_run=False, now=LATER)["orphans"] == 0
+
+
+def test_recent_files_are_left_alone(db, tree):
+    report = collect_uploads(db, tree, dry_run=False)
+    assert report["scanned"] == 0 and report["deleted"] == 0
+    assert (tree / "record_7" / "gone.pdf").exists()
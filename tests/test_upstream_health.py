@@ -0,0 +1,88 @@
+"""
+Testes do circuit breaker e das tentativas escalonadas (upstream_health).
+"""
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.services import upstream_health
+from app.services.upstream_health import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, UpstreamUnavailable, guarded_get, hedged,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    upstream_health._breakers.clear()
+    yield
+    upstream_health._breakers.clear()
+
+
+def test_breaker_opens_then_half_open_probe():
+    """Abre após N falhas, libera uma requisição de teste após o reset e fecha com sucesso."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("anac", failure_threshold=2, reset_timeout=30, clock=clock)
+    breaker.before_request()
+    breaker.record_failure("Timeout")
+    assert breaker.state == CLOSED
+    breaker.record_failure("Timeout")
+    assert breaker.state == OPEN
+    with pytest.raises(UpstreamUnavailable):
+        breaker.before_request()
+
+    clock.now = 31
+    breaker.before_request()  # requisição de teste
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(UpstreamUnavailable):
+        breaker.before_request()  # só uma por vez
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_guarded_get_fails_fast_when_open():
+    """Com o circuito aberto, requests.get nem é chamado."""
+    with patch("app.services.upstream_health.requests.get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        for _ in range(upstream_health.UPSTREAM_FAILURE_THRESHOLD):
+            with pytest.raises(requests.ConnectionError):
+                guarded_get("https://aisweb.decea.mil.br/?codigo=SBGR")
+        calls = mock_get.call_count
+        with pytest.raises(UpstreamUnavailable):
+            guarded_get("https://aisweb.decea.mil.br/?codigo=SBSP")
+        assert mock_get.call_count == calls
+        # Outro host não é afetado
+        mock_get.side_effect = None
+        mock_get.return_value = MagicMock(status_code=200)
+        guarded_get("https://sistemas.anac.gov.br/x.csv")
+    snapshot = upstream_health.health_snapshot()
+    assert snapshot["aisweb.decea.mil.br"]["state"] == OPEN
+    assert snapshot["sistemas.anac.gov.br"]["state"] == CLOSED
+
+
+def test_hedged_uses_next_alternative():
+    """Alternativa lenta não segura a resposta: a seguinte é disparada e vence."""
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return ["lenta"]
+
+    def failing():
+        raise requests.ConnectionError("down")
+
+    try:
+        assert hedged([slow, failing, lambda: ["ok"]], delay=0.01) == ["ok"]
+        assert hedged([failing, lambda: None]) is None
+    finally:
+        release.set()